@@ -13,7 +13,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from src.utils import format_timestamp, sanitize_filename, sanitize_folder_name, setup_logging
+from src.utils import (
+    format_timestamp,
+    loads_json_bytes,
+    sanitize_filename,
+    sanitize_folder_name,
+    setup_logging,
+)
 
 logger = setup_logging()
 
@@ -584,8 +590,8 @@ class BrowserResponseProcessor:
 
             logger.info(f"Processing {sanitize_filename(response_file.name)}...")
             try:
-                with open(response_file, "r", encoding="utf-8") as f:
-                    response_data = json.load(f)
+                with open(response_file, "rb") as f:
+                    response_data = loads_json_bytes(f.read())
 
                 messages = response_data.get("messages", [])
                 if not isinstance(messages, list):
@@ -780,7 +786,8 @@ class BrowserResponseProcessor:
             latest_ts: Optional latest timestamp (Unix timestamp string) to filter messages
 
         Returns:
-            Tuple of (daily_groups dict mapping YYYYMMDD to messages, user_map)
+            Tuple of (daily_groups dict mapping YYYYMMDD to messages, user_map).
+            daily_groups iterates in date order, so callers need not sort its keys.
         """
         # Load all responses
         all_messages = []
@@ -791,8 +798,8 @@ class BrowserResponseProcessor:
 
             logger.info(f"Processing {sanitize_filename(response_file.name)}...")
             try:
-                with open(response_file, "r", encoding="utf-8") as f:
-                    response_data = json.load(f)
+                with open(response_file, "rb") as f:
+                    response_data = loads_json_bytes(f.read())
 
                 messages = response_data.get("messages", [])
                 if not isinstance(messages, list):
@@ -858,9 +865,20 @@ class BrowserResponseProcessor:
 
         logger.info(f"Found {len(unique_messages)} unique messages (from {len(all_messages)} total)")
 
+        # Sort once so days are inserted in date order and each day's messages
+        # arrive already in timestamp order; unparseable timestamps are skipped here
+        timed_messages = []
+        for msg in unique_messages.values():
+            ts = msg.get("ts", "")
+            try:
+                timed_messages.append((float(ts), msg))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid timestamp {ts}, skipping message: {e}")
+        timed_messages.sort(key=lambda item: item[0])
+
         # Group by date (YYYYMMDD format like main export)
         daily_groups = {}
-        for msg in unique_messages.values():
+        for _, msg in timed_messages:
             ts = msg.get("ts", "")
             try:
                 dt = self.parse_timestamp(ts)
@@ -875,8 +893,4 @@ class BrowserResponseProcessor:
                 logger.warning(f"Invalid timestamp {ts}, skipping message: {e}")
                 continue
 
-        # Sort messages within each day by timestamp
-        for date_key in daily_groups:
-            daily_groups[date_key].sort(key=lambda x: float(x.get("ts", "0")))
-
         return daily_groups, self.user_map
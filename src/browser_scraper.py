@@ -18,7 +18,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from src.utils import setup_logging
+from src.utils import dumps_json_bytes, loads_json_bytes, setup_logging
 
 logger = setup_logging()
 
@@ -139,8 +139,8 @@ class BrowserScraper:
         filename = f"response_{index}.json"
         filepath = output_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(response_data, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(dumps_json_bytes(response_data, indent=2))
 
         logger.info(f"Saved captured response to {filepath}")
         return filepath
@@ -176,8 +176,8 @@ class BrowserScraper:
 
         for response_file in response_files:
             try:
-                with open(response_file, "r", encoding="utf-8") as f:
-                    response_data = json.load(f)
+                with open(response_file, "rb") as f:
+                    response_data = loads_json_bytes(f.read())
                     responses.append(response_data)
             except (json.JSONDecodeError, IOError) as e:
                 logger.error(f"Failed to load {response_file}: {e}")
@@ -45,6 +45,11 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Enable bulk export mode: overrides limits and automatically chunks large exports into monthly files.",
     )
+    parser.add_argument(
+        "--compress-output",
+        action="store_true",
+        help="Write exported history as gzip-compressed .txt.gz files.",
+    )
     parser.add_argument(
         "--browser-export-dm",
         action="store_true",
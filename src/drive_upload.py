@@ -3,11 +3,13 @@ Google Drive upload and sharing functionality for Slack Feeder.
 """
 import os
 import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Union
 
-from src.google_drive import GoogleDriveClient
-from src.slack_client import SlackClient, SHARE_RATE_LIMIT_DELAY, SHARE_RATE_LIMIT_INTERVAL
+from src.slack_client import SlackClient
 from src.utils import (
     sanitize_filename,
     sanitize_folder_name,
@@ -15,67 +17,88 @@ from src.utils import (
     validate_email,
     validate_people_json,
     load_json_file,
+    save_json_file,
 )
 from src.message_processing import (
-    group_messages_by_date,
+    EXPORT_SEPARATOR,
+    build_metadata_header,
+    iter_messages_by_date,
+    latest_message_timestamp,
     preprocess_history,
     validate_message,
 )
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the Drive client pulls in the Google API libraries
+    from src.google_drive import GoogleDriveClient
+
 # Constants
 DAILY_MESSAGE_CHUNK_SIZE = 10000  # Process daily messages in chunks of this size to manage memory
 BROWSER_EXPORT_CONFIG_FILENAME = "browser-export.json"  # Default config filename
 CHANNELS_CONFIG_FILENAME = "channels.json"  # Channels config filename
+PEOPLE_CACHE_FILE = "config/.people_cache.json"  # Names and emails resolved in previous runs
+PEOPLE_CACHE_TTL_SECONDS = 7 * 86400  # Re-resolve cached display names after a week
+MAX_DOC_UPLOAD_WORKERS = 4  # Daily Google Docs written concurrently per conversation
+
+
+def _normalize_share_members(share_members: Optional[List[str]]) -> Optional[FrozenSet[str]]:
+    """Lowercase and strip shareMembers identifiers once for O(1) membership tests.
+
+    Args:
+        share_members: Optional list of identifiers (user IDs, emails, or display names)
+
+    Returns:
+        None if share_members is missing or empty (share with everyone), otherwise a
+        frozenset of normalized identifiers. Blank entries are dropped, so a list of only
+        blanks gives an empty set that matches nobody.
+    """
+    if not share_members:
+        return None
+    return frozenset(
+        identifier.strip().lower()
+        for identifier in share_members
+        if identifier and identifier.strip()
+    )
 
 
 def _should_share_with_member(
     member_id: str,
     user_info: Optional[Dict[str, str]],
-    share_members: Optional[List[str]],
+    share_members: Optional[Union[List[str], FrozenSet[str]]],
 ) -> bool:
     """Check if a member should be shared with based on shareMembers list.
 
     Args:
         member_id: Slack user ID
         user_info: User info dictionary with slackId, email, displayName
-        share_members: Optional list of identifiers (user IDs, emails, or display names)
+        share_members: Optional list of identifiers (user IDs, emails, or display names),
+            or a frozenset already normalized by _normalize_share_members (an empty
+            frozenset means selective sharing matched no valid identifiers)
 
     Returns:
         True if member should be shared with, False otherwise
     """
-    if not share_members or len(share_members) == 0:
+    if share_members is None or (not isinstance(share_members, frozenset) and not share_members):
         # No shareMembers list or empty list = share with all (backward compatible)
         return True
 
     if not user_info:
         return False
 
+    if not isinstance(share_members, frozenset):
+        share_members = _normalize_share_members(share_members)
+
     # Normalize identifiers for comparison
     user_slack_id = user_info.get("slackId", "").lower()
     user_email = user_info.get("email", "").lower()
     user_display_name = user_info.get("displayName", "").strip().lower()
 
-    # Check each identifier in shareMembers
-    for identifier in share_members:
-        if not identifier:
-            continue
-
-        identifier_lower = identifier.strip().lower()
-
-        # Match by Slack user ID
-        if identifier_lower == user_slack_id:
-            return True
-
-        # Match by email
-        if user_email and identifier_lower == user_email:
-            return True
-
-        # Match by display name (case-insensitive)
-        if user_display_name and identifier_lower == user_display_name:
-            return True
-
-    # Not found in shareMembers list
-    return False
+    # Match by Slack user ID, email, or display name (case-insensitive)
+    return (
+        user_slack_id in share_members
+        or bool(user_email and user_email in share_members)
+        or bool(user_display_name and user_display_name in share_members)
+    )
 
 
 def _validate_conversation_id(conversation_id: str) -> bool:
@@ -287,7 +310,7 @@ def _get_conversation_members(
             # Try to get from conversation ID (DM IDs start with D)
             # For DMs, we need to use conversations.info to get the user
             try:
-                conv_info = slack_client.client.conversations_info(channel=conversation_id)
+                conv_info = slack_client.lookup_client.conversations_info(channel=conversation_id)
                 if conv_info.get("ok"):
                     user_id = conv_info.get("channel", {}).get("user")
                     if user_id:
@@ -329,8 +352,38 @@ def _get_conversation_members(
     return members
 
 
+def _resolve_member_email(
+    member_id: str,
+    slack_client: SlackClient,
+    people_cache: Optional[Dict[str, str]] = None,
+    people_json: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+    """Resolve a conversation member to a lowercase email and user info.
+
+    Args:
+        member_id: Slack user ID or email address
+        slack_client: SlackClient instance for looking up user IDs
+        people_cache: Optional dict mapping slackId -> displayName
+        people_json: Optional full people.json dict with "people" list
+
+    Returns:
+        Tuple of (email or None, user_info dict or None)
+    """
+    # Check if member_id is already an email
+    if validate_email(member_id):
+        # Try to get user info for email (for display name, etc.)
+        user_info = _resolve_member_identifier(member_id, slack_client, people_cache, people_json)
+        return member_id.lower(), user_info
+
+    # Assume it's a user ID, get user info
+    user_info = slack_client.get_user_info(member_id)
+    if user_info and user_info.get("email"):
+        return user_info["email"].lower(), user_info
+    return None, user_info
+
+
 def share_folder_with_conversation_members(
-    google_drive_client: GoogleDriveClient,
+    google_drive_client: "GoogleDriveClient",
     folder_id: str,
     slack_client: SlackClient,
     conversation_id: str,
@@ -398,65 +451,69 @@ def share_folder_with_conversation_members(
         logger.info(
             f"Selective sharing enabled for {conversation_name}: sharing with {len(share_members)} specified member(s)"
         )
+    # Normalize once so per-member checks are set lookups rather than a scan of shareMembers
+    share_members_set = _normalize_share_members(share_members)
+
+    # Look up uncached user IDs concurrently up front, so the per-member resolution
+    # below reads from the user cache instead of making one users.info call at a time
+    slack_client.get_users_info_bulk(
+        member_id for member_id in members if not validate_email(member_id)
+    )
+
+    # Resolve each member's email and user info exactly once; both the revoke and share
+    # passes below reuse these results instead of walking get_user_info twice
+    resolved_members = [
+        (member_id, *_resolve_member_email(member_id, slack_client, people_cache, people_json))
+        for member_id in members
+    ]
 
     # Get current folder permissions to identify who should have access removed
     current_permissions = google_drive_client.get_folder_permissions(folder_id)
     current_member_emails = set()
 
     # Build set of current member emails (only those who should have access)
-    for member_id in members:
-        # Handle both user IDs and emails
-        email = None
-        user_info = None
-        
-        # Check if member_id is already an email
-        if validate_email(member_id):
-            email = member_id.lower()
-            # Try to get user info for email (for display name, etc.)
-            user_info = _resolve_member_identifier(member_id, slack_client, people_cache, people_json)
-        else:
-            # Assume it's a user ID, get user info
-            user_info = slack_client.get_user_info(member_id)
-            if user_info and user_info.get("email"):
-                email = user_info["email"].lower()
-        
+    for member_id, email, user_info in resolved_members:
         if email and validate_email(email):
             # Check if member should be shared with (respects shareMembers and no_share_set)
             if email not in no_share_set:
-                if _should_share_with_member(member_id, user_info, share_members):
+                if _should_share_with_member(member_id, user_info, share_members_set):
                     current_member_emails.add(email)
 
-    # Revoke access for people who are no longer members
-    revoked_count = 0
-    revoke_errors = []
+    # Revoke access for people who are no longer members; permission IDs come from the
+    # listing above, so the deletes go out in batches without re-listing per user
+    stale_permissions = {}
+    existing_user_emails = set()
     for perm in current_permissions:
-        # Only revoke user permissions (not owner, domain, etc.)
+        # Only revoke user permissions (not owner, domain, etc.) - cheapest checks first
         if perm.get("type") != "user":
             continue
 
-        # Don't revoke owner permissions
-        if perm.get("role") == "owner":
-            continue
-
-        perm_email = perm.get("emailAddress", "").lower()
+        perm_email = perm.get("emailAddress")
         if not perm_email:
             continue
+        perm_email = perm_email.lower()
+        existing_user_emails.add(perm_email)
 
         # If this email is not in current members, revoke access
-        if perm_email not in current_member_emails:
-            try:
-                # Rate limit revoke operations
-                if revoked_count > 0 and revoked_count % SHARE_RATE_LIMIT_INTERVAL == 0:
-                    time.sleep(SHARE_RATE_LIMIT_DELAY)
+        if perm.get("role") == "owner" or perm_email in current_member_emails:
+            continue
+        if perm.get("id"):
+            stale_permissions[perm_email] = perm["id"]
 
-                revoked = google_drive_client.revoke_folder_access(folder_id, perm_email)
-                if revoked:
-                    revoked_count += 1
-                else:
-                    revoke_errors.append(f"{perm_email}: revoke failed")
-            except Exception as e:
-                logger.debug(f"Error revoking access for {perm_email}: {e}", exc_info=True)
-                revoke_errors.append(f"{perm_email}: {str(e)}")
+    revoked_count = 0
+    revoke_errors = []
+    if stale_permissions:
+        try:
+            revoked = google_drive_client.revoke_permissions_batch(folder_id, stale_permissions)
+        except Exception as e:
+            logger.debug(f"Error revoking folder access: {e}", exc_info=True)
+            revoked = {}
+        for perm_email in stale_permissions:
+            if revoked.get(perm_email):
+                revoked_count += 1
+                existing_user_emails.discard(perm_email)
+            else:
+                revoke_errors.append(f"{perm_email}: revoke failed")
 
     if revoked_count > 0:
         logger.info(f"Revoked access for {revoked_count} user(s) no longer in {sanitize_string_for_logging(conversation_name)}")
@@ -468,26 +525,8 @@ def share_folder_with_conversation_members(
     share_errors = []
     share_failures = 0
     excluded_count = 0
-    for i, member_id in enumerate(members):
-        # Rate limit: pause every N shares to avoid API limits
-        if i > 0 and i % SHARE_RATE_LIMIT_INTERVAL == 0:
-            time.sleep(SHARE_RATE_LIMIT_DELAY)
-
-        # Handle both user IDs and emails
-        email = None
-        user_info = None
-        
-        # Check if member_id is already an email
-        if validate_email(member_id):
-            email = member_id.lower()
-            # Try to get user info for email (for display name, etc.)
-            user_info = _resolve_member_identifier(member_id, slack_client, people_cache, people_json)
-        else:
-            # Assume it's a user ID, get user info
-            user_info = slack_client.get_user_info(member_id)
-            if user_info and user_info.get("email"):
-                email = user_info["email"].lower()
-        
+    pending_shares = {}  # email -> send_notification, in member order
+    for member_id, email, user_info in resolved_members:
         if not email or not validate_email(email):
             logger.warning(f"Invalid email format or could not resolve member: {sanitize_string_for_logging(member_id)}. Skipping.")
             continue
@@ -499,7 +538,7 @@ def share_folder_with_conversation_members(
             continue
 
         # Check if member should be shared with based on shareMembers list
-        if not _should_share_with_member(member_id, user_info, share_members):
+        if not _should_share_with_member(member_id, user_info, share_members_set):
             display_name = user_info.get("displayName", member_id) if user_info else member_id
             logger.debug(
                 f"User {email} ({display_name}) not in shareMembers list, skipping"
@@ -507,27 +546,38 @@ def share_folder_with_conversation_members(
             excluded_count += 1
             continue
 
-        if email not in shared_emails:
-            try:
-                # Check if user has opted out of notifications
-                send_notification = email not in no_notifications_set
-                if not send_notification:
-                    logger.debug(
-                        f"User {email} has opted out of notifications, sharing without notification"
-                    )
-
-                shared = google_drive_client.share_folder(
-                    folder_id, email, send_notification=send_notification
+        if email not in pending_shares:
+            # Check if user has opted out of notifications
+            send_notification = email not in no_notifications_set
+            if not send_notification:
+                logger.debug(
+                    f"User {email} has opted out of notifications, sharing without notification"
                 )
-                if shared:
-                    shared_emails.add(email)
-                    stats["shared"] += 1
-                else:
-                    share_errors.append(f"{email}: share failed")
-                    share_failures += 1
-            except Exception as e:
-                logger.debug(f"Error sharing folder with {sanitize_string_for_logging(email)}: {e}", exc_info=True)
-                share_errors.append(f"{email}: {str(e)}")
+            pending_shares[email] = send_notification
+
+    # Users who already have access need no request (as share_folder() would find);
+    # the rest are shared in batches, one HTTP round-trip per DRIVE_BATCH_MAX_REQUESTS
+    new_shares = {}
+    for email, send_notification in pending_shares.items():
+        if email.lower() in existing_user_emails:
+            logger.debug(f"Folder {folder_id} already shared with {email}")
+            shared_emails.add(email)
+            stats["shared"] += 1
+        else:
+            new_shares[email] = send_notification
+
+    if new_shares:
+        try:
+            shared = google_drive_client.share_folder_batch(folder_id, new_shares)
+        except Exception as e:
+            logger.debug(f"Error sharing folder {folder_id}: {e}", exc_info=True)
+            shared = {}
+        for email in new_shares:
+            if shared.get(email):
+                shared_emails.add(email)
+                stats["shared"] += 1
+            else:
+                share_errors.append(f"{email}: share failed")
                 share_failures += 1
 
     stats["share_failed"] += share_failures
@@ -548,7 +598,7 @@ def share_folder_with_conversation_members(
 
 # Backward compatibility aliases
 def share_folder_with_members(
-    google_drive_client: GoogleDriveClient,
+    google_drive_client: "GoogleDriveClient",
     folder_id: str,
     slack_client: SlackClient,
     channel_id: str,
@@ -582,7 +632,7 @@ def share_folder_with_members(
 
 
 def share_folder_for_browser_export(
-    google_drive_client: GoogleDriveClient,
+    google_drive_client: "GoogleDriveClient",
     folder_id: str,
     slack_client: SlackClient,
     conversation_info: Dict[str, Any],
@@ -645,11 +695,12 @@ def load_people_cache() -> Tuple[Dict[str, str], Set[str], Set[str], Optional[Di
             people_cache = {}
             people_json = None  # Don't use invalid JSON
         else:
-            people_cache = {p["slackId"]: p["displayName"] for p in people_json.get("people", [])}
-            # Build sets of opt-out preferences
+            # Build the name cache and opt-out preference sets in a single pass
             for p in people_json.get("people", []):
-                if p.get("email"):
-                    email_lower = p["email"].lower()
+                people_cache[p["slackId"]] = p["displayName"]
+                email = p.get("email")
+                if email:
+                    email_lower = email.lower()
                     if p.get("noNotifications") is True:
                         no_notifications_set.add(email_lower)
                     if p.get("noShare") is True:
@@ -666,11 +717,118 @@ def load_people_cache() -> Tuple[Dict[str, str], Set[str], Set[str], Optional[Di
     else:
         logger.info("No people.json found - will lookup users on-demand from Slack API")
         people_json = None
+
+    # Warm start from display names resolved in previous runs (people.json wins on conflict)
+    persisted_count = 0
+    for user_id, name in _load_persisted_people_cache().items():
+        if user_id not in people_cache:
+            people_cache[user_id] = name
+            persisted_count += 1
+    if persisted_count:
+        logger.info(f"Loaded {persisted_count} users from {PEOPLE_CACHE_FILE}")
+
     return people_cache, no_notifications_set, no_share_set, people_json
 
 
+def _load_unexpired_people_entries() -> Dict[str, Dict[str, Any]]:
+    """Load unexpired entries from the on-disk people cache.
+
+    Returns:
+        Dict mapping slackId -> cache entry with name, ts and optional email keys
+        (empty if the file is missing or invalid)
+    """
+    if not os.path.exists(PEOPLE_CACHE_FILE):
+        return {}
+    data = load_json_file(PEOPLE_CACHE_FILE)
+    if not isinstance(data, dict):
+        return {}
+
+    now = time.time()
+    entries = {}
+    for user_id, entry in data.items():
+        if not isinstance(entry, dict):
+            continue
+        cached_at = entry.get("ts")
+        if not entry.get("name") or not isinstance(cached_at, (int, float)):
+            continue
+        if now - cached_at <= PEOPLE_CACHE_TTL_SECONDS:
+            entries[user_id] = entry
+    return entries
+
+
+def _load_persisted_people_cache() -> Dict[str, str]:
+    """Load unexpired display names from the on-disk people cache.
+
+    Returns:
+        Dict mapping slackId -> displayName (empty if the file is missing or invalid)
+    """
+    return {user_id: entry["name"] for user_id, entry in _load_unexpired_people_entries().items()}
+
+
+def load_persisted_users() -> Dict[str, Dict[str, str]]:
+    """Load unexpired users with an email from the on-disk people cache.
+
+    The result can seed SlackClient.seed_user_cache() so sharing does not call
+    users.info again for members resolved in a recent run.
+
+    Returns:
+        Dict mapping slackId -> user info dict with slackId, email, displayName
+    """
+    return {
+        user_id: {"slackId": user_id, "email": entry["email"], "displayName": entry["name"]}
+        for user_id, entry in _load_unexpired_people_entries().items()
+        if isinstance(entry.get("email"), str) and entry["email"]
+    }
+
+
+def save_people_cache(
+    people_cache: Dict[str, str],
+    known_user_ids: Set[str],
+    user_info: Optional[Mapping[str, Optional[Dict[str, str]]]] = None,
+) -> bool:
+    """Persist display names resolved during this run to the on-disk people cache.
+
+    Only entries not in known_user_ids (the IDs present when the cache was loaded)
+    are stamped with the current time; unexpired entries already on disk are kept.
+
+    Args:
+        people_cache: Dict mapping slackId -> displayName
+        known_user_ids: User IDs that were already cached when the run started
+        user_info: Optional mapping of slackId -> user info (e.g. SlackClient.user_cache);
+            emails found there are stored alongside the new names
+
+    Returns:
+        True if the cache was written, False if there was nothing new or the write failed
+    """
+    new_user_ids = [user_id for user_id in people_cache if user_id not in known_user_ids]
+    if not new_user_ids:
+        return False
+
+    now = time.time()
+    entries = {}
+    existing = load_json_file(PEOPLE_CACHE_FILE) if os.path.exists(PEOPLE_CACHE_FILE) else None
+    if isinstance(existing, dict):
+        for user_id, entry in existing.items():
+            if (
+                isinstance(entry, dict)
+                and isinstance(entry.get("ts"), (int, float))
+                and now - entry["ts"] <= PEOPLE_CACHE_TTL_SECONDS
+            ):
+                entries[user_id] = entry
+    for user_id in new_user_ids:
+        name = people_cache[user_id]
+        if name:
+            entry = {"name": name, "ts": now}
+            info = user_info.get(user_id) if user_info is not None else None
+            if isinstance(info, dict) and isinstance(info.get("email"), str) and info["email"]:
+                entry["email"] = info["email"]
+            entries[user_id] = entry
+
+    return save_json_file(entries, PEOPLE_CACHE_FILE)
+
+
 def get_oldest_timestamp_for_export(
-    google_drive_client: Optional[GoogleDriveClient],
+    google_drive_client: Optional["GoogleDriveClient"],
     folder_id: Optional[str],
     conversation_name: str,
     explicit_start_date: Optional[str],
@@ -843,7 +1001,7 @@ def _validate_upload_params(
 
 
 def _check_doc_exists(
-    google_drive_client: GoogleDriveClient, doc_name: str, folder_id: str
+    google_drive_client: "GoogleDriveClient", doc_name: str, folder_id: str
 ) -> bool:
     """Check if a Google Doc already exists in the folder.
     
@@ -858,25 +1016,22 @@ def _check_doc_exists(
     from src.utils import setup_logging
     logger = setup_logging()
     
-    escaped_doc_name = google_drive_client._escape_drive_query_string(doc_name)
-    escaped_folder_id = google_drive_client._escape_drive_query_string(folder_id)
-    query = (
-        f"name='{escaped_doc_name}' and '{escaped_folder_id}' in parents "
-        f"and mimeType='application/vnd.google-apps.document' and trashed=false"
-    )
+    query = google_drive_client._doc_name_query(doc_name, folder_id)
 
     try:
-        google_drive_client._rate_limit()
+        google_drive_client._rate_limit(read=True)
+        # Only existence matters here (and whether there are duplicates), so fetch
+        # at most two IDs instead of full metadata for every match
         results = (
             google_drive_client.service.files()
-            .list(q=query, fields="files(id, name, modifiedTime)", pageSize=100)
+            .list(q=query, fields="files(id)", pageSize=2)
             .execute()
         )
         existing_files = results.get("files", [])
         if existing_files:
             if len(existing_files) > 1:
                 logger.warning(
-                    f"Found {len(existing_files)} documents with name '{doc_name}'. "
+                    f"Found multiple documents with name '{doc_name}'. "
                     f"create_or_update_google_doc() will use the most recently modified."
                 )
             return True
@@ -893,6 +1048,7 @@ def _create_metadata_header(
     conversation_id: Optional[str],
     date_key: str,
     total_messages: int,
+    export_date: Optional[str] = None,
 ) -> str:
     """Create metadata header for new Google Docs.
     
@@ -901,31 +1057,22 @@ def _create_metadata_header(
         conversation_id: Slack conversation ID (None for browser exports)
         date_key: Date key in YYYYMMDD format
         total_messages: Total number of messages for this day
+        export_date: Preformatted export time shared by all docs of one upload
+            (defaults to now)
         
     Returns:
         Metadata header string
     """
-    export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    date_obj = datetime.strptime(date_key, "%Y%m%d").replace(tzinfo=timezone.utc)
-    date_display = date_obj.strftime("%Y-%m-%d")
-    
-    # Format channel ID for metadata header
-    channel_id_display = conversation_id if conversation_id else "[Browser Export - No ID]"
-    
-    return f"""Slack Conversation Export
-Channel: {conversation_name}
-Channel ID: {channel_id_display}
-Export Date: {export_date}
-Date: {date_display}
-Total Messages: {total_messages}
-
-{'='*80}
-
-"""
+    if export_date is None:
+        export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    date_display = f"{date_key[:4]}-{date_key[4:6]}-{date_key[6:]}"
+    return build_metadata_header(
+        conversation_name, conversation_id, export_date, total_messages, date_display=date_display
+    )
 
 
 def _upload_message_chunk(
-    google_drive_client: GoogleDriveClient,
+    google_drive_client: "GoogleDriveClient",
     doc_name: str,
     folder_id: str,
     message_chunk: List[Dict[str, Any]],
@@ -939,6 +1086,8 @@ def _upload_message_chunk(
     doc_exists: bool,
     is_first_chunk: bool,
     stats: Dict[str, int],
+    export_date: Optional[str] = None,
+    doc_known_new: bool = False,
 ) -> None:
     """Upload a single chunk of messages to Google Drive.
     
@@ -957,6 +1106,8 @@ def _upload_message_chunk(
         doc_exists: Whether the document already exists
         is_first_chunk: Whether this is the first chunk
         stats: Statistics dictionary to update
+        export_date: Preformatted export time for the metadata header (defaults to now)
+        doc_known_new: Whether a folder listing confirmed the document does not exist yet
     """
     from src.utils import setup_logging, sanitize_string_for_logging
     logger = setup_logging()
@@ -980,17 +1131,23 @@ def _upload_message_chunk(
         if total_chunks > 1:
             content_to_add = f"\n\n--- Chunk {chunk_idx} of {total_chunks} ({len(message_chunk)} messages) ---\n\n{processed_messages}"
         else:
-            content_to_add = f"\n\n{'='*80}\n\n{processed_messages}"
+            content_to_add = f"\n\n{EXPORT_SEPARATOR}\n\n{processed_messages}"
     else:
         # Add full header for first chunk of new docs
         metadata_header = _create_metadata_header(
-            conversation_name, conversation_id, date_key, daily_messages_count
+            conversation_name, conversation_id, date_key, daily_messages_count, export_date
         )
         content_to_add = metadata_header + processed_messages
 
     # Create or update Google Doc (append mode for incremental updates)
+    # Only the first chunk can skip the existence query; later chunks append to the
+    # doc it created
     doc_id = google_drive_client.create_or_update_google_doc(
-        doc_name, content_to_add, folder_id, overwrite=False
+        doc_name,
+        content_to_add,
+        folder_id,
+        overwrite=False,
+        known_new=doc_known_new and is_first_chunk,
     )
 
     if not doc_id:
@@ -1004,14 +1161,71 @@ def _upload_message_chunk(
             stats["uploaded"] += 1
             stats["processed"] += 1
         stats["total_messages"] += len(message_chunk)
-        logger.info(f"Created/updated Google Doc for {date_key}{chunk_info}")
+        logger.info("Created/updated Google Doc for %s%s", date_key, chunk_info)
+
+
+def _upload_daily_doc(
+    google_drive_client: "GoogleDriveClient",
+    doc_name: str,
+    folder_id: str,
+    processed_chunks: List[Tuple[List[Dict[str, Any]], str]],
+    conversation_name: str,
+    conversation_id: Optional[str],
+    date_key: str,
+    daily_messages_count: int,
+    doc_exists: bool,
+    export_date: Optional[str] = None,
+    doc_known_new: bool = False,
+) -> Counter:
+    """Upload all chunks of one day's messages to its Google Doc, in order.
+
+    Runs on a worker thread, so statistics are returned rather than written to a
+    shared dictionary.
+
+    Args:
+        google_drive_client: GoogleDriveClient instance
+        doc_name: Name of the Google Doc
+        folder_id: Google Drive folder ID
+        processed_chunks: (message_chunk, processed_messages) pairs for this day
+        conversation_name: Display name of the conversation
+        conversation_id: Slack conversation ID (None for browser exports)
+        date_key: Date key in YYYYMMDD format
+        daily_messages_count: Total messages for this day
+        doc_exists: Whether the document already exists
+        export_date: Preformatted export time for the metadata header (defaults to now)
+        doc_known_new: Whether a folder listing confirmed the document does not exist yet
+
+    Returns:
+        Counter of statistics updates for this day
+    """
+    day_stats: Counter = Counter()
+    for chunk_idx, (message_chunk, processed_messages) in enumerate(processed_chunks, 1):
+        _upload_message_chunk(
+            google_drive_client=google_drive_client,
+            doc_name=doc_name,
+            folder_id=folder_id,
+            message_chunk=message_chunk,
+            processed_messages=processed_messages,
+            conversation_name=conversation_name,
+            conversation_id=conversation_id,
+            date_key=date_key,
+            chunk_idx=chunk_idx,
+            total_chunks=len(processed_chunks),
+            daily_messages_count=daily_messages_count,
+            doc_exists=doc_exists,
+            is_first_chunk=chunk_idx == 1,
+            stats=day_stats,
+            export_date=export_date,
+            doc_known_new=doc_known_new,
+        )
+    return day_stats
 
 
 def upload_messages_to_drive(
     messages: List[Dict[str, Any]],
     conversation_name: str,
     conversation_id: Optional[str],
-    google_drive_client: GoogleDriveClient,
+    google_drive_client: "GoogleDriveClient",
     google_drive_folder_id: Optional[str],
     slack_client: Optional[SlackClient],
     people_cache: Optional[Dict[str, str]],
@@ -1047,13 +1261,12 @@ def upload_messages_to_drive(
         logger.warning("No valid messages found to upload")
         return stats
 
-    # Group messages by date
-    daily_groups = group_messages_by_date(valid_messages)
-    logger.info(
-        f"Grouped {len(valid_messages)} messages into {len(daily_groups)} daily group(s)"
-    )
+    # Stream messages one day at a time, in date order; peek so an empty result
+    # returns before any folder is created
+    daily_groups = iter_messages_by_date(valid_messages)
+    first_day = next(daily_groups, None)
 
-    if not daily_groups:
+    if first_day is None:
         logger.warning("No messages found to upload")
         return stats
 
@@ -1072,78 +1285,115 @@ def upload_messages_to_drive(
 
     logger.info(f"Using folder: {sanitized_folder_name} ({folder_id})")
 
-    # Sort dates chronologically
-    sorted_dates = sorted(daily_groups.keys())
-
-    for date_key in sorted_dates:
-        daily_messages = daily_groups[date_key]
-        logger.info(f"Processing {len(daily_messages)} messages for date {date_key}")
+    # List existing docs once so each day needs only a set lookup to decide on a header,
+    # and new docs can be created without a per-doc existence query
+    existing_docs = google_drive_client.list_google_doc_names(folder_id)
+    doc_name_prefix = f"{conversation_name} slack messages "
+    # Every doc created by this upload shares one export time
+    export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
-        # Memory management: chunk large daily message groups
-        if len(daily_messages) > DAILY_MESSAGE_CHUNK_SIZE:
-            logger.info(
-                f"Large daily message group detected ({len(daily_messages)} messages). "
-                f"Processing in chunks of {DAILY_MESSAGE_CHUNK_SIZE} to manage memory."
-            )
-            message_chunks = [
-                daily_messages[i : i + DAILY_MESSAGE_CHUNK_SIZE]
-                for i in range(0, len(daily_messages), DAILY_MESSAGE_CHUNK_SIZE)
-            ]
-        else:
-            message_chunks = [daily_messages]
-
-        # Create doc name: conversation name slack messages yyyymmdd
-        doc_name_base = f"{conversation_name} slack messages {date_key}"
-        doc_name = sanitize_folder_name(doc_name_base)
-
-        # Check if doc already exists to determine if we need a header
-        doc_exists = _check_doc_exists(google_drive_client, doc_name, folder_id)
-
-        # Process each chunk for this day
-        is_first_chunk = True
-        for chunk_idx, message_chunk in enumerate(message_chunks, 1):
-            chunk_info = (
-                f" (chunk {chunk_idx}/{len(message_chunks)})"
-                if len(message_chunks) > 1
-                else ""
-            )
-            logger.info(
-                f"Processing {len(message_chunk)} messages for date {date_key}{chunk_info}"
+    # Each day's doc is independent, so docs are written from a bounded pool while the
+    # main thread keeps preprocessing (user lookups touch shared caches and stay here).
+    # Chunks of one day are still appended in order by a single worker.
+    in_flight: Dict[Future, str] = {}
+
+    def _collect(done_futures) -> None:
+        for future in done_futures:
+            in_flight.pop(future)
+            for key, value in future.result().items():
+                stats[key] = stats.get(key, 0) + value
+
+    # Newest message seen so far, for the export metadata saved after the loop
+    latest_message_ts = 0.0
+
+    with ThreadPoolExecutor(max_workers=MAX_DOC_UPLOAD_WORKERS) as executor:
+        day_count = 0
+        for date_key, daily_messages in chain((first_day,), daily_groups):
+            day_count += 1
+            # Each day's messages are in timestamp order, so its last one is its newest
+            latest_message_ts = max(
+                latest_message_ts, latest_message_timestamp(daily_messages[-1:])
             )
+            # Per-day and per-chunk lines use lazy %-formatting so they cost nothing when
+            # INFO is disabled
+            logger.info("Processing %d messages for date %s", len(daily_messages), date_key)
 
-            # Process messages for this chunk
-            if use_display_names:
-                processed_messages = preprocess_history(
-                    message_chunk, slack_client=None, people_cache=None, use_display_names=True
+            # Memory management: chunk large daily message groups
+            if len(daily_messages) > DAILY_MESSAGE_CHUNK_SIZE:
+                logger.info(
+                    f"Large daily message group detected ({len(daily_messages)} messages). "
+                    f"Processing in chunks of {DAILY_MESSAGE_CHUNK_SIZE} to manage memory."
                 )
+                message_chunks = [
+                    daily_messages[i : i + DAILY_MESSAGE_CHUNK_SIZE]
+                    for i in range(0, len(daily_messages), DAILY_MESSAGE_CHUNK_SIZE)
+                ]
+            else:
+                message_chunks = [daily_messages]
+
+            # Create doc name: conversation name slack messages yyyymmdd
+            doc_name = sanitize_folder_name(doc_name_prefix + date_key)
+
+            # Check if doc already exists to determine if we need a header
+            if existing_docs is not None:
+                doc_exists = doc_name in existing_docs
             else:
-                processed_messages = preprocess_history(
-                    message_chunk, slack_client, people_cache
+                doc_exists = _check_doc_exists(google_drive_client, doc_name, folder_id)
+
+            # Process each chunk for this day
+            processed_chunks = []
+            for chunk_idx, message_chunk in enumerate(message_chunks, 1):
+                chunk_info = (
+                    f" (chunk {chunk_idx}/{len(message_chunks)})"
+                    if len(message_chunks) > 1
+                    else ""
+                )
+                logger.info(
+                    "Processing %d messages for date %s%s", len(message_chunk), date_key, chunk_info
                 )
 
-            # Upload chunk using helper function
-            _upload_message_chunk(
+                # Process messages for this chunk
+                if use_display_names:
+                    processed_messages = preprocess_history(
+                        message_chunk, slack_client=None, people_cache=None, use_display_names=True
+                    )
+                else:
+                    processed_messages = preprocess_history(
+                        message_chunk, slack_client, people_cache
+                    )
+                processed_chunks.append((message_chunk, processed_messages))
+
+            future = executor.submit(
+                _upload_daily_doc,
                 google_drive_client=google_drive_client,
                 doc_name=doc_name,
                 folder_id=folder_id,
-                message_chunk=message_chunk,
-                processed_messages=processed_messages,
+                processed_chunks=processed_chunks,
                 conversation_name=conversation_name,
                 conversation_id=conversation_id,
                 date_key=date_key,
-                chunk_idx=chunk_idx,
-                total_chunks=len(message_chunks),
                 daily_messages_count=len(daily_messages),
                 doc_exists=doc_exists,
-                is_first_chunk=is_first_chunk,
-                stats=stats,
+                export_date=export_date,
+                # The fallback probe assumes "new" on errors, so only trust the listing
+                doc_known_new=existing_docs is not None and not doc_exists,
             )
+            in_flight[future] = date_key
+
+            if existing_docs is not None:
+                existing_docs.add(doc_name)
+
+            # Bound the amount of processed text held in memory
+            if len(in_flight) >= MAX_DOC_UPLOAD_WORKERS * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+
+        _collect(as_completed(list(in_flight)))
 
-            is_first_chunk = False
+    logger.info(f"Processed {len(valid_messages)} messages in {day_count} daily group(s)")
 
-    # Save export metadata with latest timestamp from all messages
+    # Save export metadata with the latest timestamp tracked across all days above
     if valid_messages:
-        latest_message_ts = max(float(msg.get("ts", 0)) for msg in valid_messages)
         safe_conversation_name = sanitize_filename(conversation_name)
         google_drive_client.save_export_metadata(
             folder_id, safe_conversation_name, str(latest_message_ts)
@@ -1,20 +1,27 @@
 """
 Slack API export functionality.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from src.message_processing import resolve_display_name
 from src.slack_client import SlackClient
 from src.utils import setup_logging, sanitize_string_for_logging
 
 logger = setup_logging()
 
 
-def get_conversation_display_name(channel_info: Dict[str, Any], slack_client: SlackClient) -> str:
+def get_conversation_display_name(
+    channel_info: Dict[str, Any],
+    slack_client: SlackClient,
+    people_cache: Optional[Dict[str, str]] = None,
+) -> str:
     """Gets the display name for a conversation, handling channels, DMs, and group chats.
 
     Args:
         channel_info: Dictionary containing channel information
         slack_client: SlackClient instance for API calls
+        people_cache: Optional cache dictionary mapping user IDs to display names; DM and
+            group DM members found there are not looked up via the API
 
     Returns:
         Display name for the conversation, never None or empty
@@ -42,9 +49,9 @@ def get_conversation_display_name(channel_info: Dict[str, Any], slack_client: Sl
             return f"group_dm_{channel_id[:8]}"
         names = []
         for member_id in members:
-            user_info = slack_client.get_user_info(member_id)
-            if user_info:
-                names.append(user_info.get("displayName", member_id))
+            name = resolve_display_name(member_id, slack_client, people_cache)
+            if name:
+                names.append(name)
         if names:
             return ", ".join(sorted(names))
         else:
@@ -54,9 +61,9 @@ def get_conversation_display_name(channel_info: Dict[str, Any], slack_client: Sl
     if channel_info.get("is_im"):
         other_user_id = channel_info.get("user")
         if other_user_id:
-            user_info = slack_client.get_user_info(other_user_id)
-            if user_info:
-                return user_info.get("displayName", other_user_id)
+            name = resolve_display_name(other_user_id, slack_client, people_cache)
+            if name:
+                return name
         return f"dm_{channel_id[:8]}"
 
     # For channels, use name or fallback to ID
@@ -1,14 +1,19 @@
+import calendar
+import functools
 import logging
 import os
 import platform
 import re
 import shutil
+import threading
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -26,6 +31,24 @@ API_TIMEOUT_SECONDS = 30
 GOOGLE_DRIVE_RATE_LIMIT_DELAY = 0.5  # seconds between API calls
 GOOGLE_DRIVE_BATCH_SIZE = 10  # number of calls before adding extra delay
 GOOGLE_DRIVE_BATCH_DELAY = 1.0  # extra delay after batch
+# Minimum span of a full batch of writes; the batch delay only covers what is left of it
+GOOGLE_DRIVE_BATCH_WINDOW = (
+    (GOOGLE_DRIVE_BATCH_SIZE - 1) * GOOGLE_DRIVE_RATE_LIMIT_DELAY + GOOGLE_DRIVE_BATCH_DELAY
+)
+# Seconds between metadata reads (list/get). Reads from every upload worker share one
+# clock, so 0.2s caps a process at 300 reads/min, the default per-user Docs API read quota
+GOOGLE_DRIVE_READ_RATE_LIMIT_DELAY = 0.2
+DOC_LIST_PAGE_SIZE = 1000  # files.list maximum page size
+DRIVE_BATCH_MAX_REQUESTS = 100  # Drive API limit on sub-requests per batch call
+
+# Files.list query for Google Docs with a given name in a folder; filled with escaped values
+_DOC_NAME_QUERY_TEMPLATE = (
+    "name='{}' and '{}' in parents "
+    "and mimeType='application/vnd.google-apps.document' and trashed=false"
+)
+
+# Formatted message timestamps, [YYYY-MM-DD HH:MM:SS UTC], as written by format_timestamp()
+_DOC_TIMESTAMP_RE = re.compile(r"\[(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}) UTC\]")
 # Google Drive API OAuth scopes
 GOOGLE_DRIVE_SCOPES = [
     "https://www.googleapis.com/auth/drive",
@@ -33,6 +56,47 @@ GOOGLE_DRIVE_SCOPES = [
 ]
 
 
+def _doc_timestamp_to_unix(match: "re.Match[str]") -> Optional[str]:
+    """Convert a _DOC_TIMESTAMP_RE match to the Unix timestamp string used for de-duplication.
+
+    Equivalent to parsing with strptime and calling timestamp() on the UTC datetime, but
+    computed from the captured integers, which is much cheaper per message.
+
+    Args:
+        match: Match object from _DOC_TIMESTAMP_RE
+
+    Returns:
+        str(float) Unix timestamp, or None if the fields are not a valid date and time
+    """
+    year, month, day, hour, minute, second = map(int, match.groups())
+    if not (
+        year >= 1
+        and 1 <= month <= 12
+        and 1 <= day <= calendar.monthrange(year, month)[1]
+        and hour < 24
+        and minute < 60
+        and second < 60
+    ):
+        return None
+    return str(float(calendar.timegm((year, month, day, hour, minute, second))))
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_drive_query_value(value: str) -> str:
+    """Escape a non-empty string for a Drive API query (cached helper for _escape_drive_query_string).
+
+    Folder IDs and doc names repeat across the per-day loops, so each distinct value is
+    escaped only once per run.
+    """
+    # Escape backslashes first (must be first)
+    escaped = value.replace("\\", "\\\\")
+    # Escape single quotes
+    escaped = escaped.replace("'", "\\'")
+    # Escape double quotes if using alternative query format
+    escaped = escaped.replace('"', '\\"')
+    return escaped
+
+
 class GoogleDriveClient:
     def __init__(self, credentials_file: str):
         """Initialize Google Drive client with authentication.
@@ -59,9 +123,18 @@ class GoogleDriveClient:
             # Set timeout on the underlying HTTP client if accessible
             # Note: googleapiclient uses httplib2 internally, timeout is set via httplib2.Http(timeout=...)
             # For now, we rely on default timeout behavior - explicit timeout can be added per-request if needed
-            # Rate limiting state
+            # Rate limiting state (shared across threads, guarded by the lock)
             self._last_api_call_time = 0.0
             self._api_call_count = 0
+            self._batch_start_time = 0.0
+            self._rate_limit_lock = threading.Lock()
+            # Reads are paced separately so lookups do not queue behind writes
+            self._last_read_call_time = 0.0
+            self._read_rate_limit_lock = threading.Lock()
+            # httplib2 is not thread-safe, so worker threads get their own HTTP client
+            self._thread_local = threading.local()
+            # Folder IDs resolved this run, keyed by (parent_folder_id, folder_name)
+            self._folder_cache: Dict[Tuple[Optional[str], str], str] = {}
         except Exception as e:
             logger.error(f"Failed to initialize Google Drive client: {e}", exc_info=True)
             raise
@@ -77,13 +150,22 @@ class GoogleDriveClient:
         """
         if not value:
             return ""
-        # Escape backslashes first (must be first)
-        escaped = value.replace("\\", "\\\\")
-        # Escape single quotes
-        escaped = escaped.replace("'", "\\'")
-        # Escape double quotes if using alternative query format
-        escaped = escaped.replace('"', '\\"')
-        return escaped
+        return _escape_drive_query_value(value)
+
+    def _doc_name_query(self, doc_name: str, folder_id: str) -> str:
+        """Build the files.list query matching Google Docs named doc_name in folder_id.
+
+        Args:
+            doc_name: Document name to match exactly
+            folder_id: Parent folder ID
+
+        Returns:
+            Drive API query string
+        """
+        return _DOC_NAME_QUERY_TEMPLATE.format(
+            self._escape_drive_query_string(doc_name),
+            self._escape_drive_query_string(folder_id),
+        )
 
     def _validate_folder_id(self, folder_id: Optional[str]) -> bool:
         """Validate Google Drive folder ID format.
@@ -233,34 +315,72 @@ class GoogleDriveClient:
             unlock_file_func=self._unlock_file,
         )
 
-    def _rate_limit(self):
-        """Apply rate limiting for Google Drive API calls."""
-        current_time = time.time()
-        
-        # Validate last_api_call_time is a valid timestamp
-        if not isinstance(self._last_api_call_time, (int, float)) or self._last_api_call_time < 0:
-            logger.warning(f"Invalid last_api_call_time: {self._last_api_call_time}, resetting to 0")
-            self._last_api_call_time = 0.0
-        
-        time_since_last_call = current_time - self._last_api_call_time
+    def _rate_limit(self, read: bool = False):
+        """Apply rate limiting for Google Drive API calls.
 
-        # Always add base delay between calls
-        if time_since_last_call < GOOGLE_DRIVE_RATE_LIMIT_DELAY:
-            sleep_time = GOOGLE_DRIVE_RATE_LIMIT_DELAY - time_since_last_call
-            time.sleep(sleep_time)
+        Safe to call from multiple threads; calls are spaced out under a lock.
 
-        # After batch_size calls, add extra delay
-        # Validate api_call_count is a valid integer
-        if not isinstance(self._api_call_count, int) or self._api_call_count < 0:
-            logger.warning(f"Invalid api_call_count: {self._api_call_count}, resetting to 0")
-            self._api_call_count = 0
-        
-        self._api_call_count += 1
-        if self._api_call_count >= GOOGLE_DRIVE_BATCH_SIZE:
-            time.sleep(GOOGLE_DRIVE_BATCH_DELAY)
-            self._api_call_count = 0
+        Args:
+            read: True for metadata reads (list/get). These are spaced by
+                GOOGLE_DRIVE_READ_RATE_LIMIT_DELAY on their own clock and do not count
+                toward the write budget or its batch delay
+        """
+        if read:
+            with self._read_rate_limit_lock:
+                wait = GOOGLE_DRIVE_READ_RATE_LIMIT_DELAY - (time.time() - self._last_read_call_time)
+                if wait > 0:
+                    time.sleep(wait)
+                self._last_read_call_time = time.time()
+            return
+
+        with self._rate_limit_lock:
+            current_time = time.time()
+
+            # Validate last_api_call_time is a valid timestamp
+            if not isinstance(self._last_api_call_time, (int, float)) or self._last_api_call_time < 0:
+                logger.warning(f"Invalid last_api_call_time: {self._last_api_call_time}, resetting to 0")
+                self._last_api_call_time = 0.0
+
+            time_since_last_call = current_time - self._last_api_call_time
+
+            # Always add base delay between calls
+            if time_since_last_call < GOOGLE_DRIVE_RATE_LIMIT_DELAY:
+                sleep_time = GOOGLE_DRIVE_RATE_LIMIT_DELAY - time_since_last_call
+                time.sleep(sleep_time)
+                current_time += sleep_time
+
+            # After batch_size calls, hold the batch to GOOGLE_DRIVE_BATCH_WINDOW
+            # Validate api_call_count is a valid integer
+            if not isinstance(self._api_call_count, int) or self._api_call_count < 0:
+                logger.warning(f"Invalid api_call_count: {self._api_call_count}, resetting to 0")
+                self._api_call_count = 0
+
+            if self._api_call_count == 0:
+                self._batch_start_time = current_time
+            self._api_call_count += 1
+            if self._api_call_count >= GOOGLE_DRIVE_BATCH_SIZE:
+                # Slow calls have already used up part of the window, so only wait out the rest
+                remaining = self._batch_start_time + GOOGLE_DRIVE_BATCH_WINDOW - current_time
+                if remaining > 0:
+                    time.sleep(remaining)
+                self._api_call_count = 0
+
+            self._last_api_call_time = time.time()
+
+    def _thread_http(self) -> Optional[AuthorizedHttp]:
+        """Return an HTTP client for the current thread.
 
-        self._last_api_call_time = time.time()
+        Returns:
+            None on the main thread (requests use the service's default client),
+            otherwise a per-thread authorized client
+        """
+        if threading.current_thread() is threading.main_thread():
+            return None
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
 
     @staticmethod
     def setup_authentication(credentials_file: str) -> str:
@@ -409,7 +529,7 @@ class GoogleDriveClient:
             query += f" and '{escaped_parent_id}' in parents"
 
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.files().list(q=query, fields="files(id, name)", pageSize=1).execute()
             )
@@ -448,10 +568,17 @@ class GoogleDriveClient:
             )
             folder_name = folder_name[:GOOGLE_DRIVE_MAX_FOLDER_NAME_LENGTH].rstrip(". ")
 
+        # Folders resolved earlier in this run need no Drive round-trip
+        cache_key = (parent_folder_id, folder_name)
+        cached_folder_id = self._folder_cache.get(cache_key)
+        if cached_folder_id:
+            return cached_folder_id
+
         # First check if folder already exists
         existing_folder_id = self.find_folder(folder_name, parent_folder_id)
         if existing_folder_id:
             logger.info(f"Found existing folder '{folder_name}' with ID: {existing_folder_id}")
+            self._folder_cache[cache_key] = existing_folder_id
             return existing_folder_id
 
         file_metadata = {"name": folder_name, "mimeType": "application/vnd.google-apps.folder"}
@@ -461,8 +588,11 @@ class GoogleDriveClient:
         try:
             self._rate_limit()
             folder = self.service.files().create(body=file_metadata, fields="id").execute()
-            logger.info(f"Created folder '{folder_name}' with ID: {folder.get('id')}")
-            return folder.get("id")
+            folder_id = folder.get("id")
+            logger.info(f"Created folder '{folder_name}' with ID: {folder_id}")
+            if folder_id:
+                self._folder_cache[cache_key] = folder_id
+            return folder_id
         except HttpError as error:
             logger.error(f"An error occurred while creating folder '{folder_name}': {error}")
             return None
@@ -491,7 +621,7 @@ class GoogleDriveClient:
 
         # Check if file already exists
         if overwrite:
-            self._rate_limit()  # Rate limit before API call
+            self._rate_limit(read=True)  # Rate limit before API call
             escaped_file_name = self._escape_drive_query_string(file_name)
             # Escape folder_id in query
             escaped_folder_id = self._escape_drive_query_string(folder_id)
@@ -557,8 +687,8 @@ class GoogleDriveClient:
         """
         timestamps = set()
         try:
-            self._rate_limit()
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
+            self._rate_limit(read=True)
+            doc = self.docs_service.documents().get(documentId=doc_id).execute(http=self._thread_http())
             
             # Extract text content from the document
             content_parts = []
@@ -571,21 +701,11 @@ class GoogleDriveClient:
             
             content = "".join(content_parts)
             
-            # Pattern to match formatted timestamps: [YYYY-MM-DD HH:MM:SS UTC]
-            # This matches the format used by format_timestamp()
-            timestamp_pattern = re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) UTC\]')
-            
-            for match in timestamp_pattern.finditer(content):
-                timestamp_str = match.group(1)
-                try:
-                    # Convert formatted timestamp back to Unix timestamp
-                    dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                    dt = dt.replace(tzinfo=timezone.utc)
-                    unix_ts = str(dt.timestamp())
+            for match in _DOC_TIMESTAMP_RE.finditer(content):
+                # Convert formatted timestamp back to Unix timestamp; skip invalid ones
+                unix_ts = _doc_timestamp_to_unix(match)
+                if unix_ts is not None:
                     timestamps.add(unix_ts)
-                except (ValueError, TypeError):
-                    # Skip invalid timestamps
-                    continue
                     
         except HttpError as error:
             logger.warning(f"Error reading document content for timestamp extraction: {error}")
@@ -594,45 +714,26 @@ class GoogleDriveClient:
             
         return timestamps
 
-    def create_or_update_google_doc(
-        self, doc_name: str, content: str, folder_id: str, overwrite: bool = False
-    ) -> Optional[str]:
-        """Creates a new Google Doc or appends to an existing one.
+    def _find_existing_doc_id(self, doc_name: str, folder_id: str) -> Optional[str]:
+        """Finds the ID of an existing Google Doc by name in a folder.
 
         Args:
-            doc_name: Name of the Google Doc (without .txt extension)
-            content: Text content to add to the document
-            folder_id: Google Drive folder ID where to create the doc
-            overwrite: If True and doc exists, replace content instead of appending
+            doc_name: Name of the Google Doc
+            folder_id: Google Drive folder ID
 
         Returns:
-            Document ID if successful, None otherwise
+            ID of the most recently modified matching doc, or None if none was found
         """
-        # Validate folder ID
-        if not self._validate_folder_id(folder_id):
-            logger.error(f"Invalid folder ID format: {folder_id}")
-            return None
-
-        if not content:
-            logger.warning(f"Empty content provided for doc '{doc_name}', skipping")
-            return None
-
-        # Check if document already exists - get ALL matches, not just first
-        escaped_doc_name = self._escape_drive_query_string(doc_name)
-        escaped_folder_id = self._escape_drive_query_string(folder_id)
-        query = (
-            f"name='{escaped_doc_name}' and '{escaped_folder_id}' in parents "
-            f"and mimeType='application/vnd.google-apps.document' and trashed=false"
-        )
+        # Get ALL matches, not just first
+        query = self._doc_name_query(doc_name, folder_id)
 
         existing_doc_id = None
-        existing_files = []
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.files()
                 .list(q=query, fields="files(id, name, modifiedTime)", pageSize=100)
-                .execute()
+                .execute(http=self._thread_http())
             )
             existing_files = results.get("files", [])
             
@@ -657,14 +758,50 @@ class GoogleDriveClient:
                 existing_doc_id = existing_files[0]["id"]
         except HttpError as error:
             logger.warning(f"Error checking for existing doc '{doc_name}': {error}")
+        return existing_doc_id
+
+    def create_or_update_google_doc(
+        self,
+        doc_name: str,
+        content: str,
+        folder_id: str,
+        overwrite: bool = False,
+        known_new: bool = False,
+    ) -> Optional[str]:
+        """Creates a new Google Doc or appends to an existing one.
+
+        Args:
+            doc_name: Name of the Google Doc (without .txt extension)
+            content: Text content to add to the document
+            folder_id: Google Drive folder ID where to create the doc
+            overwrite: If True and doc exists, replace content instead of appending
+            known_new: If True, the caller has already listed the folder and knows no doc
+                with this name exists, so the per-doc existence query is skipped
+
+        Returns:
+            Document ID if successful, None otherwise
+        """
+        # Validate folder ID
+        if not self._validate_folder_id(folder_id):
+            logger.error(f"Invalid folder ID format: {folder_id}")
+            return None
+
+        if not content:
+            logger.warning(f"Empty content provided for doc '{doc_name}', skipping")
+            return None
+
+        # Check if document already exists, unless the caller already knows it does not
+        existing_doc_id = None
+        if not known_new:
+            existing_doc_id = self._find_existing_doc_id(doc_name, folder_id)
 
         if existing_doc_id:
             if overwrite:
                 # Replace entire content
                 try:
                     # Get current document to find end index
-                    self._rate_limit()
-                    doc = self.docs_service.documents().get(documentId=existing_doc_id).execute()
+                    self._rate_limit(read=True)
+                    doc = self.docs_service.documents().get(documentId=existing_doc_id).execute(http=self._thread_http())
                     end_index = doc.get("body", {}).get("content", [{}])[-1].get("endIndex", 1)
 
                     # Delete all content except the last newline
@@ -682,7 +819,7 @@ class GoogleDriveClient:
                         self._rate_limit()
                         self.docs_service.documents().batchUpdate(
                             documentId=existing_doc_id, body={"requests": requests}
-                        ).execute()
+                        ).execute(http=self._thread_http())
 
                     # Insert new content
                     requests = [
@@ -696,7 +833,7 @@ class GoogleDriveClient:
                     self._rate_limit()
                     self.docs_service.documents().batchUpdate(
                         documentId=existing_doc_id, body={"requests": requests}
-                    ).execute()
+                    ).execute(http=self._thread_http())
                     logger.info(f"Replaced content in existing doc '{doc_name}'")
                     return existing_doc_id
                 except HttpError as error:
@@ -709,18 +846,11 @@ class GoogleDriveClient:
                     existing_timestamps = self._extract_message_timestamps_from_doc(existing_doc_id)
                     
                     # Extract timestamps from content being appended
-                    # Pattern to match formatted timestamps: [YYYY-MM-DD HH:MM:SS UTC]
-                    timestamp_pattern = re.compile(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) UTC\]')
                     content_timestamps = set()
-                    for match in timestamp_pattern.finditer(content):
-                        timestamp_str = match.group(1)
-                        try:
-                            dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                            dt = dt.replace(tzinfo=timezone.utc)
-                            unix_ts = str(dt.timestamp())
+                    for match in _DOC_TIMESTAMP_RE.finditer(content):
+                        unix_ts = _doc_timestamp_to_unix(match)
+                        if unix_ts is not None:
                             content_timestamps.add(unix_ts)
-                        except (ValueError, TypeError):
-                            continue
                     
                     # Filter out content lines that have timestamps already in the document
                     if existing_timestamps and content_timestamps:
@@ -740,21 +870,17 @@ class GoogleDriveClient:
                             
                             for line in content.split('\n'):
                                 # Check if this line contains a timestamp
-                                match = timestamp_pattern.search(line)
+                                match = _DOC_TIMESTAMP_RE.search(line)
                                 if match:
                                     # Process previous message if any
                                     if current_message_lines and not current_has_duplicate:
                                         filtered_lines.extend(current_message_lines)
                                     
                                     # Start new message
-                                    timestamp_str = match.group(1)
-                                    try:
-                                        dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                                        dt = dt.replace(tzinfo=timezone.utc)
-                                        unix_ts = str(dt.timestamp())
-                                        current_has_duplicate = unix_ts in existing_timestamps
-                                    except (ValueError, TypeError):
-                                        current_has_duplicate = False
+                                    unix_ts = _doc_timestamp_to_unix(match)
+                                    current_has_duplicate = (
+                                        unix_ts is not None and unix_ts in existing_timestamps
+                                    )
                                     
                                     current_message_lines = [line]
                                 else:
@@ -779,8 +905,8 @@ class GoogleDriveClient:
                                 return existing_doc_id
                     
                     # Get current document to find end index
-                    self._rate_limit()
-                    doc = self.docs_service.documents().get(documentId=existing_doc_id).execute()
+                    self._rate_limit(read=True)
+                    doc = self.docs_service.documents().get(documentId=existing_doc_id).execute(http=self._thread_http())
                     end_index = doc.get("body", {}).get("content", [{}])[-1].get("endIndex", 1)
 
                     # Insert new content at the end (before the last newline)
@@ -796,7 +922,7 @@ class GoogleDriveClient:
                     self._rate_limit()
                     self.docs_service.documents().batchUpdate(
                         documentId=existing_doc_id, body={"requests": requests}
-                    ).execute()
+                    ).execute(http=self._thread_http())
                     logger.info(f"Appended content to existing doc '{doc_name}'")
                     return existing_doc_id
                 except HttpError as error:
@@ -807,15 +933,15 @@ class GoogleDriveClient:
             try:
                 # Create the document
                 self._rate_limit()
-                doc = self.docs_service.documents().create(body={"title": doc_name}).execute()
+                doc = self.docs_service.documents().create(body={"title": doc_name}).execute(http=self._thread_http())
                 doc_id = doc.get("documentId")
                 if not doc_id:
                     logger.error(f"Failed to get document ID for '{doc_name}'")
                     return None
 
                 # Move document to the specified folder
-                self._rate_limit()
-                file = self.service.files().get(fileId=doc_id, fields="parents").execute()
+                self._rate_limit(read=True)
+                file = self.service.files().get(fileId=doc_id, fields="parents").execute(http=self._thread_http())
                 previous_parents = ",".join(file.get("parents", []))
                 self._rate_limit()
                 self.service.files().update(
@@ -823,7 +949,7 @@ class GoogleDriveClient:
                     addParents=folder_id,
                     removeParents=previous_parents,
                     fields="id, parents",
-                ).execute()
+                ).execute(http=self._thread_http())
 
                 # Insert content
                 requests = [
@@ -837,7 +963,7 @@ class GoogleDriveClient:
                 self._rate_limit()
                 self.docs_service.documents().batchUpdate(
                     documentId=doc_id, body={"requests": requests}
-                ).execute()
+                ).execute(http=self._thread_http())
 
                 logger.info(f"Created new Google Doc '{doc_name}' with ID: {doc_id}")
                 return doc_id
@@ -867,7 +993,7 @@ class GoogleDriveClient:
 
         files = []
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.files()
                 .list(
@@ -883,6 +1009,50 @@ class GoogleDriveClient:
             logger.warning(f"Error listing files in folder {folder_id}: {error}")
         return files
 
+    def list_google_doc_names(self, folder_id: str) -> Optional[Set[str]]:
+        """Lists the names of all Google Docs in a folder, following pagination.
+
+        Args:
+            folder_id: Google Drive folder ID
+
+        Returns:
+            Set of document names, or None if the folder could not be listed
+        """
+        # Validate folder ID
+        if not self._validate_folder_id(folder_id):
+            logger.error(f"Invalid folder ID format: {folder_id}")
+            return None
+
+        escaped_folder_id = self._escape_drive_query_string(folder_id)
+        query = (
+            f"'{escaped_folder_id}' in parents "
+            f"and mimeType='application/vnd.google-apps.document' and trashed=false"
+        )
+
+        names: Set[str] = set()
+        page_token = None
+        try:
+            while True:
+                self._rate_limit(read=True)
+                results = (
+                    self.service.files()
+                    .list(
+                        q=query,
+                        fields="nextPageToken, files(name)",
+                        pageSize=DOC_LIST_PAGE_SIZE,
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+                names.update(f["name"] for f in results.get("files", []) if "name" in f)
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
+        except HttpError as error:
+            logger.warning(f"Error listing Google Docs in folder {folder_id}: {error}")
+            return None
+        return names
+
     def get_latest_export_timestamp(self, folder_id: str, file_prefix: str) -> Optional[str]:
         """Gets the timestamp from the most recent export metadata file.
 
@@ -910,7 +1080,7 @@ class GoogleDriveClient:
         query = f"name='{escaped_metadata_name}' and '{folder_id}' in parents and trashed=false"
 
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.files().list(q=query, fields="files(id, name)", pageSize=1).execute()
             )
@@ -927,8 +1097,9 @@ class GoogleDriveClient:
                 while not done:
                     status, done = downloader.next_chunk()
 
-                file_content.seek(0)
-                metadata_json = json.loads(file_content.read().decode("utf-8"))
+                # json.loads detects UTF-8 in bytes itself, so the payload is parsed
+                # without first decoding it to a str
+                metadata_json = json.loads(file_content.getvalue())
                 latest_message_timestamp = metadata_json.get("latest_message_timestamp")
 
                 if latest_message_timestamp:
@@ -1035,7 +1206,7 @@ class GoogleDriveClient:
         query = f"name='{escaped_metadata_name}' and '{folder_id}' in parents and trashed=false"
 
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.files().list(q=query, fields="files(id, name)", pageSize=1).execute()
             )
@@ -1146,11 +1317,11 @@ class GoogleDriveClient:
 
         permissions = []
         try:
-            self._rate_limit()
+            self._rate_limit(read=True)
             results = (
                 self.service.permissions()
                 .list(fileId=folder_id, fields="permissions(id, type, role, emailAddress)")
-                .execute()
+                .execute(http=self._thread_http())
             )
             permissions = results.get("permissions", [])
         except HttpError as error:
@@ -1203,7 +1374,7 @@ class GoogleDriveClient:
             permission = {"type": "user", "role": "reader", "emailAddress": email_address}
             self.service.permissions().create(
                 fileId=folder_id, body=permission, sendNotificationEmail=send_notification
-            ).execute()
+            ).execute(http=self._thread_http())
             logger.info(f"Shared folder {folder_id} with {email_address}")
             return True
         except HttpError as error:
@@ -1219,6 +1390,125 @@ class GoogleDriveClient:
             logger.warning(f"Error sharing folder: {e}", exc_info=True)
             return False
 
+    def _execute_batch(self, requests: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+        """Executes API requests through the Drive batch endpoint.
+
+        Up to DRIVE_BATCH_MAX_REQUESTS requests share one HTTP round-trip, and each
+        round-trip is rate limited once.
+
+        Args:
+            requests: Unexecuted googleapiclient requests
+
+        Returns:
+            (response, exception) pairs in the same order as requests
+        """
+        results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(requests)
+
+        def _on_response(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+
+        for start in range(0, len(requests), DRIVE_BATCH_MAX_REQUESTS):
+            end = min(start + DRIVE_BATCH_MAX_REQUESTS, len(requests))
+            batch = self.service.new_batch_http_request(callback=_on_response)
+            for idx in range(start, end):
+                batch.add(requests[idx], request_id=str(idx))
+            try:
+                self._rate_limit()
+                batch.execute(http=self._thread_http())
+            except HttpError as error:
+                for idx in range(start, end):
+                    results[idx] = (None, error)
+        return results
+
+    def share_folder_batch(self, folder_id: str, shares: Dict[str, bool]) -> Dict[str, bool]:
+        """Shares a folder with many users using batched permission requests.
+
+        Unlike share_folder(), existing permissions are not listed first; callers
+        pass only users who do not already have access.
+
+        Args:
+            folder_id: Google Drive folder ID to share
+            shares: Mapping of email address -> whether to send a notification email
+
+        Returns:
+            Mapping of email address -> True if shared (or already shared), False otherwise
+        """
+        # Validate folder ID
+        if not self._validate_folder_id(folder_id):
+            logger.error(f"Invalid folder ID format: {folder_id}")
+            return {email: False for email in shares}
+
+        emails = list(shares)
+        requests = [
+            self.service.permissions().create(
+                fileId=folder_id,
+                body={"type": "user", "role": "reader", "emailAddress": email},
+                sendNotificationEmail=shares[email],
+            )
+            for email in emails
+        ]
+
+        shared = {}
+        for email, (_, error) in zip(emails, self._execute_batch(requests)):
+            if error is None:
+                logger.info(f"Shared folder {folder_id} with {email}")
+                shared[email] = True
+            elif (
+                isinstance(error, HttpError)
+                and error.resp.status == 400
+                and "already has access" in str(error)
+            ):
+                logger.debug(f"Folder {folder_id} already shared with {email}")
+                shared[email] = True
+            else:
+                logger.error(
+                    f"An error occurred while sharing folder {folder_id} with {email}: {error}"
+                )
+                shared[email] = False
+        return shared
+
+    def revoke_permissions_batch(
+        self, folder_id: str, permission_ids: Dict[str, str]
+    ) -> Dict[str, bool]:
+        """Revokes folder permissions using batched requests.
+
+        Unlike revoke_folder_access(), permissions are not listed first; callers pass
+        permission IDs from get_folder_permissions().
+
+        Args:
+            folder_id: Google Drive folder ID
+            permission_ids: Mapping of email address -> permission ID to delete
+
+        Returns:
+            Mapping of email address -> True if revoked (or already gone), False otherwise
+        """
+        # Validate folder ID
+        if not self._validate_folder_id(folder_id):
+            logger.error(f"Invalid folder ID format: {folder_id}")
+            return {email: False for email in permission_ids}
+
+        emails = list(permission_ids)
+        requests = [
+            self.service.permissions().delete(fileId=folder_id, permissionId=permission_ids[email])
+            for email in emails
+        ]
+
+        revoked = {}
+        for email, (_, error) in zip(emails, self._execute_batch(requests)):
+            if error is None:
+                logger.info(f"Revoked access to folder {folder_id} for {email}")
+                revoked[email] = True
+            elif isinstance(error, HttpError) and error.resp.status == 404:
+                # Permission doesn't exist, that's fine
+                logger.debug(f"Permission not found for {email} on folder {folder_id}")
+                revoked[email] = True
+            else:
+                logger.error(
+                    f"An error occurred while revoking access to folder {folder_id} for {email}: {error}"
+                )
+                revoked[email] = False
+        return revoked
+
     def revoke_folder_access(self, folder_id: str, email_address: str) -> bool:
         """Revokes access to a folder for a specific user.
 
@@ -1,11 +1,16 @@
 import argparse
+import gzip
 import os
 import re
+import stat
 import sys
 import time
 from calendar import monthrange
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple, Set
+from itertools import chain
+from typing import TYPE_CHECKING, IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Set
 
 # Add project root to Python path so imports work regardless of how script is invoked
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,11 +20,12 @@ if project_root not in sys.path:
 from dotenv import load_dotenv
 from slack_sdk.errors import SlackApiError
 
-from src.google_drive import GoogleDriveClient
 from src.slack_client import SlackClient
 from src.utils import (
     convert_date_to_timestamp,
     create_directory,
+    durable_writes_enabled,
+    fsync_directory,
     load_json_file,
     sanitize_filename,
     sanitize_folder_name,
@@ -33,17 +39,22 @@ from src.utils import (
     validate_people_json,
 )
 from src.message_processing import (
-    group_messages_by_date,
+    TS_FLOAT_KEY,
+    annotate_timestamps,
+    build_metadata_header,
+    iter_messages_by_date,
+    iter_preprocess_history,
     preprocess_history,
     should_chunk_export,
     split_messages_by_month,
-    estimate_file_size,
     filter_messages_by_date_range,
 )
 from src.drive_upload import (
     share_folder_with_members,
     share_folder_for_browser_export,
     load_people_cache,
+    load_persisted_users,
+    save_people_cache,
     get_oldest_timestamp_for_export,
     upload_messages_to_drive,
     initialize_stats,
@@ -63,6 +74,10 @@ from src.cli import (
     METADATA_FILE_SUFFIX,
 )
 
+if TYPE_CHECKING:
+    # Only needed for annotations; the Drive client is imported where it is constructed
+    from src.google_drive import GoogleDriveClient
+
 # Load environment variables from .env file if it exists
 load_dotenv()
 
@@ -73,6 +88,10 @@ CONVERSATION_DELAY_SECONDS = 0.5
 LARGE_CONVERSATION_THRESHOLD = 10000
 SECONDS_PER_DAY = 86400  # Seconds in a day
 BYTES_PER_MB = 1024 * 1024  # Bytes per megabyte
+EXPORT_WRITE_BUFFER_SIZE = 1024 * 1024  # Streamed export lines reach the OS in 1 MiB writes
+EXPORT_GZIP_COMPRESSLEVEL = 1  # Fastest level; chat text still shrinks several times over
+CHANNELS_CACHE_FILE = "config/.channels_cache.json"  # Conversation list from the last --make-ref-files
+CHANNELS_CACHE_TTL_SECONDS = 300  # Reuse the cached conversation list for five minutes
 
 # Configuration file names (imported from cli.py)
 # BROWSER_EXPORT_CONFIG_KEY, BROWSER_EXPORT_CONFIG_FILENAME, etc. are imported from cli.py
@@ -116,11 +135,34 @@ MAX_MESSAGES_PER_CONVERSATION = _get_env_int("MAX_MESSAGES_PER_CONVERSATION", 50
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * BYTES_PER_MB
 # Maximum date range in days (1 year)
 MAX_DATE_RANGE_DAYS = _get_env_int("MAX_DATE_RANGE_DAYS", 365, min_val=1, max_val=3650)
+# Conversation histories fetched ahead of the export loop; 1 keeps Slack history calls serial
+HISTORY_PREFETCH_WORKERS = _get_env_int("HISTORY_PREFETCH_WORKERS", 1, min_val=1, max_val=4)
 # Chunking thresholds for bulk exports
 CHUNK_DATE_RANGE_DAYS = 30  # Chunk if date range exceeds this
 CHUNK_MESSAGE_THRESHOLD = 10000  # Chunk if message count exceeds this
 # Memory management: chunk size for processing daily message groups in upload_messages_to_drive
 DAILY_MESSAGE_CHUNK_SIZE = 10000  # Process daily messages in chunks of this size to manage memory
+# Maximum time to wait for background sidebar selection before touching the browser again
+SIDEBAR_SELECTION_TIMEOUT_SECONDS = 30
+
+# Usage hint printed when --browser-export-dm is run without piped stdin
+_STDIN_USAGE_HELP = """
+To extract messages from DOM:
+1. Open Slack in a browser and navigate to the conversation
+2. Scroll to load all messages in the date range
+3. Use MCP chrome-devtools tools to run DOM extraction
+   Example: Use mcp_chrome-devtools_evaluate_script with extract_messages_from_dom_script()
+4. Pipe JSON to this script:
+   python scripts/extract_dom_messages.py --output-to-stdout | \\
+     python src/main.py --browser-export-dm --browser-conversation-name 'Name' --upload-to-drive
+
+Browser exports use the same file conventions as --export-history:
+  - File naming: {conversation_name} slack messages {YYYYMMDD}
+  - Same grouping and formatting logic
+  - No intermediate files needed
+
+See ReadMe.md for detailed instructions.
+"""
 
 
 # Functions moved to message_processing.py, export_api.py, drive_upload.py, export_browser.py
@@ -131,7 +173,33 @@ DAILY_MESSAGE_CHUNK_SIZE = 10000  # Process daily messages in chunks of this siz
 # All duplicate function definitions removed - using imports instead
 
 
-def _validate_and_setup_environment() -> Tuple[SlackClient, GoogleDriveClient, Optional[str]]:
+def _check_credentials_file(path: str) -> bool:
+    """Check that the credentials path is an existing, readable regular file.
+
+    Uses a single stat plus one access check instead of separate
+    exists/isfile/access calls on the same path.
+
+    Args:
+        path: Absolute path to the credentials file
+
+    Returns:
+        True if the file can be used, False otherwise (the reason is logged)
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        logger.error(f"Credentials file not found: {sanitize_path_for_logging(path)}")
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        logger.error(f"Credentials path is not a file: {sanitize_path_for_logging(path)}")
+        return False
+    if not os.access(path, os.R_OK):
+        logger.error(f"Credentials file is not readable: {sanitize_path_for_logging(path)}")
+        return False
+    return True
+
+
+def _validate_and_setup_environment() -> Tuple[SlackClient, "GoogleDriveClient", Optional[str]]:
     """Validate environment variables and setup clients.
 
     Returns:
@@ -160,21 +228,7 @@ def _validate_and_setup_environment() -> Tuple[SlackClient, GoogleDriveClient, O
         google_drive_credentials_file = os.path.abspath(
             os.path.expanduser(google_drive_credentials_file)
         )
-        if not os.path.exists(google_drive_credentials_file):
-            logger.error(
-                f"Credentials file not found: {sanitize_path_for_logging(google_drive_credentials_file)}"
-            )
-            sys.exit(1)
-        if not os.path.isfile(google_drive_credentials_file):
-            logger.error(
-                f"Credentials path is not a file: {sanitize_path_for_logging(google_drive_credentials_file)}"
-            )
-            sys.exit(1)
-        # Check if file is readable
-        if not os.access(google_drive_credentials_file, os.R_OK):
-            logger.error(
-                f"Credentials file is not readable: {sanitize_path_for_logging(google_drive_credentials_file)}"
-            )
+        if not _check_credentials_file(google_drive_credentials_file):
             sys.exit(1)
     except (OSError, ValueError) as e:
         logger.error(f"Invalid credentials file path: {sanitize_path_for_logging(str(e))}")
@@ -184,6 +238,7 @@ def _validate_and_setup_environment() -> Tuple[SlackClient, GoogleDriveClient, O
         logger.warning("GOOGLE_DRIVE_FOLDER_ID not set. Files will be uploaded to Drive root.")
 
     slack_client = SlackClient(slack_bot_token)
+    from src.google_drive import GoogleDriveClient
     google_drive_client = GoogleDriveClient(google_drive_credentials_file)
     return slack_client, google_drive_client, google_drive_folder_id
 
@@ -213,7 +268,9 @@ def _setup_output_directory() -> str:
     # Optional: Restrict to a safe base directory (current working directory)
     # This prevents writing outside the expected location
     safe_base = os.path.abspath(os.getcwd())
-    if not output_dir.startswith(safe_base):
+    if output_dir != safe_base and not _is_within_directory(
+        output_dir, safe_base.rstrip(os.sep) + os.sep
+    ):
         logger.error(
             f"Output directory must be within current working directory. Got: {output_dir}, Base: {safe_base}"
         )
@@ -223,51 +280,238 @@ def _setup_output_directory() -> str:
     return output_dir
 
 
+def _is_within_directory(path: str, directory_prefix: str) -> bool:
+    """Check that a path stays inside a directory after normalization.
+
+    Args:
+        path: File path to check
+        directory_prefix: Absolute directory path ending with os.sep, computed once by
+            the caller so only the file path is normalized per call
+
+    Returns:
+        True if the normalized path is inside the directory, False otherwise
+    """
+    return os.path.abspath(path).startswith(directory_prefix)
+
+
+def _open_export_file(path: str, compress: bool) -> IO[str]:
+    """Open an export file for writing text, gzip-compressed if requested.
+
+    Args:
+        path: Output file path (callers add the .gz suffix for compressed files)
+        compress: If True, write through gzip at EXPORT_GZIP_COMPRESSLEVEL
+
+    Returns:
+        Writable text file object
+    """
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=EXPORT_GZIP_COMPRESSLEVEL)
+    return open(path, "w", encoding="utf-8", buffering=EXPORT_WRITE_BUFFER_SIZE)
+
+
+def _get_all_channels_cached(slack_client: SlackClient) -> List[Dict[str, Any]]:
+    """Fetch all conversations, reusing a recent on-disk copy when available.
+
+    Listing conversations and their details is the slowest part of --make-ref-files,
+    so back-to-back runs read CHANNELS_CACHE_FILE while it is younger than
+    CHANNELS_CACHE_TTL_SECONDS.
+
+    Args:
+        slack_client: SlackClient used when the cache is missing or stale
+
+    Returns:
+        List of conversation objects as returned by SlackClient.get_all_channels()
+    """
+    try:
+        cache_age = time.time() - os.path.getmtime(CHANNELS_CACHE_FILE)
+    except OSError:
+        cache_age = None
+
+    if cache_age is not None and cache_age < CHANNELS_CACHE_TTL_SECONDS:
+        cached_channels = load_json_file(CHANNELS_CACHE_FILE)
+        if isinstance(cached_channels, list):
+            logger.info(
+                f"Using {len(cached_channels)} conversation(s) cached {cache_age:.0f}s ago "
+                f"in {CHANNELS_CACHE_FILE}"
+            )
+            return cached_channels
+
+    channels = slack_client.get_all_channels()
+    if channels:
+        save_json_file(channels, CHANNELS_CACHE_FILE)
+    return channels
+
+
+def _fetch_conversation_history(
+    slack_client: SlackClient,
+    channel_id: str,
+    oldest_ts: Optional[str],
+    latest_ts: Optional[str],
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch a conversation's history, including full threads that began before the window.
+
+    Only Slack history endpoints are called (no user lookups or shared caches), so this
+    is safe to run on a background thread.
+
+    Args:
+        slack_client: SlackClient instance
+        channel_id: Slack conversation ID
+        oldest_ts: Oldest timestamp to fetch (None for no lower bound)
+        latest_ts: Latest timestamp to fetch (None for no upper bound)
+
+    Returns:
+        List of annotated messages sorted by timestamp, or None on API error
+    """
+    history = slack_client.fetch_channel_history(
+        channel_id, oldest_ts=oldest_ts, latest_ts=latest_ts
+    )
+
+    if history is None:
+        return None
+
+    # --- Orphan Thread Detection & Fetching ---
+    # Identify replies whose root messages are missing from the current history batch
+    # (i.e., threads that started before the export window but have activity now)
+    if history:
+        messages_by_ts = {msg.get("ts"): msg for msg in history if msg.get("ts")}
+        orphan_threads = set()
+
+        for msg in history:
+            thread_ts = msg.get("thread_ts")
+            ts = msg.get("ts")
+            
+            # Check if it's a reply (has thread_ts and it differs from its own ts)
+            if thread_ts and ts != thread_ts:
+                # If the parent thread_ts is NOT in our current message set, it's an orphan reply
+                if thread_ts not in messages_by_ts:
+                    orphan_threads.add(thread_ts)
+
+        if orphan_threads:
+            logger.info(f"Found {len(orphan_threads)} active threads starting before export window. Fetching full context...")
+            
+            for thread_ts in orphan_threads:
+                logger.info(f"Fetching full history for active thread {thread_ts}...")
+                thread_messages = slack_client.fetch_thread_history(channel_id, thread_ts)
+                
+                if thread_messages:
+                    # Add messages to history, avoiding duplicates
+                    for t_msg in thread_messages:
+                        t_ts = t_msg.get("ts")
+                        if t_ts and t_ts not in messages_by_ts:
+                            history.append(t_msg)
+                            messages_by_ts[t_ts] = t_msg # Update lookup
+                else:
+                    logger.warning(f"Failed to fetch thread {thread_ts}")
+
+            # Re-sort history after adding thread messages
+            history.sort(key=lambda x: float(x.get("ts", 0)))
+            logger.info(f"Export history expanded to {len(history)} messages after active thread retrieval")
+
+    # Parse every ts once; chunking, month splitting and formatting reuse the result
+    annotate_timestamps(history)
+    return history
+
+
+def _iter_prefetched_histories(
+    slack_client: SlackClient,
+    export_jobs: List[Dict[str, Any]],
+    max_workers: int = 1,
+) -> Iterator[Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]]:
+    """Yield each export job with its history, fetching upcoming histories in the background.
+
+    Slack fetches for the next conversations overlap the upload or file write of the
+    current one. At most max_workers fetches are in flight, so at most max_workers + 1
+    histories are held in memory; with the default of 1, Slack requests stay serial.
+    Uploads, sharing and user lookups stay on the calling thread with the shared caches.
+
+    Args:
+        slack_client: SlackClient instance
+        export_jobs: Dicts with channel_id, oldest_ts and latest_ts keys, in export order
+        max_workers: Number of histories to fetch concurrently
+
+    Yields:
+        (job, history) pairs in export order; history is None on API error
+    """
+
+    def _fetch(job: Dict[str, Any], delay: bool) -> Optional[List[Dict[str, Any]]]:
+        if delay:
+            time.sleep(CONVERSATION_DELAY_SECONDS)  # Small delay between conversations
+        return _fetch_conversation_history(
+            slack_client, job["channel_id"], job["oldest_ts"], job["latest_ts"]
+        )
+
+    if not export_jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(_fetch, job, idx > 0)
+            for idx, job in enumerate(export_jobs[:max_workers])
+        )
+        next_idx = len(pending)
+        for job in export_jobs:
+            history = pending.popleft().result()
+            if next_idx < len(export_jobs):
+                pending.append(executor.submit(_fetch, export_jobs[next_idx], True))
+                next_idx += 1
+            yield job, history
+
+
 def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_click: Callable = None, mcp_press_key: Callable = None, mcp_fill: Callable = None) -> None:
     """Main function to run the Slack history export and upload process."""
     slack_client, google_drive_client, google_drive_folder_id = _validate_and_setup_environment()
 
     if args.make_ref_files:
         logger.info("Fetching all conversations and users to create reference files...")
-        channels = slack_client.get_all_channels()
-
-        # Filter out any direct messages (DMs) - safety check
-        channels = [ch for ch in channels if not ch.get("is_im")]
+        channels = _get_all_channels_cached(slack_client)
 
         # Add export flag (defaults to true) to each conversation
         # Preserve existing export and share flags if channels.json already exists
         existing_channels_data = load_json_file("config/channels.json")
-        existing_export_map = {}
-        existing_share_map = {}
+        existing_by_id = {}
         if existing_channels_data:
-            for ch in existing_channels_data.get("channels", []):
-                if "id" in ch:
-                    existing_export_map[ch["id"]] = ch.get("export", True)
-                    existing_share_map[ch["id"]] = ch.get("share", True)
+            existing_by_id = {
+                ch["id"]: ch for ch in existing_channels_data.get("channels", []) if "id" in ch
+            }
 
+        # The conversation list is freshly fetched or loaded, so flags are set on its
+        # dicts in place rather than on a copy of every entry
         channels_with_export = []
         for channel in channels:
-            channel_entry = dict(channel)
-            # Preserve existing export setting, or default to True
-            if channel_entry.get("id") in existing_export_map:
-                channel_entry["export"] = existing_export_map[channel_entry.get("id")]
-            elif "export" not in channel_entry:
-                channel_entry["export"] = True
-            # Preserve existing share setting, or default to True
-            if channel_entry.get("id") in existing_share_map:
-                channel_entry["share"] = existing_share_map[channel_entry.get("id")]
-            elif "share" not in channel_entry:
-                channel_entry["share"] = True
-            channels_with_export.append(channel_entry)
-
+            # Filter out any direct messages (DMs) - safety check
+            if channel.get("is_im"):
+                continue
+            previous = existing_by_id.get(channel.get("id"))
+            if previous is not None:
+                # Preserve existing export and share settings
+                channel["export"] = previous.get("export", True)
+                channel["share"] = previous.get("share", True)
+            else:
+                # Default to exporting and sharing new conversations
+                channel.setdefault("export", True)
+                channel.setdefault("share", True)
+            channels_with_export.append(channel)
+
+        # One paginated users.list pass replaces a users.info call per member; members it
+        # does not cover (e.g. external Slack Connect users) still fall back to users.info
+        all_users = slack_client.list_all_users() or {}
+        members_by_channel = slack_client.get_members_for_channels(
+            channel["id"] for channel in channels_with_export
+        )
+        # dict.fromkeys keeps first-seen member order across channels
+        member_ids = dict.fromkeys(
+            member_id
+            for channel in channels_with_export
+            for member_id in members_by_channel.get(channel["id"], [])
+        )
+        # Resolve the users.list misses concurrently rather than one users.info at a time
+        missing_ids = [member_id for member_id in member_ids if member_id not in all_users]
+        fallback_users = slack_client.get_users_info_bulk(missing_ids) if missing_ids else {}
         people = {}
-        for channel in channels:
-            members = slack_client.get_channel_members(channel["id"])
-            for member_id in members:
-                if member_id not in people:
-                    user_info = slack_client.get_user_info(member_id)
-                    if user_info:
-                        people[member_id] = user_info
+        for member_id in member_ids:
+            user_info = all_users.get(member_id) or fallback_users.get(member_id)
+            if user_info:
+                people[member_id] = user_info
 
         save_json_file({"channels": channels_with_export}, "config/channels.json")
         save_json_file({"people": list(people.values())}, "config/people.json")
@@ -313,11 +557,25 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
 
         logger.info(f"Found {len(channels_to_export)} conversation(s) to export")
 
+        # Dates are the same for every conversation, so validate and convert them once
+        if args.start_date and convert_date_to_timestamp(args.start_date) is None:
+            logger.error(f"Invalid start date format: {args.start_date}")
+            return
+        end_date_ts = convert_date_to_timestamp(args.end_date, is_end_date=True)
+        if args.end_date and end_date_ts is None:
+            logger.error(f"Invalid end date format: {args.end_date}")
+            return
+
         # Load people.json cache and opt-out sets
         people_cache, no_notifications_set, no_share_set, people_json = load_people_cache()
+        known_user_ids = set(people_cache)
+        # Users (with emails) resolved in recent runs skip users.info when sharing, too
+        slack_client.seed_user_cache(load_persisted_users())
 
         # Setup output directory
         output_dir = _setup_output_directory()
+        # output_dir is absolute, so the containment prefix is computed once per run
+        out_prefix = output_dir.rstrip(os.sep) + os.sep
 
         # Initialize statistics tracking
         stats = initialize_stats()
@@ -333,6 +591,9 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
         if args.bulk_export:
             logger.info("Bulk export mode enabled - limits overridden for large exports")
 
+        # Resolve names and start timestamps for every conversation first, so history
+        # fetches can run ahead of the uploads and file writes below
+        export_jobs = []
         for idx, channel_info in enumerate(channels_to_export, 1):
             # Validate channel_info structure
             if not isinstance(channel_info, dict):
@@ -340,10 +601,6 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 stats["skipped"] += 1
                 continue
 
-            # Add small delay between conversations to avoid rate limits
-            if idx > 1:
-                time.sleep(CONVERSATION_DELAY_SECONDS)  # Small delay between conversations
-
             # Progress indicator
             logger.info(f"[{idx}/{total_conversations}] Processing conversation...")
 
@@ -355,20 +612,14 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 stats["skipped"] += 1
                 continue
 
-            channel_name = get_conversation_display_name(channel_info, slack_client)
+            channel_name = get_conversation_display_name(channel_info, slack_client, people_cache)
 
-            # Cache sanitized names to avoid repeated calculations
-            sanitized_names = {
-                "folder": sanitize_folder_name(channel_name),
-                "file": sanitize_filename(channel_name),
-            }
+            # Sanitize names once per channel; every branch below reuses these locals
+            sanitized_folder_name = sanitize_folder_name(channel_name)
+            safe_channel_name = sanitize_filename(channel_name)
 
             logger.info(f"--- Processing conversation: {channel_name} ({channel_id}) ---")
 
-            # Determine oldest timestamp for incremental fetching
-            sanitized_folder_name = sanitized_names["folder"]
-            safe_channel_name = sanitized_names["file"]
-            
             # Get folder ID early if uploading to Drive (needed for incremental export check)
             folder_id = None
             if args.upload_to_drive:
@@ -387,16 +638,11 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
             )
             
             if args.start_date and oldest_ts is None:
-                # Invalid start date format - skip this conversation
+                # Start date could not be applied - skip this conversation
                 stats["skipped"] += 1
                 continue
 
-            # Validate end date if provided
-            latest_ts = convert_date_to_timestamp(args.end_date, is_end_date=True)
-            if args.end_date and latest_ts is None:
-                logger.error(f"Invalid end date format: {args.end_date}")
-                stats["skipped"] += 1
-                continue
+            latest_ts = end_date_ts
 
             # Validate date range (for API exports, filtering happens at fetch time via timestamps)
             # Use filter function for validation only
@@ -419,10 +665,42 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 stats["skipped"] += 1
                 continue
 
-            history = slack_client.fetch_channel_history(
-                channel_id, oldest_ts=oldest_ts, latest_ts=latest_ts
+            export_jobs.append(
+                {
+                    "channel_info": channel_info,
+                    "channel_id": channel_id,
+                    "channel_name": channel_name,
+                    "sanitized_folder_name": sanitized_folder_name,
+                    "safe_channel_name": safe_channel_name,
+                    "folder_id": folder_id,
+                    "oldest_ts": oldest_ts,
+                    "latest_ts": latest_ts,
+                }
             )
 
+        # Export files are only fsynced one by one when SLACKFEEDER_DURABLE is set; otherwise
+        # a single directory sync after the loop replaces a barrier per file
+        durable_writes = durable_writes_enabled()
+        files_written = False
+        # --compress-output writes .txt.gz files; Drive uploads are built from the
+        # messages themselves and are not affected
+        compress_output = args.compress_output
+        export_suffix = ".txt.gz" if compress_output else ".txt"
+
+        for job, history in _iter_prefetched_histories(
+            slack_client, export_jobs, HISTORY_PREFETCH_WORKERS
+        ):
+            channel_info = job["channel_info"]
+            channel_id = job["channel_id"]
+            channel_name = job["channel_name"]
+            sanitized_folder_name = job["sanitized_folder_name"]
+            safe_channel_name = job["safe_channel_name"]
+            folder_id = job["folder_id"]
+            oldest_ts = job["oldest_ts"]
+            latest_ts = job["latest_ts"]
+
+            logger.info(f"--- Exporting conversation: {channel_name} ({channel_id}) ---")
+
             if history is None:
                 logger.error(
                     f"Failed to fetch history for {channel_name} ({channel_id}) - API error"
@@ -430,44 +708,6 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 stats["failed"] += 1
                 continue
 
-            # --- Orphan Thread Detection & Fetching ---
-            # Identify replies whose root messages are missing from the current history batch
-            # (i.e., threads that started before the export window but have activity now)
-            if history:
-                messages_by_ts = {msg.get("ts"): msg for msg in history if msg.get("ts")}
-                orphan_threads = set()
-
-                for msg in history:
-                    thread_ts = msg.get("thread_ts")
-                    ts = msg.get("ts")
-                    
-                    # Check if it's a reply (has thread_ts and it differs from its own ts)
-                    if thread_ts and ts != thread_ts:
-                        # If the parent thread_ts is NOT in our current message set, it's an orphan reply
-                        if thread_ts not in messages_by_ts:
-                            orphan_threads.add(thread_ts)
-
-                if orphan_threads:
-                    logger.info(f"Found {len(orphan_threads)} active threads starting before export window. Fetching full context...")
-                    
-                    for thread_ts in orphan_threads:
-                        logger.info(f"Fetching full history for active thread {thread_ts}...")
-                        thread_messages = slack_client.fetch_thread_history(channel_id, thread_ts)
-                        
-                        if thread_messages:
-                            # Add messages to history, avoiding duplicates
-                            for t_msg in thread_messages:
-                                t_ts = t_msg.get("ts")
-                                if t_ts and t_ts not in messages_by_ts:
-                                    history.append(t_msg)
-                                    messages_by_ts[t_ts] = t_msg # Update lookup
-                        else:
-                            logger.warning(f"Failed to fetch thread {thread_ts}")
-
-                    # Re-sort history after adding thread messages
-                    history.sort(key=lambda x: float(x.get("ts", 0)))
-                    logger.info(f"Export history expanded to {len(history)} messages after active thread retrieval")
-
             if len(history) == 0:
                 logger.info(
                     f"No messages found for {channel_name} ({channel_id}) in specified date range"
@@ -483,6 +723,11 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 stats["skipped"] += 1
                 continue
 
+            # Export timestamps are formatted once per channel and shared by every file written
+            export_now = datetime.now(timezone.utc)
+            export_date = export_now.strftime("%Y-%m-%d %H:%M:%S UTC")
+            export_datetime = export_now.strftime("%Y-%m-%d_%H-%M-%S")
+
             # Warn about large conversations
             if len(history) > LARGE_CONVERSATION_THRESHOLD:
                 logger.warning(
@@ -507,11 +752,11 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 # Update stats with upload results
                 stats.update(upload_stats)
 
-                # Get folder ID for sharing (needed for share_folder_with_members)
-                sanitized_folder_name = sanitized_names["folder"]
-                folder_id = google_drive_client.create_folder(
-                    sanitized_folder_name, google_drive_folder_id
-                )
+                # Get folder ID for sharing (resolved above for the incremental check)
+                if not folder_id:
+                    folder_id = google_drive_client.create_folder(
+                        sanitized_folder_name, google_drive_folder_id
+                    )
 
                 if folder_id:
                     # Share folder with members
@@ -545,61 +790,55 @@ def main(args: argparse.Namespace, mcp_evaluate_script: Callable = None, mcp_cli
                 logger.info(f"Split into {len(chunks)} monthly chunk(s)")
 
                 # Process each chunk
-                chunk_files = []
                 for chunk_idx, (chunk_start, chunk_end, chunk_messages) in enumerate(chunks, 1):
+                    # Per-chunk and per-day lines use lazy %-formatting so they cost nothing
+                    # when INFO is disabled
                     logger.info(
-                        f"Processing chunk {chunk_idx}/{len(chunks)}: {chunk_start.strftime('%Y-%m')} ({len(chunk_messages)} messages)"
+                        "Processing chunk %d/%d: %04d-%02d (%d messages)",
+                        chunk_idx,
+                        len(chunks),
+                        chunk_start.year,
+                        chunk_start.month,
+                        len(chunk_messages),
                     )
 
-                    processed_history = preprocess_history(
+                    # Formatted lines are streamed straight to disk, like the single-file export
+                    processed_lines = iter_preprocess_history(
                         chunk_messages, slack_client, people_cache
                     )
+                    first_line = next(processed_lines, None)
 
                     # Check for empty history after processing
-                    if not processed_history or not processed_history.strip():
+                    if first_line is None:
                         logger.warning(
                             f"No processable content found for chunk {chunk_idx} of {channel_name}. Skipping."
                         )
                         continue
 
                     # Add metadata header for chunk
-                    export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
                     date_range_str = (
                         f"{chunk_start.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}"
                     )
-                    metadata_header = f"""Slack Conversation Export
-Channel: {channel_name}
-Channel ID: {channel_id}
-Export Date: {export_date}
-Date Range: {date_range_str}
-Total Messages: {len(chunk_messages)}
-Chunk: {chunk_idx} of {len(chunks)}
-
-{'='*80}
+                    metadata_header = build_metadata_header(
+                        channel_name,
+                        channel_id,
+                        export_date,
+                        len(chunk_messages),
+                        date_range=date_range_str,
+                        chunk=(chunk_idx, len(chunks)),
+                    )
 
-"""
-                    processed_history = metadata_header + processed_history
-
-                    # Estimate file size
-                    estimated_size = estimate_file_size(processed_history)
-                    if effective_max_file_size and estimated_size > effective_max_file_size:
-                        logger.warning(
-                            f"Estimated file size ({estimated_size / 1024 / 1024:.2f} MB) exceeds maximum ({effective_max_file_size / 1024 / 1024:.2f} MB) for chunk {chunk_idx}. File will still be created."
-                        )
+                    # The body is never materialized, so the size check happens after the write below
 
                     # Create filename with date range
-                    safe_channel_name = sanitized_names["file"]
                     month_str = chunk_start.strftime("%Y-%m")
-                    export_datetime = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
                     output_filename = (
-                        f"{safe_channel_name}_history_{month_str}_{export_datetime}.txt"
+                        f"{safe_channel_name}_history_{month_str}_{export_datetime}{export_suffix}"
                     )
-                    output_filepath = os.path.join(output_dir, output_filename)
+                    output_filepath = out_prefix + output_filename
 
                     # Additional safety check - ensure path is within output_dir
-                    abs_output_dir = os.path.abspath(output_dir)
-                    abs_output_filepath = os.path.abspath(output_filepath)
-                    if not abs_output_filepath.startswith(abs_output_dir):
+                    if not _is_within_directory(output_filepath, out_prefix):
                         logger.error(
                             f"Invalid file path detected: {output_filepath}. Skipping chunk {chunk_idx}."
                         )
@@ -607,18 +846,23 @@ Chunk: {chunk_idx} of {len(chunks)}
                         continue
 
                     try:
-                        with open(output_filepath, "w", encoding="utf-8") as f:
-                            f.write(processed_history)
-                            f.flush()
-                            os.fsync(f.fileno())  # Ensure data is written to disk
-
-                        # Verify file was written successfully and check size
-                        if not os.path.exists(output_filepath):
+                        with _open_export_file(output_filepath, compress_output) as f:
+                            f.write(metadata_header)
+                            f.write(first_line)
+                            f.writelines(processed_lines)
+                            if durable_writes:
+                                f.flush()
+                                os.fsync(f.fileno())  # Ensure data is written to disk
+
+                        # Verify file was written successfully and check size; a single stat
+                        # answers both (getsize raises if the file is missing)
+                        try:
+                            file_size = os.path.getsize(output_filepath)
+                        except OSError:
                             logger.error(f"File write verification failed for {output_filepath}")
                             stats["failed"] += 1
                             continue
 
-                        file_size = os.path.getsize(output_filepath)
                         if file_size == 0:
                             logger.error(
                                 f"File write verification failed - empty file: {output_filepath}"
@@ -631,11 +875,14 @@ Chunk: {chunk_idx} of {len(chunks)}
                                 f"File size ({file_size / 1024 / 1024:.2f} MB) exceeds maximum ({effective_max_file_size / 1024 / 1024:.2f} MB) for {output_filepath}. File created but may cause issues."
                             )
 
-                        chunk_files.append((output_filepath, chunk_messages))
+                        files_written = True
                         stats["processed"] += 1
                         stats["total_messages"] += len(chunk_messages)
                         logger.info(
-                            f"Saved chunk {chunk_idx} to {output_filepath} ({file_size / 1024 / 1024:.2f} MB)"
+                            "Saved chunk %d to %s (%.2f MB)",
+                            chunk_idx,
+                            output_filepath,
+                            file_size / BYTES_PER_MB,
                         )
                     except IOError as e:
                         logger.error(f"Failed to write file {output_filepath}: {e}")
@@ -648,68 +895,15 @@ Chunk: {chunk_idx} of {len(chunks)}
                         stats["failed"] += 1
                         continue
 
-                # Upload chunked files to Drive if requested
-                if args.upload_to_drive and chunk_files:
-                    sanitized_folder_name = sanitized_names["folder"]
-                    safe_channel_name = sanitized_names["file"]
-                    folder_id = google_drive_client.create_folder(
-                        sanitized_folder_name, google_drive_folder_id
-                    )
-                    if folder_id:
-                        for chunk_filepath, chunk_messages in chunk_files:
-                            # Read the file content
-                            try:
-                                with open(chunk_filepath, "r", encoding="utf-8") as f:
-                                    doc_content = f.read()
-
-                                # Extract doc name from filename (remove .txt extension)
-                                doc_name = os.path.basename(chunk_filepath).replace(".txt", "")
-
-                                # Create or update Google Doc
-                                doc_id = google_drive_client.create_or_update_google_doc(
-                                    doc_name, doc_content, folder_id, overwrite=False
-                                )
-                                if not doc_id:
-                                    logger.error(
-                                        f"Failed to create Google Doc for chunk {chunk_filepath}"
-                                    )
-                                    stats["upload_failed"] += 1
-                                else:
-                                    stats["uploaded"] += 1
-                            except IOError as e:
-                                logger.error(f"Failed to read chunk file {chunk_filepath}: {e}")
-                                stats["upload_failed"] += 1
-
-                        # Save export metadata with latest timestamp from all chunks
-                        if history:
-                            latest_message_ts = max(float(msg.get("ts", 0)) for msg in history)
-                            google_drive_client.save_export_metadata(
-                                folder_id, safe_channel_name, str(latest_message_ts)
-                            )
-                            logger.info(f"Saved export metadata for {channel_name}")
-
-                        # Share folder with members
-                        share_folder_with_members(
-                            google_drive_client,
-                            folder_id,
-                            slack_client,
-                            channel_id,
-                            channel_name,
-                            channel_info,
-                            no_notifications_set,
-                            no_share_set,
-                            stats,
-                            sanitized_folder_name=sanitized_names["folder"],
-                            people_cache=people_cache,
-                            people_json=people_json,
-                        )
-                    continue  # Skip single file processing for chunked exports
+                # The chunks are the export; skip the single-file writer below
+                continue
 
-            # Single file export (non-chunked)
-            processed_history = preprocess_history(history, slack_client, people_cache)
+            # Single file export (non-chunked) - formatted lines are streamed straight to disk
+            processed_lines = iter_preprocess_history(history, slack_client, people_cache)
+            first_line = next(processed_lines, None)
 
             # Check for empty history after processing
-            if not processed_history or not processed_history.strip():
+            if first_line is None:
                 logger.warning(
                     f"No processable content found for {channel_name}. Skipping file creation."
                 )
@@ -717,52 +911,39 @@ Chunk: {chunk_idx} of {len(chunks)}
                 continue
 
             # Add metadata header
-            export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-            metadata_header = f"""Slack Conversation Export
-Channel: {channel_name}
-Channel ID: {channel_id}
-Export Date: {export_date}
-Total Messages: {len(history)}
-
-{'='*80}
-
-"""
-            processed_history = metadata_header + processed_history
+            metadata_header = build_metadata_header(
+                channel_name, channel_id, export_date, len(history)
+            )
 
-            # Estimate file size before writing
-            estimated_size = estimate_file_size(processed_history)
-            if effective_max_file_size and estimated_size > effective_max_file_size:
-                logger.warning(
-                    f"Estimated file size ({estimated_size / 1024 / 1024:.2f} MB) exceeds maximum ({effective_max_file_size / 1024 / 1024:.2f} MB). File will still be created."
-                )
+            # The body is never materialized, so the size check happens after the write below
 
-            # Use cached sanitized names
-            safe_channel_name = sanitized_names["file"]
-            export_datetime = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
-            output_filename = f"{safe_channel_name}_history_{export_datetime}.txt"
-            output_filepath = os.path.join(output_dir, output_filename)
+            output_filename = f"{safe_channel_name}_history_{export_datetime}{export_suffix}"
+            output_filepath = out_prefix + output_filename
 
             # Additional safety check - ensure path is within output_dir
-            abs_output_dir = os.path.abspath(output_dir)
-            abs_output_filepath = os.path.abspath(output_filepath)
-            if not abs_output_filepath.startswith(abs_output_dir):
+            if not _is_within_directory(output_filepath, out_prefix):
                 logger.error(f"Invalid file path detected: {output_filepath}. Skipping.")
                 stats["failed"] += 1
                 continue
 
             try:
-                with open(output_filepath, "w", encoding="utf-8") as f:
-                    f.write(processed_history)
-                    f.flush()
-                    os.fsync(f.fileno())  # Ensure data is written to disk
+                with _open_export_file(output_filepath, compress_output) as f:
+                    f.write(metadata_header)
+                    f.write(first_line)
+                    f.writelines(processed_lines)
+                    if durable_writes:
+                        f.flush()
+                        os.fsync(f.fileno())  # Ensure data is written to disk
 
-                # Verify file was written successfully and check size
-                if not os.path.exists(output_filepath):
+                # Verify file was written successfully and check size; a single stat
+                # answers both (getsize raises if the file is missing)
+                try:
+                    file_size = os.path.getsize(output_filepath)
+                except OSError:
                     logger.error(f"File write verification failed for {output_filepath}")
                     stats["failed"] += 1
                     continue
 
-                file_size = os.path.getsize(output_filepath)
                 if file_size == 0:
                     logger.error(f"File write verification failed - empty file: {output_filepath}")
                     stats["failed"] += 1
@@ -773,6 +954,7 @@ Total Messages: {len(history)}
                         f"File size ({file_size / 1024 / 1024:.2f} MB) exceeds maximum ({effective_max_file_size / 1024 / 1024:.2f} MB) for {output_filepath}. File created but may cause issues."
                     )
 
+                files_written = True
                 stats["processed"] += 1
                 stats["total_messages"] += len(history)
                 logger.info(f"Saved processed history to {output_filepath}")
@@ -785,71 +967,15 @@ Total Messages: {len(history)}
                 stats["failed"] += 1
                 continue
 
-            if args.upload_to_drive:
-                # Use cached sanitized names
-                sanitized_folder_name = sanitized_names["folder"]
-                safe_channel_name = sanitized_names["file"]
-                folder_id = google_drive_client.create_folder(
-                    sanitized_folder_name, google_drive_folder_id
-                )
-                if folder_id:
-                    # Read the file content
-                    try:
-                        with open(output_filepath, "r", encoding="utf-8") as f:
-                            doc_content = f.read()
-
-                        # Extract doc name from filename (remove .txt extension)
-                        doc_name = os.path.basename(output_filepath).replace(".txt", "")
-
-                        # Create or update Google Doc
-                        doc_id = google_drive_client.create_or_update_google_doc(
-                            doc_name, doc_content, folder_id, overwrite=False
-                        )
-                        if not doc_id:
-                            logger.error(
-                                f"Failed to create Google Doc for {channel_name}. Skipping sharing."
-                            )
-                            stats["upload_failed"] += 1
-                            continue
-
-                        stats["uploaded"] += 1
-                    except IOError as e:
-                        logger.error(f"Failed to read file {output_filepath}: {e}")
-                        stats["upload_failed"] += 1
-                        continue
-
-                    # Save export metadata to Drive (stateless - works in CI/CD)
-                    # Use the latest message timestamp, or current time if no messages
-                    if history:
-                        latest_message_ts = max(float(msg.get("ts", 0)) for msg in history)
-                        google_drive_client.save_export_metadata(
-                            folder_id, safe_channel_name, str(latest_message_ts)
-                        )
-                        logger.info(f"Saved export metadata for {channel_name}")
-                    else:
-                        google_drive_client.save_export_metadata(
-                            folder_id,
-                            safe_channel_name,
-                            str(datetime.now(timezone.utc).timestamp()),
-                        )
-
-                    # Share with members
-                    share_folder_with_members(
-                        google_drive_client,
-                        folder_id,
-                        slack_client,
-                        channel_id,
-                        channel_name,
-                        channel_info,
-                        no_notifications_set,
-                        no_share_set,
-                        stats,
-                        sanitized_folder_name=sanitized_names["folder"],
-                    )
+        if files_written:
+            fsync_directory(output_dir)
 
         # Log processing statistics
         log_statistics(stats, args.upload_to_drive)
 
+        # Persist users resolved during this run so the next run starts warm
+        save_people_cache(people_cache, known_user_ids, slack_client.user_cache)
+
     elif args.browser_export_dm:
         # Handle browser-based DM export
         # This uses the same code path as --export-history but extracts messages directly from DOM
@@ -940,6 +1066,8 @@ Total Messages: {len(history)}
             )
         
         # If --select-conversation is enabled, select conversation from sidebar
+        sidebar_executor = None
+        sidebar_future = None
         if args.select_conversation:
             if not args.browser_conversation_id:
                 logger.warning("--select-conversation enabled but no conversation ID found. Skipping selection.")
@@ -948,12 +1076,15 @@ Total Messages: {len(history)}
                 logger.info(f"Selecting conversation {args.browser_conversation_id} from sidebar...")
                 # Note: Actual selection will be done by agent using MCP chrome-devtools tools
                 # This is a placeholder - the agent should implement the selection logic
-                # If selection fails, the agent should log a warning but continue with extraction
-                try:
-                    select_conversation_from_sidebar(args.browser_conversation_id, mcp_click=mcp_click, mcp_evaluate_script=mcp_evaluate_script)
-                except Exception as e:
-                    logger.warning(f"Failed to select conversation from sidebar: {e}", exc_info=True)
-                    logger.warning("Continuing with extraction - ensure browser is positioned on the correct conversation.")
+                # Selection runs in the background so the stdin read/parse below overlaps with
+                # browser latency. The result is awaited before any further browser or Drive work.
+                sidebar_executor = ThreadPoolExecutor(max_workers=1)
+                sidebar_future = sidebar_executor.submit(
+                    select_conversation_from_sidebar,
+                    args.browser_conversation_id,
+                    mcp_click=mcp_click,
+                    mcp_evaluate_script=mcp_evaluate_script,
+                )
 
         logger.info("Browser-based DM export mode (DOM extraction)")
         logger.info(f"Conversation name: {conversation_name}")
@@ -970,22 +1101,7 @@ Total Messages: {len(history)}
         # Read messages from stdin (required - no file fallback)
         if sys.stdin.isatty():  # stdin is a TTY (no data piped)
             logger.error("No messages provided. Messages must be piped via stdin.")
-            logger.info("")
-            logger.info("To extract messages from DOM:")
-            logger.info("1. Open Slack in a browser and navigate to the conversation")
-            logger.info("2. Scroll to load all messages in the date range")
-            logger.info("3. Use MCP chrome-devtools tools to run DOM extraction")
-            logger.info("   Example: Use mcp_chrome-devtools_evaluate_script with extract_messages_from_dom_script()")
-            logger.info("4. Pipe JSON to this script:")
-            logger.info("   python scripts/extract_dom_messages.py --output-to-stdout | \\")
-            logger.info("     python src/main.py --browser-export-dm --browser-conversation-name 'Name' --upload-to-drive")
-            logger.info("")
-            logger.info("Browser exports use the same file conventions as --export-history:")
-            logger.info("  - File naming: {conversation_name} slack messages {YYYYMMDD}")
-            logger.info("  - Same grouping and formatting logic")
-            logger.info("  - No intermediate files needed")
-            logger.info("")
-            logger.info("See ReadMe.md for detailed instructions.")
+            sys.stderr.write(_STDIN_USAGE_HELP)
             sys.exit(1)
         
         try:
@@ -996,7 +1112,11 @@ Total Messages: {len(history)}
                 sys.exit(1)
             
             response_data = json.loads(stdin_data)
+            # Release the raw JSON text as soon as it is parsed so it isn't held
+            # alongside the parsed messages for the rest of the export
+            del stdin_data
             main_conversation_messages = response_data.get("messages", [])
+            del response_data
             logger.info(f"Loaded {len(main_conversation_messages)} messages from stdin")
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from stdin: {e}")
@@ -1014,6 +1134,17 @@ Total Messages: {len(history)}
             main_conversation_messages = processor._filter_by_conversation_participants(main_conversation_messages, conversation_name)
             if not main_conversation_messages:
                 logger.warning("No messages found after filtering main conversation by participants.")
+
+        # Wait for sidebar selection before thread extraction or Drive calls
+        # If selection fails, log a warning but continue with extraction
+        if sidebar_future is not None:
+            try:
+                sidebar_future.result(timeout=SIDEBAR_SELECTION_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning(f"Failed to select conversation from sidebar: {e}", exc_info=True)
+                logger.warning("Continuing with extraction - ensure browser is positioned on the correct conversation.")
+            finally:
+                sidebar_executor.shutdown(wait=False)
         
         # --- Handle Active Thread Extraction ---
         active_thread_messages = []
@@ -1057,6 +1188,7 @@ Total Messages: {len(history)}
                         logger.error(f"Invalid credentials file path: {sanitize_path_for_logging(str(e))}")
                         sys.exit(1)
 
+                    from src.google_drive import GoogleDriveClient
                     archive_drive_client = GoogleDriveClient(google_drive_credentials_file)
                     sanitized_folder_name = sanitize_folder_name(conversation_name)
                     archive_folder_id = archive_drive_client.create_folder(
@@ -1109,15 +1241,21 @@ Total Messages: {len(history)}
                 logger.warning("--extract-historical-threads is only supported with --upload-to-drive.")
 
         # Combine and deduplicate all messages from main conversation and active threads
+        # Thread messages are chained rather than concatenated, and the combined list is
+        # built once by sorted() - no intermediate copies of the message lists are made
         all_messages_map = {msg.get("ts"): msg for msg in main_conversation_messages if msg.get("ts")}
-        for msg in active_thread_messages + historical_thread_messages:
+        for msg in chain(active_thread_messages, historical_thread_messages):
             ts = msg.get("ts")
             if ts and ts not in all_messages_map:
                 all_messages_map[ts] = msg
-        all_messages = list(all_messages_map.values())
-        
+
         # Sort combined messages chronologically
-        all_messages.sort(key=lambda m: float(m.get("ts", 0)))
+        # Timestamps are parsed once here and reused by sorting, filtering and grouping
+        all_messages = sorted(
+            annotate_timestamps(list(all_messages_map.values())),
+            key=lambda m: m[TS_FLOAT_KEY] or 0.0,
+        )
+        del all_messages_map, main_conversation_messages, active_thread_messages, historical_thread_messages
         
         if not all_messages:
             logger.warning("No messages found from main conversation or active threads.")
@@ -1153,6 +1291,7 @@ Total Messages: {len(history)}
                 logger.error(f"Invalid credentials file path: {sanitize_path_for_logging(str(e))}")
                 sys.exit(1)
 
+            from src.google_drive import GoogleDriveClient
             browser_google_drive_client = GoogleDriveClient(google_drive_credentials_file)
             sanitized_folder_name = sanitize_folder_name(conversation_name)
             safe_conversation_name = sanitize_filename(conversation_name)
@@ -1232,6 +1371,7 @@ Total Messages: {len(history)}
                     logger.error(f"Invalid credentials file path: {sanitize_path_for_logging(str(e))}")
                     sys.exit(1)
 
+                from src.google_drive import GoogleDriveClient
                 browser_google_drive_client = GoogleDriveClient(google_drive_credentials_file)
                 sanitized_folder_name = sanitize_folder_name(conversation_name)
                 safe_conversation_name = sanitize_filename(conversation_name)
@@ -1296,13 +1436,11 @@ Total Messages: {len(history)}
 
         else:
             # Local file export - use same logic as main export but write to files
-            # Group messages by date
-            daily_groups = group_messages_by_date(all_messages)
-            logger.info(
-                f"Grouped {len(all_messages)} messages into {len(daily_groups)} daily group(s)"
-            )
+            # Stream messages one day at a time, in date order; peek to detect empty input
+            daily_groups = iter_messages_by_date(all_messages)
+            first_day = next(daily_groups, None)
 
-            if not daily_groups:
+            if first_day is None:
                 logger.warning("No messages found to export")
                 sys.exit(1)
 
@@ -1315,10 +1453,17 @@ Total Messages: {len(history)}
                 "total_messages": 0,
             }
 
-            sorted_dates = sorted(daily_groups.keys())
-            for date_key in sorted_dates:
-                daily_messages = daily_groups[date_key]
-                logger.info(f"Processing {len(daily_messages)} messages for date {date_key}")
+            # output_dir is always a directory, so plain concatenation replaces os.path.join
+            out_prefix = output_dir.rstrip(os.sep) + os.sep
+            # One directory sync after the loop replaces a barrier per daily file
+            durable_writes = durable_writes_enabled()
+            export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+            safe_conversation_name = sanitize_filename(conversation_name)
+
+            day_count = 0
+            for date_key, daily_messages in chain((first_day,), daily_groups):
+                day_count += 1
+                logger.info("Processing %d messages for date %s", len(daily_messages), date_key)
 
                 # Process messages - use preprocess_history with use_display_names=True
                 processed_messages = preprocess_history(
@@ -1332,36 +1477,31 @@ Total Messages: {len(history)}
                     continue
 
                 # Add metadata header (same format as main export)
-                export_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-                date_obj = datetime.strptime(date_key, "%Y%m%d").replace(tzinfo=timezone.utc)
-                date_display = date_obj.strftime("%Y-%m-%d")
-                metadata_header = f"""Slack Conversation Export
-Channel: {conversation_name}
-Channel ID: [Browser Export - No ID]
-Export Date: {export_date}
-Date: {date_display}
-Total Messages: {len(daily_messages)}
-
-{'='*80}
-
-"""
-                processed_messages = metadata_header + processed_messages
+                date_display = f"{date_key[:4]}-{date_key[4:6]}-{date_key[6:]}"
+                metadata_header = build_metadata_header(
+                    conversation_name,
+                    None,
+                    export_date,
+                    len(daily_messages),
+                    date_display=date_display,
+                )
 
                 # Create filename - same convention as main export
-                safe_conversation_name = sanitize_filename(conversation_name)
                 output_filename = f"{safe_conversation_name}_history_{date_key}.txt"
-                output_filepath = os.path.join(output_dir, output_filename)
+                output_filepath = out_prefix + output_filename
 
                 # Write file
                 try:
                     with open(output_filepath, "w", encoding="utf-8") as f:
+                        f.write(metadata_header)
                         f.write(processed_messages)
-                        f.flush()
-                        os.fsync(f.fileno())
+                        if durable_writes:
+                            f.flush()
+                            os.fsync(f.fileno())
                     
                     stats["processed"] += 1
                     stats["total_messages"] += len(daily_messages)
-                    logger.info(f"Saved processed history to {output_filepath}")
+                    logger.info("Saved processed history to %s", output_filepath)
                 except IOError as e:
                     logger.error(f"Failed to write file {output_filepath}: {e}")
                     continue
@@ -1369,10 +1509,18 @@ Total Messages: {len(daily_messages)}
                     logger.error(f"Unexpected error writing file {output_filepath}: {e}", exc_info=True)
                     continue
 
-            logger.info(f"Export complete: {stats['total_messages']} messages across {len(daily_groups)} dates")
+            if stats["processed"]:
+                fsync_directory(output_dir)
 
+            logger.info(f"Export complete: {stats['total_messages']} messages across {day_count} dates")
 
-if __name__ == "__main__":
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser used when running this module as a script.
+
+    Returns:
+        Configured argparse.ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="Export Slack conversations and upload to Google Drive."
     )
@@ -1399,6 +1547,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable bulk export mode: overrides limits and automatically chunks large exports into monthly files.",
     )
+    parser.add_argument(
+        "--compress-output",
+        action="store_true",
+        help="Write exported history as gzip-compressed .txt.gz files.",
+    )
     parser.add_argument(
         "--browser-export-dm",
         action="store_true",
@@ -1462,6 +1615,11 @@ if __name__ == "__main__":
     # Set default to True after adding both arguments
     parser.set_defaults(select_conversation=True)
 
+    return parser
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser()
     args = parser.parse_args()
 
     if args.setup_drive_auth:
@@ -1477,26 +1635,14 @@ if __name__ == "__main__":
             google_drive_credentials_file = os.path.abspath(
                 os.path.expanduser(google_drive_credentials_file)
             )
-            if not os.path.exists(google_drive_credentials_file):
-                logger.error(
-                    f"Credentials file not found: {sanitize_path_for_logging(google_drive_credentials_file)}"
-                )
-                sys.exit(1)
-            if not os.path.isfile(google_drive_credentials_file):
-                logger.error(
-                    f"Credentials path is not a file: {sanitize_path_for_logging(google_drive_credentials_file)}"
-                )
-                sys.exit(1)
-            if not os.access(google_drive_credentials_file, os.R_OK):
-                logger.error(
-                    f"Credentials file is not readable: {sanitize_path_for_logging(google_drive_credentials_file)}"
-                )
+            if not _check_credentials_file(google_drive_credentials_file):
                 sys.exit(1)
         except (OSError, ValueError) as e:
             logger.error(f"Invalid credentials file path: {sanitize_path_for_logging(str(e))}")
             sys.exit(1)
 
         try:
+            from src.google_drive import GoogleDriveClient
             token_path = GoogleDriveClient.setup_authentication(google_drive_credentials_file)
             logger.info("=" * 80)
             logger.info("Google Drive authentication setup complete!")
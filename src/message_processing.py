@@ -1,10 +1,14 @@
 """
 Message processing utilities for formatting, grouping, and preprocessing Slack messages.
 """
+import io
 import re
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from calendar import monthrange
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import groupby, islice
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Set, Tuple
 
 from src.utils import format_timestamp
 from src.slack_client import SlackClient
@@ -13,6 +17,96 @@ from src.slack_client import SlackClient
 SECONDS_PER_DAY = 86400  # Seconds in a day
 CHUNK_DATE_RANGE_DAYS = 30  # Chunk if date range exceeds this
 CHUNK_MESSAGE_THRESHOLD = 10000  # Chunk if message count exceeds this
+EXPORT_SEPARATOR = "=" * 80  # Line after a metadata header and between appended batches
+
+# Pattern to match Slack user mentions: <@U...> or @U...
+# User IDs start with U and are followed by alphanumeric characters
+_MENTION_RE = re.compile(r"<@(U[A-Z0-9]+)>|@(U[A-Z0-9]+)")
+
+# Key under which annotate_timestamps stores each message's parsed ts (float, or None if invalid)
+TS_FLOAT_KEY = "_ts"
+
+
+def _parse_ts(ts_value: Any) -> Optional[float]:
+    """Parse a Slack ts value to a float, returning None if it is missing or malformed."""
+    if not ts_value:
+        return None
+    try:
+        return float(ts_value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _message_ts(message: Dict[str, Any]) -> Optional[float]:
+    """Return a message's ts as a float, using the annotate_timestamps value when present."""
+    if TS_FLOAT_KEY in message:
+        return message[TS_FLOAT_KEY]
+    return _parse_ts(message.get("ts"))
+
+
+def annotate_timestamps(history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Parse every message's ts once and store it under TS_FLOAT_KEY.
+
+    Grouping, filtering, chunking and sorting helpers read the stored value instead of
+    re-parsing the ts string in each pass. Messages are updated in place.
+
+    Args:
+        history: List of message dictionaries
+
+    Returns:
+        The same list, for chaining
+    """
+    for message in history:
+        message[TS_FLOAT_KEY] = _parse_ts(message.get("ts"))
+    return history
+
+
+def latest_message_timestamp(history: List[Dict[str, Any]]) -> float:
+    """Return the newest message timestamp in a history.
+
+    Args:
+        history: List of message dictionaries (annotated or not)
+
+    Returns:
+        Largest parseable ts as a float, or 0.0 if no message has one
+    """
+    return max(
+        (ts for ts in map(_message_ts, history) if ts is not None),
+        default=0.0,
+    )
+
+
+def resolve_display_name(
+    user_id: str,
+    slack_client: Optional[SlackClient],
+    people_cache: Optional[Dict[str, str]] = None,
+    default: Optional[str] = None,
+) -> Optional[str]:
+    """Resolve a Slack user ID to a display name, consulting people_cache first.
+
+    Successful lookups are written back to people_cache. Failed lookups are not, but
+    SlackClient caches them (as None), so an unknown ID only reaches the API once.
+
+    Args:
+        user_id: Slack user ID
+        slack_client: SlackClient instance for looking up user info
+        people_cache: Optional cache dictionary mapping user IDs to display names
+        default: Name to use if the user info has no displayName (defaults to user_id)
+
+    Returns:
+        Display name, or None if the user could not be resolved
+    """
+    if people_cache and user_id in people_cache:
+        return people_cache[user_id]
+
+    user_info = slack_client.get_user_info(user_id) if slack_client else None
+    if not user_info:
+        return None
+
+    display_name = user_info.get("displayName", default if default is not None else user_id)
+    if people_cache is not None:
+        people_cache[user_id] = display_name
+    return display_name
 
 
 def replace_user_ids_in_text(
@@ -34,39 +128,55 @@ def replace_user_ids_in_text(
     Returns:
         Text with user IDs replaced by display names
     """
-    if not text:
+    # Most messages contain no mentions - skip the regex engine entirely
+    if not text or "@" not in text:
         return text
 
-    # Pattern to match Slack user mentions: <@U...> or @U...
-    # User IDs start with U and are followed by alphanumeric characters
-    pattern = r"<@(U[A-Z0-9]+)>|@(U[A-Z0-9]+)"
-
-    def replace_match(match: re.Match) -> str:
+    # Build the result from slices with finditer - avoids a Python callback frame per match
+    parts = []
+    last_end = 0
+    for match in _MENTION_RE.finditer(text):
         # Extract user ID from either capture group
         user_id = match.group(1) or match.group(2)
-        if not user_id:
-            return match.group(0)  # Return original if no match
+        # If user lookup fails, keep the original ID
+        display_name = resolve_display_name(user_id, slack_client, people_cache) or user_id
+        parts.append(text[last_end : match.start()])
+        # Replace with @DisplayName format to preserve mention context
+        parts.append(f"@{display_name}")
+        last_end = match.end()
 
-        # Check cache first
-        if people_cache and user_id in people_cache:
-            display_name = people_cache[user_id]
-        else:
-            # Look up user info
-            user_info = slack_client.get_user_info(user_id)
-            if user_info:
-                display_name = user_info.get("displayName", user_id)
-                # Update cache for future use
-                if people_cache is not None:
-                    people_cache[user_id] = display_name
-            else:
-                # If user lookup fails, keep the original ID
-                display_name = user_id
+    if not parts:
+        return text
+    parts.append(text[last_end:])
+    return "".join(parts)
 
-        # Replace with @DisplayName format to preserve mention context
-        return f"@{display_name}"
 
-    # Replace all matches
-    return re.sub(pattern, replace_match, text)
+def _collect_user_ids(history_data: List[Dict[str, Any]]) -> Set[str]:
+    """Collect every user ID referenced by messages, as authors or in mentions.
+
+    Args:
+        history_data: List of message dictionaries
+
+    Returns:
+        Set of unique Slack user IDs
+    """
+    user_ids: Set[str] = set()
+    for message in history_data:
+        user_id = message.get("user")
+        if user_id:
+            user_ids.add(user_id)
+        text = message.get("text")
+        if text and "@" in text:
+            for bracketed_id, bare_id in _MENTION_RE.findall(text):
+                user_ids.add(bracketed_id or bare_id)
+    return user_ids
+
+
+def _utc_date_key(ts: float) -> str:
+    """Return the UTC calendar day of an epoch timestamp as YYYYMMDD."""
+    # time.gmtime is much cheaper than building a tz-aware datetime and calling strftime
+    tm = time.gmtime(ts)
+    return f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
 
 
 def group_messages_by_date(
@@ -80,42 +190,64 @@ def group_messages_by_date(
     Returns:
         Dictionary mapping date strings (YYYYMMDD) to lists of messages
     """
-    daily_groups: Dict[str, List[Dict[str, Any]]] = {}
+    daily_groups: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+    last_ts_by_date: Dict[str, float] = {}
+    unsorted_dates: Set[str] = set()
 
     for message in history:
-        ts_str = message.get("ts")
-        if not ts_str:
+        ts = _message_ts(message)
+        if ts is None or ts <= 0:
             continue
 
-        try:
-            ts = float(ts_str)
-            if ts <= 0:
-                continue
-        except (ValueError, TypeError):
-            continue
+        date_key = _utc_date_key(ts)
 
-        msg_date = datetime.fromtimestamp(ts, tz=timezone.utc)
-        date_key = msg_date.strftime("%Y%m%d")
-
-        if date_key not in daily_groups:
-            daily_groups[date_key] = []
+        # Track ordering so only days that actually arrived out of order get sorted
+        if ts < last_ts_by_date.get(date_key, ts):
+            unsorted_dates.add(date_key)
+        else:
+            last_ts_by_date[date_key] = ts
 
         daily_groups[date_key].append(message)
 
-    # Sort messages within each day by timestamp
-    for date_key in daily_groups:
-        daily_groups[date_key].sort(key=lambda x: float(x.get("ts", 0)))
+    for date_key in unsorted_dates:
+        daily_groups[date_key].sort(key=lambda x: _message_ts(x) or 0.0)
 
-    return daily_groups
+    return dict(daily_groups)
 
 
-def preprocess_history(
+def iter_messages_by_date(
+    history: List[Dict[str, Any]],
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Yield (YYYYMMDD, messages) pairs in date order, one day at a time.
+
+    Streaming counterpart of group_messages_by_date: only the day being consumed has
+    its own list, so callers that write one file or doc per day never hold every
+    day's group at once. Messages without a valid ts are skipped.
+
+    Args:
+        history: List of messages with 'ts' timestamps
+
+    Returns:
+        Iterator of (date key, messages sorted by timestamp) tuples
+    """
+    dated = [message for message in history if (_message_ts(message) or 0.0) > 0]
+    # Stable sort, and linear for history that is already in timestamp order
+    dated.sort(key=_message_ts)
+    for date_key, day_messages in groupby(dated, key=lambda m: _utc_date_key(_message_ts(m))):
+        yield date_key, list(day_messages)
+
+
+def iter_preprocess_history(
     history_data: List[Dict[str, Any]],
     slack_client: Optional[SlackClient],
     people_cache: Optional[Dict[str, str]] = None,
     use_display_names: bool = False,
-) -> str:
-    """Processes Slack history into a human-readable format.
+    presorted: bool = True,
+) -> Iterator[str]:
+    """Processes Slack history into human-readable lines, yielded one at a time.
+
+    Each yielded string ends with a newline, so the output can be streamed straight to a
+    file with writelines() without building the whole export in memory.
     
     Args:
         history_data: List of message dictionaries
@@ -123,19 +255,41 @@ def preprocess_history(
         people_cache: Optional cache dictionary mapping user IDs to display names
         use_display_names: If True, treat 'user' field as display name directly (for browser exports)
                           If False, treat 'user' field as user ID and look up display name (API exports)
+        presorted: If True (default), history_data is assumed to be in ascending ts order, as
+                   returned by fetch_conversation_history. Pass False to sort it first.
     """
     from src.utils import setup_logging
     logger = setup_logging()
+
+    if not presorted:
+        history_data = sorted(history_data, key=lambda m: _message_ts(m) or 0.0)
     
-    threads = {}
+    # Loop-invariant: API exports with a client look up user IDs (in text and authors)
+    resolve_user_ids = bool(not use_display_names and slack_client)
+
+    # Resolve all referenced users up front so the loop below is served from cache
+    if resolve_user_ids:
+        user_ids = _collect_user_ids(history_data)
+        if people_cache:
+            user_ids.difference_update(people_cache.keys())
+        if user_ids:
+            slack_client.get_users_info_bulk(user_ids)
+
+    threads: DefaultDict[str, List[Tuple[Any, str, str]]] = defaultdict(list)
     for message in history_data:
-        text = message.get("text", "")
-        files = message.get("files")
+        get = message.get
+        text = get("text", "")
+        files = get("files")
 
         # If no text and no files, skip
         if not text and not files:
             continue
 
+        ts = get("ts")
+        thread_key = get("thread_ts", ts)
+        if not thread_key:
+            continue
+
         # If no text but has files, use a placeholder
         if not text and files:
             text = "[File attached]"
@@ -144,19 +298,10 @@ def preprocess_history(
             text += " [File attached]"
 
         # Replace user IDs in message text with user names (only if not using display names)
-        if not use_display_names and slack_client:
+        if resolve_user_ids:
             text = replace_user_ids_in_text(text, slack_client, people_cache)
 
-        thread_key = message.get("thread_ts", message.get("ts"))
-        if not thread_key:
-            continue
-
-        if thread_key not in threads:
-            threads[thread_key] = []
-
-        ts = message.get("ts")
-
-        user_id = message.get("user")
+        user_id = get("user")
         name = "Unknown User"
         if user_id:
             if use_display_names:
@@ -164,45 +309,82 @@ def preprocess_history(
                 name = user_id
             else:
                 # For API exports, user_id is a Slack user ID (U...)
-                # Check cache first
-                if people_cache and user_id in people_cache:
-                    name = people_cache[user_id]
+                if slack_client or (people_cache and user_id in people_cache):
+                    name = (
+                        resolve_display_name(
+                            user_id,
+                            slack_client,
+                            people_cache,
+                            default=get("username", user_id),
+                        )
+                        or name
+                    )
                 else:
-                    if slack_client:
-                        user_info = slack_client.get_user_info(user_id)
-                        if user_info:
-                            name = user_info.get("displayName", message.get("username", user_id))
-                            # Update cache for future use
-                            if people_cache is not None:
-                                people_cache[user_id] = name
-                    else:
-                        # No slack_client available, use user_id as fallback
-                        name = user_id
-
-        text = text.replace("\n", "\n    ")
+                    # No slack_client available, use user_id as fallback
+                    name = user_id
+
+        # Indent continuation lines; single-line messages (the common case) skip the copy
+        if "\n" in text:
+            text = text.replace("\n", "\n    ")
 
         threads[thread_key].append((ts, name, text))
 
-    sorted_thread_keys = sorted(threads.keys())
-    output_lines = []
-    for thread_key in sorted_thread_keys:
-        messages_in_thread = sorted(threads[thread_key], key=lambda m: m[0])
+    # Input is ts-ordered, so dict insertion order already gives threads by first message
+    # and each thread's messages in ts order - no re-sorting needed
+    for thread_index, messages_in_thread in enumerate(threads.values()):
+        if thread_index:
+            yield "\n"
 
         parent_ts, parent_name, parent_text = messages_in_thread[0]
         formatted_time = format_timestamp(parent_ts)
         if formatted_time is None:
             formatted_time = str(parent_ts) if parent_ts else "[Invalid timestamp]"
-        output_lines.append(f"[{formatted_time}] {parent_name}: {parent_text}")
+        yield f"[{formatted_time}] {parent_name}: {parent_text}\n"
 
-        for reply_ts, reply_name, reply_text in messages_in_thread[1:]:
+        for reply_ts, reply_name, reply_text in islice(messages_in_thread, 1, None):
             formatted_reply_time = format_timestamp(reply_ts)
             if formatted_reply_time is None:
                 formatted_reply_time = str(reply_ts) if reply_ts else "[Invalid timestamp]"
-            output_lines.append(f"    > [{formatted_reply_time}] {reply_name}: {reply_text}")
+            yield f"    > [{formatted_reply_time}] {reply_name}: {reply_text}\n"
+
+        yield "\n"
+
 
-        output_lines.append("\n")
+def preprocess_history(
+    history_data: List[Dict[str, Any]],
+    slack_client: Optional[SlackClient],
+    people_cache: Optional[Dict[str, str]] = None,
+    use_display_names: bool = False,
+    presorted: bool = True,
+) -> str:
+    """Processes Slack history into a human-readable format.
+
+    Thin wrapper around iter_preprocess_history for callers that need the whole export
+    as a single string.
+
+    Args:
+        history_data: List of message dictionaries
+        slack_client: SlackClient instance for looking up user info (can be None if use_display_names=True)
+        people_cache: Optional cache dictionary mapping user IDs to display names
+        use_display_names: If True, treat 'user' field as display name directly (for browser exports)
+        presorted: If False, history_data is sorted by ts before processing
 
-    return "\n".join(output_lines)
+    Returns:
+        Formatted conversation text
+    """
+    # Write lines into a StringIO as they are produced; "".join on a generator would first
+    # collect every line into a temporary list before concatenating
+    buffer = io.StringIO()
+    buffer.writelines(
+        iter_preprocess_history(
+            history_data,
+            slack_client,
+            people_cache,
+            use_display_names=use_display_names,
+            presorted=presorted,
+        )
+    )
+    return buffer.getvalue()
 
 
 def should_chunk_export(
@@ -214,7 +396,7 @@ def should_chunk_export(
     """Determine if export should be chunked based on thresholds.
 
     Args:
-        history: List of messages
+        history: List of messages sorted by timestamp
         oldest_ts: Oldest timestamp (Unix timestamp string)
         latest_ts: Latest timestamp (Unix timestamp string)
         bulk_export: Whether bulk export mode is enabled
@@ -238,115 +420,134 @@ def should_chunk_export(
         if date_range_days > CHUNK_DATE_RANGE_DAYS:
             return True
     elif len(history) > 1:
-        # Calculate date range from messages themselves - use generator for efficiency
-        timestamps_gen = (float(msg.get("ts", 0)) for msg in history if msg.get("ts"))
-        timestamps_list = list(timestamps_gen)
-        if timestamps_list:
-            min_ts = min(timestamps_list)
-            max_ts = max(timestamps_list)
-            date_range_days = (max_ts - min_ts) / SECONDS_PER_DAY
-            if date_range_days > CHUNK_DATE_RANGE_DAYS:
-                return True
+        # History is ts-sorted, so the range comes from the first and last messages in O(1)
+        min_ts = _message_ts(history[0])
+        max_ts = _message_ts(history[-1])
+        if min_ts is None or max_ts is None:
+            return False
+        date_range_days = (max_ts - min_ts) / SECONDS_PER_DAY
+        if date_range_days > CHUNK_DATE_RANGE_DAYS:
+            return True
 
     return False
 
 
-def split_messages_by_month(
+def _month_end(month_start: datetime) -> datetime:
+    """Return the last second of the month that starts at month_start (UTC)."""
+    days_in_month = monthrange(month_start.year, month_start.month)[1]
+    return datetime(
+        month_start.year, month_start.month, days_in_month, 23, 59, 59, tzinfo=timezone.utc
+    )
+
+
+def _iter_months(
     history: List[Dict[str, Any]],
-) -> List[Tuple[datetime, datetime, List[Dict[str, Any]]]]:
-    """Split messages into monthly chunks.
+) -> Iterator[Tuple[datetime, datetime, List[Dict[str, Any]]]]:
+    """Yield monthly chunks of messages as month boundaries are crossed.
 
     Args:
         history: List of messages sorted by timestamp
 
-    Returns:
-        List of tuples: (start_date, end_date, messages_for_month)
+    Yields:
+        Tuples of (start_date, end_date, messages_for_month)
     """
     from src.utils import setup_logging
     logger = setup_logging()
-    
-    if not history:
-        return []
 
-    chunks = []
     current_month_start = None
-    current_chunk = []
+    current_chunk: List[Dict[str, Any]] = []
+    # Epoch-second bounds [lower, upper) of current_month_start; messages inside them are
+    # bucketed with two float comparisons instead of building datetimes per message
+    month_lower = month_upper = 0.0
 
     for message in history:
         # Validate timestamp before conversion
-        ts_str = message.get("ts")
-        if not ts_str:
-            logger.warning(f"Message missing timestamp, skipping: {message.get('text', '')[:50]}")
+        ts = _message_ts(message)
+        if ts is None:
+            logger.warning(
+                f"Message missing or has invalid timestamp '{message.get('ts')}', skipping: "
+                f"{message.get('text', '')[:50]}"
+            )
             continue
-        try:
-            ts = float(ts_str)
-            if ts <= 0:
-                logger.warning(f"Invalid timestamp value {ts}, skipping message")
-                continue
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid timestamp format '{ts_str}': {e}, skipping message")
+        if ts <= 0:
+            logger.warning(f"Invalid timestamp value {ts}, skipping message")
             continue
 
-        msg_date = datetime.fromtimestamp(ts, tz=timezone.utc)
-
-        # Determine month boundaries
-        month_start = datetime(msg_date.year, msg_date.month, 1, tzinfo=timezone.utc)
+        if not month_lower <= ts < month_upper:
+            # Determine month boundaries
+            tm = time.gmtime(ts)
+            month_start = datetime(tm.tm_year, tm.tm_mon, 1, tzinfo=timezone.utc)
 
-        if current_month_start is None or month_start != current_month_start:
-            # Save previous chunk if it exists
             if current_chunk:
-                # Calculate end of previous month
-                last_msg = current_chunk[-1]
-                last_ts_str = last_msg.get("ts")
-                if not last_ts_str:
-                    logger.warning("Last message in chunk missing timestamp, using current time")
-                    last_msg_date = datetime.now(timezone.utc)
-                else:
-                    try:
-                        last_msg_ts = float(last_ts_str)
-                        last_msg_date = datetime.fromtimestamp(last_msg_ts, tz=timezone.utc)
-                    except (ValueError, TypeError):
-                        logger.warning(f"Invalid timestamp in last message, using current time")
-                        last_msg_date = datetime.now(timezone.utc)
-                days_in_month = monthrange(last_msg_date.year, last_msg_date.month)[1]
-                month_end = datetime(
-                    last_msg_date.year,
-                    last_msg_date.month,
-                    days_in_month,
-                    23,
-                    59,
-                    59,
-                    tzinfo=timezone.utc,
-                )
-                chunks.append((current_month_start, month_end, current_chunk))
+                yield current_month_start, _month_end(current_month_start), current_chunk
 
             # Start new chunk
             current_month_start = month_start
             current_chunk = []
+            month_lower = month_start.timestamp()
+            month_upper = _month_end(month_start).timestamp() + 1
 
         current_chunk.append(message)
 
-    # Add final chunk
     if current_chunk:
-        last_msg = current_chunk[-1]
-        last_ts_str = last_msg.get("ts")
-        if not last_ts_str:
-            logger.warning("Last message in final chunk missing timestamp, using current time")
-            last_msg_date = datetime.now(timezone.utc)
-        else:
-            try:
-                last_msg_ts = float(last_ts_str)
-                last_msg_date = datetime.fromtimestamp(last_msg_ts, tz=timezone.utc)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid timestamp in last message, using current time")
-                last_msg_date = datetime.now(timezone.utc)
-        days_in_month = monthrange(last_msg_date.year, last_msg_date.month)[1]
-        month_end = datetime(
-            last_msg_date.year, last_msg_date.month, days_in_month, 23, 59, 59, tzinfo=timezone.utc
-        )
-        chunks.append((current_month_start, month_end, current_chunk))
+        yield current_month_start, _month_end(current_month_start), current_chunk
+
+
+def split_messages_by_month(
+    history: List[Dict[str, Any]],
+) -> List[Tuple[datetime, datetime, List[Dict[str, Any]]]]:
+    """Split messages into monthly chunks.
+
+    Args:
+        history: List of messages sorted by timestamp
+
+    Returns:
+        List of tuples: (start_date, end_date, messages_for_month)
+    """
+    if not history:
+        return []
+
+    return list(_iter_months(history))
+
+
+def build_metadata_header(
+    conversation_name: str,
+    conversation_id: Optional[str],
+    export_date: str,
+    total_messages: int,
+    date_display: Optional[str] = None,
+    date_range: Optional[str] = None,
+    chunk: Optional[Tuple[int, int]] = None,
+) -> str:
+    """Build the metadata header written at the top of every export file and new doc.
+
+    Args:
+        conversation_name: Display name of the conversation
+        conversation_id: Slack conversation ID (None for browser exports)
+        export_date: Preformatted export time
+        total_messages: Number of messages in this file or doc
+        date_display: Optional single day (YYYY-MM-DD) for daily files and docs
+        date_range: Optional "start to end" range for monthly chunk files
+        chunk: Optional (chunk index, total chunks) for monthly chunk files
 
-    return chunks
+    Returns:
+        Header text, ending with a separator line and a blank line
+    """
+    lines = [
+        "Slack Conversation Export",
+        f"Channel: {conversation_name}",
+        f"Channel ID: {conversation_id if conversation_id else '[Browser Export - No ID]'}",
+        f"Export Date: {export_date}",
+    ]
+    if date_display:
+        lines.append(f"Date: {date_display}")
+    if date_range:
+        lines.append(f"Date Range: {date_range}")
+    lines.append(f"Total Messages: {total_messages}")
+    if chunk:
+        lines.append(f"Chunk: {chunk[0]} of {chunk[1]}")
+    lines.extend(["", EXPORT_SEPARATOR, "", ""])
+    return "\n".join(lines)
 
 
 def estimate_file_size(processed_history: str) -> int:
@@ -358,6 +559,9 @@ def estimate_file_size(processed_history: str) -> int:
     Returns:
         Estimated size in bytes
     """
+    # ASCII text is one byte per character - avoid allocating an encoded copy of the export
+    if processed_history.isascii():
+        return len(processed_history)
     return len(processed_history.encode("utf-8"))
 
 
@@ -392,64 +596,66 @@ def filter_messages_by_date_range(
             "Consider enabling validation for safer operation."
         )
     
+    # No date filter active - skip validation and the range pass entirely
+    if not oldest_ts and not latest_ts:
+        logger.debug("No date filter active - skipping range pass")
+        return messages, None
+
+    # Parse each bound once; validation and filtering share the floats
+    try:
+        oldest_float: Optional[float] = float(oldest_ts) if oldest_ts else 0.0
+    except (ValueError, TypeError):
+        oldest_float = None
+    try:
+        latest_float: Optional[float] = float(latest_ts) if latest_ts else float("inf")
+    except (ValueError, TypeError):
+        latest_float = None
+
     # Validate date range logic
     if validate_range and oldest_ts and latest_ts:
-        try:
-            oldest_float_val = float(oldest_ts)
-            latest_float_val = float(latest_ts)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Invalid timestamp format in date range validation: oldest={oldest_ts}, latest={latest_ts}", exc_info=True)
+        if oldest_float is None or latest_float is None:
+            logger.error(f"Invalid timestamp format in date range validation: oldest={oldest_ts}, latest={latest_ts}")
             return [], f"Invalid timestamp format for date range validation"
-        
-        if oldest_float_val > latest_float_val:
+
+        if oldest_float > latest_float:
             return [], f"Start date ({oldest_ts}) must be before end date ({latest_ts})"
 
         # Validate date range doesn't exceed maximum if specified
         if max_date_range_days:
-            date_range_days = (latest_float_val - oldest_float_val) / SECONDS_PER_DAY
+            date_range_days = (latest_float - oldest_float) / SECONDS_PER_DAY
             if date_range_days > max_date_range_days:
                 return [], (
                     f"Date range ({date_range_days:.0f} days) exceeds maximum allowed "
                     f"({max_date_range_days} days). Use --bulk-export to override."
                 )
 
-    # Filter messages by date range if specified
-    if oldest_ts or latest_ts:
-        filtered_messages = []
-        
-        # Validate and convert timestamps with error handling
-        try:
-            oldest_float = float(oldest_ts) if oldest_ts else 0.0
-        except (ValueError, TypeError) as e:
-            logger.error(f"Invalid oldest_ts format: {oldest_ts}", exc_info=True)
-            return [], f"Invalid timestamp format for oldest_ts: {oldest_ts}"
-        
-        try:
-            latest_float = float(latest_ts) if latest_ts else float("inf")
-        except (ValueError, TypeError) as e:
-            logger.error(f"Invalid latest_ts format: {latest_ts}", exc_info=True)
-            return [], f"Invalid timestamp format for latest_ts: {latest_ts}"
-
-        for msg in messages:
-            msg_ts = msg.get("ts")
-            if msg_ts:
-                try:
-                    msg_ts_float = float(msg_ts)
-                    if msg_ts_float >= oldest_float and msg_ts_float <= latest_float:
-                        filtered_messages.append(msg)
-                except (ValueError, TypeError):
-                    # Skip messages with invalid timestamps
-                    logger.warning(f"Skipping message with invalid timestamp: {msg_ts}")
-                    continue
-
-        logger.info(
-            f"Filtered {len(messages)} messages to {len(filtered_messages)} "
-            f"messages in date range"
-        )
-        return filtered_messages, None
+    # Filter messages by date range
+    filtered_messages = []
+
+    if oldest_float is None:
+        logger.error(f"Invalid oldest_ts format: {oldest_ts}")
+        return [], f"Invalid timestamp format for oldest_ts: {oldest_ts}"
 
-    # No filtering needed
-    return messages, None
+    if latest_float is None:
+        logger.error(f"Invalid latest_ts format: {latest_ts}")
+        return [], f"Invalid timestamp format for latest_ts: {latest_ts}"
+
+    for msg in messages:
+        msg_ts = msg.get("ts")
+        if msg_ts:
+            msg_ts_float = _message_ts(msg)
+            if msg_ts_float is None:
+                # Skip messages with invalid timestamps
+                logger.warning(f"Skipping message with invalid timestamp: {msg_ts}")
+                continue
+            if msg_ts_float >= oldest_float and msg_ts_float <= latest_float:
+                filtered_messages.append(msg)
+
+    logger.info(
+        f"Filtered {len(messages)} messages to {len(filtered_messages)} "
+        f"messages in date range"
+    )
+    return filtered_messages, None
 
 
 def validate_message(msg: Dict[str, Any]) -> bool:
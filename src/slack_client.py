@@ -1,26 +1,31 @@
 import logging
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Optional
 
 from cachetools import LRUCache
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 from src.utils import save_json_file
 
 logger = logging.getLogger(__name__)
 
 # Constants for API pagination and rate limiting
-DEFAULT_PAGE_SIZE = 200
-CONVERSATIONS_PAGE_SIZE = 100
+HISTORY_PAGE_SIZE = 999  # conversations.history/replies page size (Slack allows up to 1000)
+MEMBERS_PAGE_SIZE = 999  # conversations.members page size (Slack allows up to 1000)
+CONVERSATIONS_PAGE_SIZE = 999  # users.conversations page size (Slack allows up to 1000)
 DEFAULT_RATE_LIMIT_DELAY = 1.2  # seconds
 MAX_RETRIES = 3
 BASE_RETRY_DELAY = 1.2  # seconds
-SHARE_RATE_LIMIT_INTERVAL = 10  # shares per interval
-SHARE_RATE_LIMIT_DELAY = 1.0  # seconds between intervals
 API_TIMEOUT_SECONDS = 30  # seconds
 MAX_RETRY_DELAY_SECONDS = 60  # seconds
 MAX_USER_CACHE_SIZE = 10000  # Maximum number of users to cache
+MAX_USER_LOOKUP_WORKERS = 4  # Concurrent users.info calls when prefetching users
+USERS_LIST_PAGE_SIZE = 999  # users.list page size (Slack allows up to 1000)
+MAX_CHANNEL_MEMBER_WORKERS = 8  # Concurrent conversations.members calls for reference files
+MAX_CHANNEL_MEMBERS_CACHE_SIZE = 512  # Maximum number of channel member lists to cache
 
 
 class SlackClient:
@@ -49,10 +54,21 @@ class SlackClient:
                 f"Invalid Slack token format. Expected token starting with 'xoxb-' or 'xoxp-', got: {token_prefix}..."
             )
         self.client = WebClient(token=token, timeout=API_TIMEOUT_SECONDS)
+        # User, member and conversation lookups go through a separate client that honors
+        # Retry-After itself; history pagination keeps its own manual rate-limit retries
+        # on self.client, so the two retry policies never stack
+        self.lookup_client = WebClient(token=token, timeout=API_TIMEOUT_SECONDS)
+        self.lookup_client.retry_handlers.append(
+            RateLimitErrorRetryHandler(max_retry_count=MAX_RETRIES)
+        )
         # Use LRU cache to prevent unbounded memory growth
         self.user_cache: LRUCache[str, Optional[Dict[str, str]]] = LRUCache(
             maxsize=MAX_USER_CACHE_SIZE
         )
+        # Member lists are looked up for naming group DMs and again for sharing
+        self.channel_members_cache: LRUCache[str, List[str]] = LRUCache(
+            maxsize=MAX_CHANNEL_MEMBERS_CACHE_SIZE
+        )
 
     def _handle_slack_api_error(self, error: SlackApiError, context: str) -> str:
         """Centralized Slack API error handling.
@@ -82,66 +98,209 @@ class SlackClient:
         if user_id in self.user_cache:
             return self.user_cache[user_id]
 
+        user_data = self._fetch_user_info(user_id)
+        self.user_cache[user_id] = user_data
+        return user_data
+
+    def seed_user_cache(self, users: Mapping[str, Optional[Dict[str, str]]]) -> None:
+        """Adds already-resolved users to the user cache without calling the API.
+
+        Entries fetched during this run take precedence over seeded ones.
+
+        Args:
+            users: Dict mapping user ID -> user info (e.g. from a recent run)
+        """
+        for user_id, user_data in users.items():
+            if user_id not in self.user_cache:
+                self.user_cache[user_id] = user_data
+
+    def get_users_info_bulk(self, user_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, str]]]:
+        """Fetches info for many users at once, resolving uncached IDs concurrently.
+
+        Populates the user cache so later get_user_info() calls for these IDs
+        make no API requests.
+
+        Args:
+            user_ids: Slack user IDs to resolve
+
+        Returns:
+            Dict mapping each user ID to its user info (None if error/bot)
+        """
+        results: Dict[str, Optional[Dict[str, str]]] = {}
+        missing = []
+        for user_id in set(user_ids):
+            if user_id in self.user_cache:
+                results[user_id] = self.user_cache[user_id]
+            else:
+                missing.append(user_id)
+
+        if not missing:
+            return results
+
+        logger.info(f"Prefetching info for {len(missing)} user(s)")
+        # Only the API calls run in worker threads; the (non thread-safe) cache is
+        # updated here as results arrive
+        with ThreadPoolExecutor(max_workers=min(MAX_USER_LOOKUP_WORKERS, len(missing))) as executor:
+            for user_id, user_data in zip(missing, executor.map(self._fetch_user_info, missing)):
+                self.user_cache[user_id] = user_data
+                results[user_id] = user_data
+
+        return results
+
+    def _fetch_user_info(self, user_id: str) -> Optional[Dict[str, str]]:
+        """Calls users.info for a single user without touching the cache.
+
+        Args:
+            user_id: Slack user ID
+
+        Returns:
+            Dict with slackId, email, displayName, or None if error/bot
+        """
         try:
-            response = self.client.users_info(user=user_id)
+            response = self.lookup_client.users_info(user=user_id)
             user = response.get("user")
 
             if not user:
                 logger.warning(f"No user data returned for {user_id}")
-                self.user_cache[user_id] = None
                 return None
 
-            if user.get("is_bot"):
+            return self._format_user(user)
+
+        except SlackApiError as e:
+            self._handle_slack_api_error(e, f"fetching info for user {user_id}")
+            return None
+        except (KeyError, AttributeError) as e:
+            logger.error(f"Unexpected response format for user {user_id}: {e}")
+            return None
+
+    def _format_user(self, user: Dict, quiet: bool = False) -> Optional[Dict[str, str]]:
+        """Formats a Slack user object into slackId/email/displayName.
+
+        Args:
+            user: User object from users.info or users.list
+            quiet: If True, log skipped bots and missing emails at DEBUG only (for bulk
+                listings, which log one summary instead)
+
+        Returns:
+            Dict with slackId, email, displayName, or None for bots
+        """
+        user_id = user["id"]
+        if user.get("is_bot"):
+            if quiet:
+                logger.debug(f"Skipping bot user: {user.get('name')}")
+            else:
                 logger.info(f"Skipping bot user: {user.get('name')}")
-                self.user_cache[user_id] = None
-                return None
+            return None
 
-            profile = user.get("profile", {})
+        profile = user.get("profile", {})
 
-            display_name = profile.get("display_name_normalized")
-            if not display_name:
-                display_name = profile.get("real_name_normalized", user.get("name", "Unknown User"))
+        display_name = profile.get("display_name_normalized")
+        if not display_name:
+            display_name = profile.get("real_name_normalized", user.get("name", "Unknown User"))
 
-            email = profile.get("email")
+        email = profile.get("email")
 
-            if not email:
+        if not email:
+            if quiet:
+                logger.debug(f"Could not find email for {display_name} (ID: {user_id})")
+            else:
                 logger.warning(
                     f"Could not find email for {display_name} (ID: {user_id}). Bot may be missing 'users:read.email' scope."
                 )
 
-            user_data = {
-                "slackId": user["id"],
-                "email": email,
-                "displayName": display_name,
-            }
+        return {
+            "slackId": user_id,
+            "email": email,
+            "displayName": display_name,
+        }
 
-            self.user_cache[user_id] = user_data
-            return user_data
+    def list_all_users(self) -> Optional[Dict[str, Optional[Dict[str, str]]]]:
+        """Fetches every workspace user with paginated users.list calls.
 
-        except SlackApiError as e:
-            self._handle_slack_api_error(e, f"fetching info for user {user_id}")
-            self.user_cache[user_id] = None
-            return None
-        except (KeyError, AttributeError) as e:
-            logger.error(f"Unexpected response format for user {user_id}: {e}")
-            self.user_cache[user_id] = None
-            return None
+        One call returns up to USERS_LIST_PAGE_SIZE users, replacing one users.info call per
+        member. Results also populate the user cache.
+
+        Returns:
+            Dict mapping user ID -> formatted user info (None for bots), or None on error
+        """
+        users: Dict[str, Optional[Dict[str, str]]] = {}
+        skipped_count = 0
+        missing_email_count = 0
+        cursor = None
+        while True:
+            try:
+                response = self.lookup_client.users_list(limit=USERS_LIST_PAGE_SIZE, cursor=cursor)
+            except SlackApiError as e:
+                self._handle_slack_api_error(e, "listing workspace users")
+                return None
+
+            for user in response.get("members", []):
+                user_id = user.get("id")
+                if not user_id:
+                    continue
+                try:
+                    # Per-user notes go to DEBUG; one summary is logged below
+                    user_data = self._format_user(user, quiet=True)
+                except (KeyError, AttributeError) as e:
+                    logger.error(f"Unexpected response format for user {user_id}: {e}")
+                    user_data = None
+                if user_data is None:
+                    skipped_count += 1
+                elif not user_data["email"]:
+                    missing_email_count += 1
+                users[user_id] = user_data
+                self.user_cache[user_id] = user_data
+
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+        logger.info(f"Fetched {len(users)} users from users.list")
+        if skipped_count:
+            logger.info(f"Skipped {skipped_count} bot or malformed user(s) from users.list")
+        if missing_email_count:
+            logger.warning(
+                f"{missing_email_count} user(s) from users.list have no email. "
+                "Bot may be missing 'users:read.email' scope."
+            )
+        return users
 
     def get_channel_members(self, channel_id: str) -> List[str]:
         """Fetches all member IDs for a channel, handling pagination.
 
+        Successful results are cached, so repeated lookups for the same channel in one
+        run make no API requests.
+
         Args:
             channel_id: Slack channel ID
 
         Returns:
             List of member user IDs
         """
+        if channel_id in self.channel_members_cache:
+            return list(self.channel_members_cache[channel_id])
+
+        member_ids = self._fetch_channel_members(channel_id)
+        if member_ids is None:
+            return []
+        self.channel_members_cache[channel_id] = member_ids
+        return list(member_ids)
+
+    def _fetch_channel_members(self, channel_id: str) -> Optional[List[str]]:
+        """Calls conversations.members for a channel without touching the cache.
+
+        Args:
+            channel_id: Slack channel ID
+
+        Returns:
+            List of member user IDs, or None on API error
+        """
         member_ids = []
         cursor = None
         while True:
             try:
-                response = self.client.conversations_members(
-                    channel=channel_id, limit=DEFAULT_PAGE_SIZE, cursor=cursor
+                response = self.lookup_client.conversations_members(
+                    channel=channel_id, limit=MEMBERS_PAGE_SIZE, cursor=cursor
                 )
                 member_ids.extend(response.get("members", []))
                 cursor = response.get("response_metadata", {}).get("next_cursor")
@@ -150,9 +309,48 @@ class SlackClient:
             except SlackApiError as e:
                 self._handle_slack_api_error(e, f"getting members for channel {channel_id}")
                 logger.warning(f"Ensure the bot is a member of this channel.")
-                return []
+                return None
         return member_ids
 
+    def get_members_for_channels(self, channel_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """Fetches member IDs for many channels concurrently.
+
+        conversations.members is a Tier 4 method, so a small bounded pool stays within its
+        quota; rate-limited responses are retried by lookup_client's RateLimitErrorRetryHandler.
+
+        Args:
+            channel_ids: Slack channel IDs
+
+        Returns:
+            Dict mapping each channel ID to its member user IDs (empty list on error)
+        """
+        results: Dict[str, List[str]] = {}
+        missing = []
+        for channel_id in dict.fromkeys(channel_ids):
+            if channel_id in self.channel_members_cache:
+                results[channel_id] = list(self.channel_members_cache[channel_id])
+            else:
+                missing.append(channel_id)
+
+        if not missing:
+            return results
+
+        # Only the API calls run in worker threads; the (non thread-safe) cache is
+        # updated here as results arrive
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CHANNEL_MEMBER_WORKERS, len(missing))
+        ) as executor:
+            for channel_id, member_ids in zip(
+                missing, executor.map(self._fetch_channel_members, missing)
+            ):
+                if member_ids is None:
+                    results[channel_id] = []
+                else:
+                    self.channel_members_cache[channel_id] = member_ids
+                    results[channel_id] = list(member_ids)
+
+        return results
+
     def get_all_channels(self):
         """Fetches all channels and group chats the bot is a member of.
 
@@ -171,8 +369,9 @@ class SlackClient:
 
         while True:
             try:
-                response = self.client.users_conversations(
+                response = self.lookup_client.users_conversations(
                     types="public_channel,private_channel,mpim",
+                    exclude_archived=True,
                     limit=CONVERSATIONS_PAGE_SIZE,
                     cursor=channels_cursor,
                 )
@@ -196,7 +395,7 @@ class SlackClient:
 
                     # Fetch detailed info for each conversation
                     try:
-                        channel_info_response = self.client.conversations_info(channel=channel_id)
+                        channel_info_response = self.lookup_client.conversations_info(channel=channel_id)
                         channel_detail = channel_info_response.get("channel", {})
 
                         # Skip direct messages (DMs) - safety check in case any slip through
@@ -273,11 +472,12 @@ class SlackClient:
         try:
             while True:
                 page_count += 1
+                page_started = time.monotonic()
                 logger.info(f"Fetching page {page_count} for channel {channel_id}...")
                 try:
                     response = self.client.conversations_history(
                         channel=channel_id,
-                        limit=DEFAULT_PAGE_SIZE,
+                        limit=HISTORY_PAGE_SIZE,
                         cursor=next_cursor,
                         oldest=oldest_ts,
                         latest=latest_ts,
@@ -378,7 +578,10 @@ class SlackClient:
                     logger.info(f"Reached the end of the message history for channel {channel_id}.")
                     break
 
-                time.sleep(DEFAULT_RATE_LIMIT_DELAY)
+                # Pace pages from request start so slow responses do not add a full extra delay
+                wait = DEFAULT_RATE_LIMIT_DELAY - (time.monotonic() - page_started)
+                if wait > 0:
+                    time.sleep(wait)
 
         except (KeyError, AttributeError) as e:
             logger.error(f"Unexpected error in pagination loop for channel {channel_id}: {e}")
@@ -413,11 +616,12 @@ class SlackClient:
         try:
             while True:
                 page_count += 1
+                page_started = time.monotonic()
                 try:
                     response = self.client.conversations_replies(
                         channel=channel_id,
                         ts=thread_ts,
-                        limit=DEFAULT_PAGE_SIZE,
+                        limit=HISTORY_PAGE_SIZE,
                         cursor=next_cursor,
                     )
                     retry_count = 0  # Reset retry count on success
@@ -479,7 +683,10 @@ class SlackClient:
                 if not next_cursor:
                     break
 
-                time.sleep(DEFAULT_RATE_LIMIT_DELAY)
+                # Pace pages from request start so slow responses do not add a full extra delay
+                wait = DEFAULT_RATE_LIMIT_DELAY - (time.monotonic() - page_started)
+                if wait > 0:
+                    time.sleep(wait)
 
         except Exception as e:
             logger.error(f"Error in pagination loop for thread {thread_ts}: {e}", exc_info=True)
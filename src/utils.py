@@ -1,13 +1,27 @@
+import functools
 import json
 import logging
+import math
 import os
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup (pip install ".[speedups]"); stdlib json is used when it is missing
+    orjson = None
+
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the sanitizers and validators below
+_DRIVE_INVALID_CHARS_RE = re.compile(r'[/\\<>:"|?*]')  # Not allowed in Drive names
+_FILENAME_INVALID_CHARS_RE = re.compile(r'[<>:"|?*]')  # Left after separators are replaced
+_CHANNEL_ID_RE = re.compile(r"^[CDG][A-Z0-9]{8,10}$")
+_JSON_INDENT_RE = re.compile(rb"^ +", re.MULTILINE)  # Leading indentation of dumped JSON
+
 
 def setup_logging():
     """Sets up the logging configuration."""
@@ -17,6 +31,7 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_folder_name(name: str) -> str:
     """Sanitize folder name for Google Drive.
 
@@ -25,6 +40,8 @@ def sanitize_folder_name(name: str) -> str:
     - Cannot contain certain special characters
     - Must not be an absolute path or contain path traversal sequences
 
+    Results are memoized; the same conversation names are sanitized for every export.
+
     Args:
         name: Folder name to sanitize
 
@@ -41,7 +58,7 @@ def sanitize_folder_name(name: str) -> str:
 
     # Remove or replace invalid characters for Google Drive
     # Google Drive doesn't allow: / \ < > : " | ? *
-    name = re.sub(r'[/\\<>:"|?*]', "_", name)
+    name = _DRIVE_INVALID_CHARS_RE.sub("_", name)
     
     # Remove leading/trailing spaces and dots first
     name = name.strip(". ")
@@ -64,6 +81,8 @@ def sanitize_folder_name(name: str) -> str:
 def load_json_file(filepath: str) -> Optional[Union[Dict[str, Any], List[Any]]]:
     """Loads a JSON file and returns its content.
 
+    Uses orjson for parsing when it is installed (see loads_json_bytes).
+
     Args:
         filepath: Path to the JSON file
 
@@ -71,8 +90,8 @@ def load_json_file(filepath: str) -> Optional[Union[Dict[str, Any], List[Any]]]:
         Parsed JSON content as dict/list, or None if file doesn't exist or is invalid
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filepath, "rb") as f:
+            return loads_json_bytes(f.read())
     except FileNotFoundError:
         logging.error(f"File not found: {filepath}")
         return None
@@ -137,13 +156,85 @@ def validate_channel_id(channel_id: str) -> bool:
     if not channel_id or not isinstance(channel_id, str):
         return False
     # Slack IDs are typically 9-11 characters, starting with C, D, or G
-    pattern = r"^[CDG][A-Z0-9]{8,10}$"
-    return bool(re.match(pattern, channel_id))
+    return bool(_CHANNEL_ID_RE.match(channel_id))
+
+
+def loads_json_bytes(data: bytes) -> Any:
+    """Parse a UTF-8 JSON document, with orjson when it is installed.
+
+    orjson rejects a few documents the stdlib accepts (NaN, lone surrogate escapes),
+    so those are handed to json.loads rather than failing.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Parsed JSON content
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson.JSONDecodeError; let the stdlib decide
+            pass
+    return json.loads(data)
+
+
+def _has_orjson_incompatible_float(data: Any) -> bool:
+    """Check for floats that orjson formats differently from json.dumps.
+
+    orjson writes NaN and Infinity as null and drops the exponent's sign and leading
+    zero (1e16 vs 1e+16, 1e-7 vs 1e-07); every other float formats identically.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data) or "e" in repr(data)
+    if isinstance(data, dict):
+        return any(
+            _has_orjson_incompatible_float(key) or _has_orjson_incompatible_float(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, (list, tuple)):
+        return any(_has_orjson_incompatible_float(item) for item in data)
+    return False
+
+
+def dumps_json_bytes(data: Any, indent: int = 4) -> bytes:
+    """Serialize data as indented UTF-8 JSON, with orjson when it is installed.
+
+    orjson only supports two-space indentation, and JSON strings cannot contain raw
+    newlines, so scaling each line's leading spaces reproduces
+    json.dumps(indent=indent, ensure_ascii=False) output exactly. Data holding
+    non-finite or exponent-notation floats, which orjson formats differently, goes
+    through the stdlib encoder.
+
+    Args:
+        data: Data to serialize
+        indent: Spaces per indentation level (an even number)
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None and indent % 2 == 0 and not _has_orjson_incompatible_float(data):
+        try:
+            dumped = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if indent == 2:
+                return dumped
+            scale = indent // 2
+            return _JSON_INDENT_RE.sub(lambda m: m.group(0) * scale, dumped)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. integers beyond 64 bits); use the stdlib encoder
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
 
 
 def save_json_file(data: Any, filepath: str) -> bool:
     """Saves data to a JSON file.
 
+    Serialized in one call (with orjson when it is installed) and written as bytes.
+
     Args:
         data: Data to save (dict, list, etc.)
         filepath: Path where to save the file
@@ -157,8 +248,9 @@ def save_json_file(data: Any, filepath: str) -> bool:
         if dir_path and not os.path.exists(dir_path):
             os.makedirs(dir_path, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        payload = dumps_json_bytes(data)
+        with open(filepath, "wb") as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())  # Ensure data is written to disk
 
@@ -177,9 +269,12 @@ def save_json_file(data: Any, filepath: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=256)
 def convert_date_to_timestamp(date_str: Optional[str], is_end_date: bool = False) -> Optional[str]:
     """Converts YYYY-MM-DD or YYYY-MM-DD HH:MM:SS string (assumed UTC) to Unix timestamp string.
 
+    Results are memoized; the same date is converted once per channel in export loops.
+
     Args:
         date_str: Date string in format 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
         is_end_date: If True, sets time to end of day for date-only format
@@ -234,13 +329,50 @@ def create_directory(dir_path: str) -> bool:
     return True
 
 
+DURABLE_WRITES_ENV = "SLACKFEEDER_DURABLE"  # Set to 1 to fsync every export file
+
+
+def durable_writes_enabled() -> bool:
+    """Check whether each export file should be fsynced individually.
+
+    Returns:
+        True if SLACKFEEDER_DURABLE is set to 1/true/yes, False otherwise
+    """
+    return os.getenv(DURABLE_WRITES_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def fsync_directory(dir_path: str) -> None:
+    """Flush a directory's entries to disk with a single barrier.
+
+    Used after writing a batch of export files instead of syncing each file.
+    Platforms that cannot open or sync directories (e.g. Windows) are skipped.
+
+    Args:
+        dir_path: Path to the directory to sync
+    """
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError as e:
+        logger.debug(f"Could not open directory {dir_path} for fsync: {e}")
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"Could not fsync directory {dir_path}: {e}")
+    finally:
+        os.close(fd)
+
+
 # Constants
 MAX_FILENAME_LENGTH = 200  # Maximum filename length
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """Remove path separators and dangerous characters from filename.
 
+    Results are memoized; the same conversation names are sanitized for every export.
+
     Args:
         filename: The filename to sanitize
 
@@ -254,7 +386,7 @@ def sanitize_filename(filename: str) -> str:
     filename = filename.replace("/", "_").replace("\\", "_")
     filename = filename.replace("..", "_")
     # Remove any remaining dangerous characters
-    filename = re.sub(r'[<>:"|?*]', "_", filename)
+    filename = _FILENAME_INVALID_CHARS_RE.sub("_", filename)
     # Remove leading/trailing dots and spaces
     filename = filename.strip(". ")
     # Limit length
@@ -278,13 +410,18 @@ def format_timestamp(timestamp_str: Optional[str]) -> Optional[str]:
     if timestamp_str is None:
         return None
     try:
-        ts = float(timestamp_str)
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-        return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+        # Only whole seconds are shown, so bursts of messages share one cached formatting
+        return _format_epoch_seconds(math.floor(float(timestamp_str)))
     except (ValueError, TypeError):
         return timestamp_str
 
 
+@functools.lru_cache(maxsize=8192)
+def _format_epoch_seconds(seconds: int) -> str:
+    """Format whole Unix seconds as a UTC datetime string (cached helper for format_timestamp)."""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
 def sanitize_path_for_logging(filepath: str) -> str:
     """Sanitize file paths for logging to avoid exposing sensitive directory structures.
 
@@ -330,6 +467,8 @@ def sanitize_string_for_logging(value: str) -> str:
 def validate_email(email: str) -> bool:
     """Validate email format.
 
+    Results are memoized per address; sharing checks the same members across channels.
+
     Args:
         email: Email address to validate
 
@@ -339,6 +478,12 @@ def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
 
+    return _validate_email_cached(email)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_email_cached(email: str) -> bool:
+    """Validate a non-empty email string (cached implementation of validate_email)."""
     email = email.strip()
 
     # Basic length checks
@@ -9,6 +9,13 @@ import tempfile
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_files(tmp_path, monkeypatch):
+    """Keep persisted caches out of the repository's config directory."""
+    monkeypatch.setattr("src.drive_upload.PEOPLE_CACHE_FILE", str(tmp_path / ".people_cache.json"))
+    monkeypatch.setattr("src.main.CHANNELS_CACHE_FILE", str(tmp_path / ".channels_cache.json"))
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
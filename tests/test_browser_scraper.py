@@ -429,6 +429,9 @@ class TestBrowserResponseProcessor:
             assert "20241017" in daily_groups
             assert len(daily_groups["20241018"]) == 2
             assert len(daily_groups["20241017"]) == 1
+            # Days come back in date order, messages in timestamp order
+            assert list(daily_groups) == ["20241017", "20241018"]
+            assert [m["text"] for m in daily_groups["20241018"]] == ["Message 1", "Message 3"]
             assert "U123" in user_map
             assert "U456" in user_map
 
@@ -472,6 +475,33 @@ class TestBrowserResponseProcessor:
             total_messages = sum(len(msgs) for msgs in daily_groups.values())
             assert total_messages == 3
 
+    def test_process_responses_for_google_drive_invalid_timestamp(self):
+        """Test that a message with an unparseable ts is skipped, not fatal."""
+        processor = BrowserResponseProcessor()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            response_dir = Path(tmpdir) / "responses"
+            response_dir.mkdir()
+
+            response_data = {
+                "ok": True,
+                "messages": [
+                    {"ts": "1729263033.513419", "user": "U123", "text": "Message 2"},
+                    {"ts": "abc", "user": "U123", "text": "Broken"},
+                    {"ts": "1729263032.513419", "user": "U123", "text": "Message 1"},
+                ],
+            }
+            response_file = response_dir / "response_0.json"
+            with open(response_file, "w") as f:
+                json.dump(response_data, f)
+
+            daily_groups, _ = processor.process_responses_for_google_drive(
+                [response_file], "TestDM"
+            )
+
+            assert list(daily_groups) == ["20241018"]
+            assert [m["text"] for m in daily_groups["20241018"]] == ["Message 1", "Message 2"]
+
     def test_process_responses_for_google_drive_empty(self):
         """Test processing empty response files."""
         processor = BrowserResponseProcessor()
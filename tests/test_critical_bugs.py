@@ -20,7 +20,7 @@ class TestCriticalBug1_MissingStatisticsKeys:
     """Test that stats dictionary is missing upload_failed and share_failed keys."""
 
     @patch("src.main.SlackClient")
-    @patch("src.main.GoogleDriveClient")
+    @patch("src.google_drive.GoogleDriveClient")
     @patch("src.drive_upload.load_json_file")
     @patch("src.main.os.getenv")
     @patch("src.main.create_directory")
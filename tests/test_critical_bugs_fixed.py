@@ -67,6 +67,16 @@ class TestCriticalBug2_Fixed_PathValidation:
         assert relative_check is False, "Absolute paths should pass validation"
 
 
+    def test_output_path_containment_uses_separator(self):
+        """Verify that a sibling directory sharing the name prefix is rejected."""
+        from src.main import _is_within_directory
+
+        prefix = os.path.abspath("/tmp/out") + os.sep
+        assert _is_within_directory("/tmp/out/file.txt", prefix)
+        assert not _is_within_directory("/tmp/outfoo/file.txt", prefix)
+        assert not _is_within_directory("/tmp/out/../etc/passwd", prefix)
+
+
 class TestCriticalBug3_Fixed_NoneInStringFormatting:
     """Test that None handling is fixed in format_timestamp usage."""
 
@@ -4,12 +4,14 @@ Unit tests for Google Drive client.
 Tests use mocks to avoid requiring actual Google Drive API credentials.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 from googleapiclient.errors import HttpError
 
-from src.google_drive import GoogleDriveClient
+from src.google_drive import _DOC_TIMESTAMP_RE, GoogleDriveClient, _doc_timestamp_to_unix
 
 
 @pytest.fixture
@@ -74,6 +76,14 @@ class TestEscapeDriveQueryString:
         assert '\\"' in result
         assert "\\\\" in result
 
+    def test_doc_name_query_escapes_name(self):
+        client = GoogleDriveClient.__new__(GoogleDriveClient)
+        query = client._doc_name_query("O'Reilly 20240101", "folder123")
+        assert query == (
+            "name='O\\'Reilly 20240101' and 'folder123' in parents "
+            "and mimeType='application/vnd.google-apps.document' and trashed=false"
+        )
+
 
 class TestValidateFolderId:
     """Tests for _validate_folder_id method."""
@@ -203,6 +213,27 @@ class TestCreateFolder:
             # Verify create was not called
             mock_service.files.return_value.create.assert_not_called()
 
+    @patch("src.google_drive.build")
+    def test_repeat_lookup_served_from_cache(self, mock_build):
+        mock_service = Mock()
+        mock_list_result = Mock()
+        mock_list_result.execute.return_value = {"files": []}
+        mock_service.files.return_value.list.return_value = mock_list_result
+        mock_service.files.return_value.create.return_value.execute.return_value = {
+            "id": "new_folder123"
+        }
+        mock_build.return_value = mock_service
+
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+            client.service = mock_service
+            first = client.create_folder("Channel", "0B1234567890abcdef")
+            second = client.create_folder("Channel", "0B1234567890abcdef")
+
+            assert first == second == "new_folder123"
+            mock_list_result.execute.assert_called_once()
+            mock_service.files.return_value.create.assert_called_once()
+
     @patch("src.google_drive.build")
     def test_create_folder_with_empty_name(self, mock_build):
         mock_service = Mock()
@@ -347,6 +378,31 @@ class TestCreateOrUpdateGoogleDoc:
                     assert result == "doc123"
                     mock_documents.create.assert_called_once()
 
+    def test_create_known_new_doc_skips_lookup(self, mock_build_with_docs):
+        """Test that known_new creates the doc without an existence query."""
+        mocks = mock_build_with_docs
+        mock_files = mocks["files"]
+        mock_documents = mocks["documents"]
+
+        with patch("src.google_drive.GoogleDriveClient._authenticate") as mock_auth:
+            mock_auth.return_value = MagicMock()
+            client = GoogleDriveClient("credentials.json")
+
+            with patch.object(client, "_validate_folder_id", return_value=True):
+                with patch.object(client, "_rate_limit"):
+                    mock_documents.create.return_value.execute.return_value = {
+                        "documentId": "doc123"
+                    }
+                    mock_files.get.return_value.execute.return_value = {"parents": ["root"]}
+
+                    result = client.create_or_update_google_doc(
+                        "Test Doc", "Test content", "folder123", known_new=True
+                    )
+
+                    assert result == "doc123"
+                    mock_files.list.assert_not_called()
+                    mock_documents.create.assert_called_once()
+
     def test_append_to_existing_doc(self, mock_build_with_docs):
         """Test appending to an existing Google Doc."""
         mocks = mock_build_with_docs
@@ -582,6 +638,177 @@ class TestGetFolderPermissions:
             assert result == []
 
 
+class TestListGoogleDocNames:
+    """Tests for list_google_doc_names method."""
+
+    @patch("src.google_drive.build")
+    def test_follows_pagination(self, mock_build):
+        mock_service = Mock()
+        mock_list_request = Mock()
+        mock_list_request.execute.side_effect = [
+            {"files": [{"name": "Doc A"}, {"name": "Doc B"}], "nextPageToken": "page2"},
+            {"files": [{"name": "Doc C"}]},
+        ]
+        mock_service.files.return_value.list.return_value = mock_list_request
+        mock_build.return_value = mock_service
+
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+            client.service = mock_service
+            with patch.object(client, "_rate_limit"):
+                result = client.list_google_doc_names("0B1234567890abcdef")
+
+        assert result == {"Doc A", "Doc B", "Doc C"}
+        calls = mock_service.files.return_value.list.call_args_list
+        assert len(calls) == 2
+        assert calls[0].kwargs["pageToken"] is None
+        assert calls[1].kwargs["pageToken"] == "page2"
+
+    @patch("src.google_drive.build")
+    def test_error_returns_none(self, mock_build):
+        mock_service = Mock()
+        mock_list_request = Mock()
+        mock_list_request.execute.side_effect = HttpError(Mock(status=500), b"Error")
+        mock_service.files.return_value.list.return_value = mock_list_request
+        mock_build.return_value = mock_service
+
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+            client.service = mock_service
+            with patch.object(client, "_rate_limit"):
+                assert client.list_google_doc_names("0B1234567890abcdef") is None
+
+    @patch("src.google_drive.build")
+    def test_invalid_folder_id_returns_none(self, mock_build):
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+            assert client.list_google_doc_names("invalid!") is None
+
+
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest that reports each queued request to the callback."""
+
+    def __init__(self, callback, outcome, batch_sizes):
+        self.callback = callback
+        self.outcome = outcome
+        self.batch_sizes = batch_sizes
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self, http=None):
+        self.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, None, self.outcome(request))
+
+
+def _batch_client(mock_service, outcome):
+    """Create a client whose batch requests resolve through outcome(request)."""
+    batch_sizes = []
+    mock_service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(
+        callback, outcome, batch_sizes
+    )
+    with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+        with patch("src.google_drive.build", return_value=mock_service):
+            client = GoogleDriveClient("fake_credentials.json")
+    client.service = mock_service
+    return client, batch_sizes
+
+
+class TestBatchPermissions:
+    """Tests for share_folder_batch and revoke_permissions_batch methods."""
+
+    def test_share_folder_batch_reports_each_user(self):
+        mock_service = Mock()
+        mock_service.permissions.return_value.create.side_effect = lambda **kwargs: kwargs
+        errors = {
+            "old@example.com": HttpError(Mock(status=400), b"already has access"),
+            "bad@example.com": HttpError(Mock(status=500), b"Error"),
+        }
+        client, batch_sizes = _batch_client(
+            mock_service, lambda request: errors.get(request["body"]["emailAddress"])
+        )
+
+        with patch.object(client, "_rate_limit") as mock_rate_limit:
+            result = client.share_folder_batch(
+                "0B1234567890abcdef",
+                {"new@example.com": True, "old@example.com": False, "bad@example.com": True},
+            )
+
+        assert result == {
+            "new@example.com": True,
+            "old@example.com": True,
+            "bad@example.com": False,
+        }
+        assert batch_sizes == [3]
+        assert mock_rate_limit.call_count == 1
+        mock_service.permissions.return_value.create.assert_any_call(
+            fileId="0B1234567890abcdef",
+            body={"type": "user", "role": "reader", "emailAddress": "old@example.com"},
+            sendNotificationEmail=False,
+        )
+
+    def test_revoke_permissions_batch_splits_large_requests(self):
+        mock_service = Mock()
+        mock_service.permissions.return_value.delete.side_effect = lambda **kwargs: kwargs
+        missing = HttpError(Mock(status=404), b"Not found")
+        client, batch_sizes = _batch_client(
+            mock_service, lambda request: missing if request["permissionId"] == "p4" else None
+        )
+        permission_ids = {f"user{i}@example.com": f"p{i}" for i in range(5)}
+
+        with patch("src.google_drive.DRIVE_BATCH_MAX_REQUESTS", 2):
+            with patch.object(client, "_rate_limit") as mock_rate_limit:
+                result = client.revoke_permissions_batch("0B1234567890abcdef", permission_ids)
+
+        assert result == {email: True for email in permission_ids}
+        assert batch_sizes == [2, 2, 1]
+        assert mock_rate_limit.call_count == 3
+
+    def test_failed_batch_marks_every_user_failed(self):
+        mock_service = Mock()
+        mock_service.new_batch_http_request.return_value.execute.side_effect = HttpError(
+            Mock(status=500), b"Error"
+        )
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            with patch("src.google_drive.build", return_value=mock_service):
+                client = GoogleDriveClient("fake_credentials.json")
+        client.service = mock_service
+
+        with patch.object(client, "_rate_limit"):
+            result = client.share_folder_batch(
+                "0B1234567890abcdef", {"a@example.com": True, "b@example.com": True}
+            )
+
+        assert result == {"a@example.com": False, "b@example.com": False}
+
+
+class TestThreadHttp:
+    """Tests for per-thread HTTP clients used by concurrent share calls."""
+
+    @patch("src.google_drive.build")
+    def test_main_thread_uses_default_http(self, mock_build):
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+            assert client._thread_http() is None
+
+    @patch("src.google_drive.build")
+    def test_worker_threads_get_their_own_http(self, mock_build):
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            client = GoogleDriveClient("fake_credentials.json")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = executor.submit(client._thread_http).result()
+            second = executor.submit(client._thread_http).result()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(client._thread_http).result()
+
+        assert first is not None
+        assert first is second  # Reused within a thread
+        assert other is not first
+
+
 class TestShareFolderWithPermissionCheck:
     """Tests for share_folder method with permission checking."""
 
@@ -698,3 +925,62 @@ class TestShareFolderWithPermissionCheck:
             # Should skip because emails match (case-insensitive)
             assert result is True
             mock_service.permissions.return_value.create.assert_not_called()
+
+
+class TestDocTimestampToUnix:
+    """Tests for _doc_timestamp_to_unix helper."""
+
+    @pytest.mark.parametrize(
+        "stamp",
+        [
+            "2024-01-01 00:00:00",
+            "2024-02-29 23:59:59",
+            "1999-12-31 12:34:56",
+            "2023-02-29 10:00:00",  # Not a leap year
+            "2024-13-01 10:00:00",
+            "2024-04-31 10:00:00",
+            "2024-01-01 24:00:00",
+            "2024-01-01 10:00:60",
+            "0000-01-01 10:00:00",
+        ],
+    )
+    def test_matches_strptime(self, stamp):
+        """Test that results match strptime-based parsing, including rejected dates."""
+        try:
+            dt = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+            expected = str(dt.timestamp())
+        except ValueError:
+            expected = None
+
+        match = _DOC_TIMESTAMP_RE.search(f"[{stamp} UTC] Alice: hello")
+
+        assert _doc_timestamp_to_unix(match) == expected
+
+
+class TestGetLatestExportTimestamp:
+    """Tests for get_latest_export_timestamp method."""
+
+    @patch("googleapiclient.http.MediaIoBaseDownload")
+    def test_reads_metadata_file(self, mock_download):
+        mock_service = Mock()
+        mock_service.files.return_value.list.return_value.execute.return_value = {
+            "files": [{"id": "meta123", "name": "general_last_export.json"}]
+        }
+
+        def fake_download(buffer, request):
+            buffer.write('{"latest_message_timestamp": 1704103200.5, "note": "é"}'.encode("utf-8"))
+            downloader = Mock()
+            downloader.next_chunk.return_value = (None, True)
+            return downloader
+
+        mock_download.side_effect = fake_download
+
+        with patch("src.google_drive.GoogleDriveClient._authenticate", return_value=Mock()):
+            with patch("src.google_drive.build", return_value=mock_service):
+                client = GoogleDriveClient("fake_credentials.json")
+        client.service = mock_service
+
+        with patch.object(client, "_rate_limit"):
+            result = client.get_latest_export_timestamp("0B1234567890abcdef", "general")
+
+        assert result == "1704103200.5"
@@ -10,7 +10,12 @@ import pytest
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from src.google_drive import GoogleDriveClient
+from src.google_drive import (
+    GOOGLE_DRIVE_BATCH_DELAY,
+    GOOGLE_DRIVE_BATCH_SIZE,
+    GOOGLE_DRIVE_READ_RATE_LIMIT_DELAY,
+    GoogleDriveClient,
+)
 
 
 class TestGoogleDriveClientInit:
@@ -114,6 +119,53 @@ class TestRateLimiting:
         # Should have called sleep for batch delays (at least once after batch)
         assert mock_sleep.call_count >= 0  # May have slept multiple times
 
+    @patch("src.google_drive.GoogleDriveClient._authenticate")
+    @patch("src.google_drive.build")
+    @patch("src.google_drive.time.sleep")
+    @patch("src.google_drive.time.time")
+    def test_reads_use_separate_budget(self, mock_time, mock_sleep, mock_build, mock_authenticate):
+        """Test that reads are spaced by the read delay and leave the write budget untouched."""
+        mock_authenticate.return_value = Mock()
+        mock_build.return_value = Mock()
+        mock_time.return_value = 100.0
+
+        client = GoogleDriveClient("fake_credentials.json")
+        client._rate_limit()  # Write at t=100
+        client._rate_limit(read=True)  # First read does not wait for the write
+        client._rate_limit(read=True)  # Second read waits for the read delay only
+
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(GOOGLE_DRIVE_READ_RATE_LIMIT_DELAY)
+        assert client._api_call_count == 1
+
+    @patch("src.google_drive.GoogleDriveClient._authenticate")
+    @patch("src.google_drive.build")
+    @patch("src.google_drive.time.sleep")
+    @patch("src.google_drive.time.time")
+    def test_batch_delay_only_covers_rest_of_window(
+        self, mock_time, mock_sleep, mock_build, mock_authenticate
+    ):
+        """Test that the batch delay is skipped when slow calls already filled the window."""
+        mock_authenticate.return_value = Mock()
+        mock_build.return_value = Mock()
+        clock = [1000.0]
+        mock_time.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        client = GoogleDriveClient("fake_credentials.json")
+
+        # Back-to-back calls: spacing sleeps, then the batch delay on the 10th call
+        for _ in range(GOOGLE_DRIVE_BATCH_SIZE):
+            client._rate_limit()
+        assert mock_sleep.call_args.args[0] == pytest.approx(GOOGLE_DRIVE_BATCH_DELAY)
+
+        # Calls that take longer than the window on their own never sleep
+        mock_sleep.reset_mock()
+        for _ in range(GOOGLE_DRIVE_BATCH_SIZE):
+            clock[0] += 2.0
+            client._rate_limit()
+        mock_sleep.assert_not_called()
+
 
 class TestRateLimitInAPICalls:
     """Tests that rate limiting is applied in API calls."""
@@ -10,19 +10,36 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.main import main
+from src.main import (
+    _fetch_conversation_history,
+    _get_all_channels_cached,
+    _iter_prefetched_histories,
+    main,
+)
 from src.drive_upload import (
     _extract_members_from_conversation_name,
     _get_conversation_members,
+    _normalize_share_members,
     _resolve_member_identifier,
     _should_share_with_member,
     get_oldest_timestamp_for_export,
     initialize_stats,
+    load_people_cache,
+    load_persisted_users,
+    share_folder_with_conversation_members,
+    save_people_cache,
+    upload_messages_to_drive,
 )
 from src.message_processing import (
+    TS_FLOAT_KEY,
+    annotate_timestamps,
+    build_metadata_header,
     estimate_file_size,
     filter_messages_by_date_range,
     group_messages_by_date,
+    iter_messages_by_date,
+    iter_preprocess_history,
+    latest_message_timestamp,
     preprocess_history,
     replace_user_ids_in_text,
     should_chunk_export,
@@ -194,6 +211,57 @@ class TestPreprocessHistory:
         assert "<@U789>" not in result
 
 
+    def test_preprocess_prefetches_uncached_users(self):
+        """Test that authors and mentions missing from people_cache are resolved in one batch."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_user_info.return_value = {"slackId": "U456", "displayName": "Alice"}
+        people_cache = {"U123": "Cached User"}
+
+        history = [
+            {"ts": "1234567890.123", "user": "U123", "text": "Hey <@U456> and @U789"},
+            {"ts": "1234567891.123", "user": "U456", "text": "Hi"},
+        ]
+
+        preprocess_history(history, slack_client, people_cache)
+
+        slack_client.get_users_info_bulk.assert_called_once_with({"U456", "U789"})
+
+    def test_preprocess_display_names_skips_prefetch(self):
+        """Test that browser exports never prefetch users."""
+        slack_client = Mock(spec=SlackClient)
+        history = [{"ts": "1234567890.123", "user": "Alice", "text": "Hi <@U456>"}]
+
+        preprocess_history(history, slack_client, use_display_names=True)
+
+        slack_client.get_users_info_bulk.assert_not_called()
+
+    def test_preprocess_unsorted_input_with_presorted_false(self):
+        """Test that presorted=False orders threads and replies by timestamp."""
+        history = [
+            {"ts": "1234567892.000", "user": "Bob", "text": "Reply", "thread_ts": "1234567890.000"},
+            {"ts": "1234567891.000", "user": "Carol", "text": "Second thread"},
+            {"ts": "1234567890.000", "user": "Alice", "text": "Parent"},
+        ]
+
+        result = preprocess_history(history, None, use_display_names=True, presorted=False)
+
+        assert result.index("Alice: Parent") < result.index("Bob: Reply")
+        assert result.index("Bob: Reply") < result.index("Carol: Second thread")
+
+    def test_iter_preprocess_history_yields_newline_terminated_lines(self):
+        """Test that the streaming variant yields lines matching preprocess_history."""
+        history = [
+            {"ts": "1234567890.000", "user": "Alice", "text": "Parent"},
+            {"ts": "1234567891.000", "user": "Bob", "text": "Reply", "thread_ts": "1234567890.000"},
+            {"ts": "1234567892.000", "user": "Carol", "text": "Line 1\nLine 2"},
+        ]
+
+        lines = list(iter_preprocess_history(history, None, use_display_names=True))
+
+        assert all(line.endswith("\n") for line in lines)
+        assert "".join(lines) == preprocess_history(history, None, use_display_names=True)
+
+
 class TestReplaceUserIdsInText:
     """Tests for replace_user_ids_in_text function."""
 
@@ -282,6 +350,18 @@ class TestReplaceUserIdsInText:
         # Should keep the original format or ID
         assert "U123" in result
 
+    def test_failed_lookup_not_written_to_people_cache(self):
+        """Test that unresolved IDs never end up in people_cache."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_user_info.return_value = None
+        people_cache = {}
+
+        history = [{"ts": "1234567890.123", "user": "U404", "text": "Ping <@U404>"}]
+        result = preprocess_history(history, slack_client, people_cache)
+
+        assert "Unknown User: Ping @U404" in result
+        assert people_cache == {}
+
     def test_replace_empty_text(self):
         """Test that empty text returns empty string."""
         slack_client = Mock(spec=SlackClient)
@@ -313,6 +393,43 @@ class TestReplaceUserIdsInText:
         assert "@U456" not in result
 
 
+class TestAnnotateTimestamps:
+    """Tests for annotate_timestamps function."""
+
+    def test_parses_each_ts_once(self):
+        """Test that valid timestamps are stored as floats and invalid ones as None."""
+        history = [{"ts": "1673784000.5"}, {"ts": "invalid"}, {"text": "no ts"}]
+
+        result = annotate_timestamps(history)
+
+        assert result is history
+        assert [m[TS_FLOAT_KEY] for m in history] == [1673784000.5, None, None]
+
+    def test_downstream_helpers_use_annotation(self):
+        """Test that grouping and filtering read the annotated value."""
+        base_ts = datetime(2023, 1, 15, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+        history = annotate_timestamps(
+            [{"ts": str(base_ts + 60), "text": "Later"}, {"ts": str(base_ts), "text": "Earlier"}]
+        )
+
+        with patch("src.message_processing._parse_ts") as mock_parse:
+            groups = group_messages_by_date(history)
+            filtered, error = filter_messages_by_date_range(history, str(base_ts + 30), None)
+
+        mock_parse.assert_not_called()
+        assert [m["text"] for m in groups["20230115"]] == ["Earlier", "Later"]
+        assert error is None
+        assert [m["text"] for m in filtered] == ["Later"]
+
+    def test_latest_message_timestamp(self):
+        """Test that the newest ts is found in annotated and raw histories, skipping bad values."""
+        history = [{"ts": "1673784000.5"}, {"ts": "invalid"}, {"ts": "1673784060.0"}, {}]
+
+        assert latest_message_timestamp(history) == 1673784060.0
+        assert latest_message_timestamp(annotate_timestamps(history)) == 1673784060.0
+        assert latest_message_timestamp([]) == 0.0
+
+
 class TestGroupMessagesByDate:
     """Tests for group_messages_by_date function."""
 
@@ -421,6 +538,30 @@ class TestGroupMessagesByDate:
         assert "20230101" in result
 
 
+class TestIterMessagesByDate:
+    """Tests for iter_messages_by_date function."""
+
+    def test_matches_group_messages_by_date(self):
+        """Test that streamed days equal the dict grouping, in date order."""
+        day1 = datetime(2023, 1, 15, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+        day2 = datetime(2023, 1, 16, 8, 0, 0, tzinfo=timezone.utc).timestamp()
+        history = [
+            {"ts": str(day2), "text": "Day two"},
+            {"ts": str(day1 + 60), "text": "Later"},
+            {"ts": "invalid", "text": "Skipped"},
+            {"ts": str(day1), "text": "Earlier"},
+        ]
+
+        days = list(iter_messages_by_date(history))
+
+        assert [date_key for date_key, _ in days] == ["20230115", "20230116"]
+        assert dict(days) == group_messages_by_date(history)
+        assert [m["text"] for m in days[0][1]] == ["Earlier", "Later"]
+
+    def test_empty_history(self):
+        assert list(iter_messages_by_date([])) == []
+
+
 class TestGetConversationDisplayName:
     """Tests for get_conversation_display_name function."""
 
@@ -451,6 +592,28 @@ class TestGetConversationDisplayName:
         result = get_conversation_display_name(channel_info, slack_client)
         assert result == "John Doe"
 
+    def test_dm_uses_people_cache(self):
+        slack_client = Mock(spec=SlackClient)
+        people_cache = {"U123": "Cached Name"}
+
+        channel_info = {"id": "D123456", "is_im": True, "user": "U123"}
+
+        result = get_conversation_display_name(channel_info, slack_client, people_cache)
+        assert result == "Cached Name"
+        slack_client.get_user_info.assert_not_called()
+
+    def test_group_dm_fills_people_cache(self):
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_user_info.return_value = {"slackId": "U456", "displayName": "Bob"}
+        people_cache = {"U123": "Alice"}
+
+        channel_info = {"id": "G123456", "is_mpim": True, "members": ["U123", "U456"]}
+
+        result = get_conversation_display_name(channel_info, slack_client, people_cache)
+        assert result == "Alice, Bob"
+        slack_client.get_user_info.assert_called_once_with("U456")
+        assert people_cache["U456"] == "Bob"
+
     def test_dm_without_user_info(self):
         slack_client = Mock(spec=SlackClient)
         slack_client.get_user_info.return_value = None
@@ -852,6 +1015,65 @@ class TestShouldShareWithMember:
         result = _should_share_with_member("U123", user_info, share_members)
         assert result is True  # Should match U123
 
+    def test_accepts_normalized_share_members_set(self):
+        """Test that a pre-normalized frozenset matches like the raw list."""
+        user_info = {
+            "slackId": "U123",
+            "email": "user@example.com",
+            "displayName": "Test User",
+        }
+        share_members_set = _normalize_share_members(["  USER@example.com  ", "U999"])
+        assert share_members_set == frozenset({"user@example.com", "u999"})
+        assert _should_share_with_member("U123", user_info, share_members_set) is True
+        assert _should_share_with_member("U456", {"slackId": "U456"}, share_members_set) is False
+
+    def test_blank_only_share_members_match_nobody(self):
+        """Test that a shareMembers list of only blanks shares with nobody, not everyone."""
+        user_info = {
+            "slackId": "U123",
+            "email": "user@example.com",
+            "displayName": "Test User",
+        }
+        for share_members in ([""], ["  "]):
+            share_members_set = _normalize_share_members(share_members)
+            assert share_members_set == frozenset()
+            assert _should_share_with_member("U123", user_info, share_members_set) is False
+            assert _should_share_with_member("U123", user_info, share_members) is False
+        assert _normalize_share_members([]) is None
+        assert _normalize_share_members(None) is None
+
+
+class TestBuildMetadataHeader:
+    """Tests for build_metadata_header function."""
+
+    def test_chunk_header(self):
+        header = build_metadata_header(
+            "general",
+            "C123",
+            "2024-01-01 00:00:00 UTC",
+            5,
+            date_range="2024-01-01 to 2024-01-31",
+            chunk=(1, 3),
+        )
+        assert header == (
+            "Slack Conversation Export\n"
+            "Channel: general\n"
+            "Channel ID: C123\n"
+            "Export Date: 2024-01-01 00:00:00 UTC\n"
+            "Date Range: 2024-01-01 to 2024-01-31\n"
+            "Total Messages: 5\n"
+            "Chunk: 1 of 3\n"
+            "\n" + "=" * 80 + "\n\n"
+        )
+
+    def test_browser_daily_header(self):
+        header = build_metadata_header(
+            "dm-name", None, "2024-01-01 00:00:00 UTC", 2, date_display="2024-01-01"
+        )
+        assert "Channel ID: [Browser Export - No ID]\n" in header
+        assert "Date: 2024-01-01\nTotal Messages: 2\n" in header
+        assert "Chunk:" not in header
+
 
 class TestEstimateFileSize:
     """Tests for estimate_file_size function."""
@@ -1059,6 +1281,13 @@ class TestFilterMessagesByDateRange:
         assert error is None
         assert len(filtered) == 2
 
+    def test_filter_no_timestamps_skips_range_pass(self):
+        """Test that no date filter returns the input list untouched, even with bad timestamps."""
+        messages = [{"ts": "not-a-timestamp", "text": "Message 1"}]
+        filtered, error = filter_messages_by_date_range(messages, None, None)
+        assert error is None
+        assert filtered is messages
+
     def test_filter_by_oldest_timestamp(self):
         """Test filtering by oldest timestamp."""
         messages = [
@@ -1187,8 +1416,8 @@ class TestGetConversationMembers:
     def test_get_dm_members_from_api(self):
         """Test getting DM member via API when user field missing."""
         slack_client = Mock(spec=SlackClient)
-        slack_client.client = Mock()
-        slack_client.client.conversations_info.return_value = {
+        slack_client.lookup_client = Mock()
+        slack_client.lookup_client.conversations_info.return_value = {
             "ok": True,
             "channel": {"user": "U123"},
         }
@@ -1197,7 +1426,7 @@ class TestGetConversationMembers:
         members = _get_conversation_members(slack_client, "D123456", conversation_info)
 
         assert members == ["U123"]
-        slack_client.client.conversations_info.assert_called_once_with(channel="D123456")
+        slack_client.lookup_client.conversations_info.assert_called_once_with(channel="D123456")
 
     def test_get_group_dm_members(self):
         """Test getting members for a group DM."""
@@ -1213,8 +1442,8 @@ class TestGetConversationMembers:
     def test_get_dm_members_api_failure(self):
         """Test handling API failure when getting DM member."""
         slack_client = Mock(spec=SlackClient)
-        slack_client.client = Mock()
-        slack_client.client.conversations_info.side_effect = Exception("API Error")
+        slack_client.lookup_client = Mock()
+        slack_client.lookup_client.conversations_info.side_effect = Exception("API Error")
 
         conversation_info = {"is_im": True}  # No user field
         members = _get_conversation_members(slack_client, "D123456", conversation_info)
@@ -1224,8 +1453,8 @@ class TestGetConversationMembers:
     def test_get_dm_members_fallback_to_conversation_name(self):
         """Test fallback to extracting members from conversation name when API fails."""
         slack_client = Mock(spec=SlackClient)
-        slack_client.client = Mock()
-        slack_client.client.conversations_info.return_value = {"ok": False}  # API fails
+        slack_client.lookup_client = Mock()
+        slack_client.lookup_client.conversations_info.return_value = {"ok": False}  # API fails
         
         # Mock _resolve_member_identifier to return user info
         with patch('src.drive_upload._resolve_member_identifier') as mock_resolve:
@@ -1491,3 +1720,361 @@ class TestGetOldestTimestampForExport:
         # Should use the later of the two (explicit date)
         assert result is not None
         assert float(result) >= 1729263032.0
+
+
+class TestPersistedPeopleCache:
+    """Tests for the on-disk people cache used across runs."""
+
+    def test_save_writes_only_new_users(self, tmp_path, monkeypatch):
+        """Test that only names resolved during the run are persisted."""
+        cache_file = tmp_path / "people_cache.json"
+        monkeypatch.setattr("src.drive_upload.PEOPLE_CACHE_FILE", str(cache_file))
+
+        assert save_people_cache({"U1": "Alice"}, {"U1"}) is False
+        assert not cache_file.exists()
+
+        assert save_people_cache({"U1": "Alice", "U2": "Bob"}, {"U1"}) is True
+        data = json.loads(cache_file.read_text())
+        assert set(data) == {"U2"}
+        assert data["U2"]["name"] == "Bob"
+
+    def test_load_merges_unexpired_entries(self, tmp_path, monkeypatch):
+        """Test that unexpired disk entries are merged and people.json wins."""
+        cache_file = tmp_path / "people_cache.json"
+        monkeypatch.setattr("src.drive_upload.PEOPLE_CACHE_FILE", str(cache_file))
+        now = 1_700_000_000.0
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "U1": {"name": "Stale Alice", "ts": now},
+                    "U2": {"name": "Bob", "ts": now},
+                    "U3": {"name": "Expired", "ts": now - 30 * 86400},
+                }
+            )
+        )
+        people_json = {"people": [{"slackId": "U1", "displayName": "Alice"}]}
+
+        def fake_load_json_file(path):
+            if path == "config/people.json":
+                return people_json
+            return json.loads(cache_file.read_text())
+
+        with patch("src.drive_upload.load_json_file", side_effect=fake_load_json_file), patch(
+            "src.drive_upload.time.time", return_value=now
+        ):
+            people_cache, _, _, _ = load_people_cache()
+
+        assert people_cache == {"U1": "Alice", "U2": "Bob"}
+
+    def test_emails_round_trip_for_user_cache_seeding(self, tmp_path, monkeypatch):
+        """Test that emails are saved with new names and loaded back as user info."""
+        cache_file = tmp_path / "people_cache.json"
+        monkeypatch.setattr("src.drive_upload.PEOPLE_CACHE_FILE", str(cache_file))
+        user_info = {
+            "U1": {"slackId": "U1", "email": "alice@example.com", "displayName": "Alice"},
+            "U2": None,
+        }
+
+        assert save_people_cache({"U1": "Alice", "U2": "Bob"}, set(), user_info) is True
+        data = json.loads(cache_file.read_text())
+        assert data["U1"]["email"] == "alice@example.com"
+        assert "email" not in data["U2"]
+
+        # Only entries with an email can stand in for a users.info result
+        assert load_persisted_users() == {
+            "U1": {"slackId": "U1", "email": "alice@example.com", "displayName": "Alice"}
+        }
+
+
+class TestShareFolderWithConversationMembers:
+    """Tests for share_folder_with_conversation_members function."""
+
+    def test_members_resolved_once_for_revoke_and_share(self):
+        """Test that each member is looked up once and shared with, stale access is revoked."""
+        google_drive_client = Mock()
+        google_drive_client.get_folder_permissions.return_value = [
+            {"id": "p1", "type": "user", "role": "reader", "emailAddress": "former@example.com"},
+            {"id": "p2", "type": "user", "role": "owner", "emailAddress": "owner@example.com"},
+            {"id": "p3", "type": "user", "role": "reader", "emailAddress": "u3@example.com"},
+        ]
+        google_drive_client.share_folder_batch.side_effect = lambda folder_id, shares: {
+            email: True for email in shares
+        }
+        google_drive_client.revoke_permissions_batch.side_effect = (
+            lambda folder_id, permission_ids: {email: True for email in permission_ids}
+        )
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_channel_members.return_value = ["U1", "U2", "U3"]
+        slack_client.get_user_info.side_effect = lambda user_id: {
+            "slackId": user_id,
+            "email": f"{user_id.lower()}@example.com",
+            "displayName": user_id,
+        }
+        stats = initialize_stats()
+
+        share_folder_with_conversation_members(
+            google_drive_client=google_drive_client,
+            folder_id="folder123",
+            slack_client=slack_client,
+            conversation_id="C123",
+            conversation_name="general",
+            conversation_info={},
+            no_notifications_set={"u2@example.com"},
+            no_share_set=set(),
+            stats=stats,
+        )
+
+        # Uncached members are looked up in one concurrent batch before the per-member pass
+        slack_client.get_users_info_bulk.assert_called_once()
+        assert list(slack_client.get_users_info_bulk.call_args.args[0]) == ["U1", "U2", "U3"]
+        assert slack_client.get_user_info.call_count == 3
+        google_drive_client.revoke_permissions_batch.assert_called_once_with(
+            "folder123", {"former@example.com": "p1"}
+        )
+        # Members who already have access are not re-shared
+        google_drive_client.share_folder_batch.assert_called_once_with(
+            "folder123", {"u1@example.com": True, "u2@example.com": False}
+        )
+        google_drive_client.share_folder.assert_not_called()
+        assert stats["shared"] == 3
+
+
+class TestUploadMessagesToDrive:
+    """Tests for upload_messages_to_drive function."""
+
+    def test_daily_docs_uploaded_with_aggregated_stats(self):
+        """Test that each day gets one doc, headers only for new docs, and stats are merged."""
+        google_drive_client = Mock()
+        google_drive_client.create_folder.return_value = "folder123"
+        google_drive_client.list_google_doc_names.return_value = {
+            "general slack messages 20240101"
+        }
+        google_drive_client.create_or_update_google_doc.return_value = "doc123"
+        messages = [
+            {"ts": "1704103200.000000", "user": "U1", "text": "day one"},  # 2024-01-01
+            {"ts": "1704189600.000000", "user": "U1", "text": "day two"},  # 2024-01-02
+            {"ts": "1704276000.000000", "user": "U1", "text": "day three"},  # 2024-01-03
+        ]
+
+        stats = upload_messages_to_drive(
+            messages=messages,
+            conversation_name="general",
+            conversation_id="C123",
+            google_drive_client=google_drive_client,
+            google_drive_folder_id="parent123",
+            slack_client=None,
+            people_cache=None,
+            use_display_names=True,
+        )
+
+        assert stats["uploaded"] == 3
+        assert stats["processed"] == 3
+        assert stats["total_messages"] == 3
+        assert stats["upload_failed"] == 0
+        google_drive_client.list_google_doc_names.assert_called_once_with("folder123")
+        google_drive_client.files.assert_not_called()
+
+        contents = {
+            call.args[0]: call.args[1]
+            for call in google_drive_client.create_or_update_google_doc.call_args_list
+        }
+        assert set(contents) == {
+            "general slack messages 20240101",
+            "general slack messages 20240102",
+            "general slack messages 20240103",
+        }
+        # Existing doc is appended to without a metadata header
+        assert "day one" in contents["general slack messages 20240101"]
+        assert "Channel ID: C123" not in contents["general slack messages 20240101"]
+        assert "Channel ID: C123" in contents["general slack messages 20240102"]
+        assert "Date: 2024-01-02" in contents["general slack messages 20240102"]
+        export_dates = {
+            line
+            for name in ("general slack messages 20240102", "general slack messages 20240103")
+            for line in contents[name].splitlines()
+            if line.startswith("Export Date:")
+        }
+        assert len(export_dates) == 1  # Formatted once per upload
+        # Docs missing from the folder listing skip the per-doc existence query
+        known_new = {
+            call.args[0]: call.kwargs["known_new"]
+            for call in google_drive_client.create_or_update_google_doc.call_args_list
+        }
+        assert known_new == {
+            "general slack messages 20240101": False,
+            "general slack messages 20240102": True,
+            "general slack messages 20240103": True,
+        }
+
+    def test_metadata_records_newest_message_for_unsorted_input(self):
+        """Test that the saved export timestamp is the newest message, whatever the input order."""
+        google_drive_client = Mock()
+        google_drive_client.create_folder.return_value = "folder123"
+        google_drive_client.list_google_doc_names.return_value = set()
+        google_drive_client.create_or_update_google_doc.return_value = "doc123"
+        messages = [
+            {"ts": "1704189600.000000", "user": "U1", "text": "day two"},
+            {"ts": "1704276000.000000", "user": "U1", "text": "day three"},
+            {"ts": "1704103200.000000", "user": "U1", "text": "day one"},
+        ]
+
+        upload_messages_to_drive(
+            messages=messages,
+            conversation_name="general",
+            conversation_id="C123",
+            google_drive_client=google_drive_client,
+            google_drive_folder_id="parent123",
+            slack_client=None,
+            people_cache=None,
+            use_display_names=True,
+        )
+
+        google_drive_client.save_export_metadata.assert_called_once_with(
+            "folder123", "general", "1704276000.0"
+        )
+
+
+class TestFetchConversationHistory:
+    """Tests for _fetch_conversation_history function."""
+
+    def test_orphan_thread_replies_pull_in_full_thread(self):
+        """Test that replies to threads started before the window fetch the whole thread."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.fetch_channel_history.return_value = [
+            {"ts": "1704103300.000000", "thread_ts": "1704103200.000000", "text": "reply"},
+            {"ts": "1704103400.000000", "text": "top level"},
+        ]
+        slack_client.fetch_thread_history.return_value = [
+            {"ts": "1704103200.000000", "thread_ts": "1704103200.000000", "text": "root"},
+            {"ts": "1704103300.000000", "thread_ts": "1704103200.000000", "text": "reply"},
+        ]
+
+        history = _fetch_conversation_history(slack_client, "C123", "1704100000", None)
+
+        slack_client.fetch_thread_history.assert_called_once_with("C123", "1704103200.000000")
+        assert [msg["text"] for msg in history] == ["root", "reply", "top level"]
+
+    def test_api_error_returns_none(self):
+        """Test that a failed history fetch is reported as None."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.fetch_channel_history.return_value = None
+
+        assert _fetch_conversation_history(slack_client, "C123", None, None) is None
+        slack_client.fetch_thread_history.assert_not_called()
+
+
+class TestIterPrefetchedHistories:
+    """Tests for _iter_prefetched_histories function."""
+
+    def test_yields_jobs_in_order_with_their_histories(self):
+        """Test that every job is paired with its own history, including failures."""
+        histories = {
+            "C1": [{"ts": "1704103200.000000", "text": "one"}],
+            "C2": None,
+            "C3": [{"ts": "1704103300.000000", "text": "three"}],
+        }
+        slack_client = Mock(spec=SlackClient)
+        slack_client.fetch_channel_history.side_effect = (
+            lambda channel_id, oldest_ts=None, latest_ts=None: histories[channel_id]
+        )
+        jobs = [
+            {"channel_id": channel_id, "oldest_ts": None, "latest_ts": None}
+            for channel_id in ("C1", "C2", "C3")
+        ]
+
+        with patch("src.main.CONVERSATION_DELAY_SECONDS", 0):
+            results = list(_iter_prefetched_histories(slack_client, jobs))
+
+        assert [job["channel_id"] for job, _ in results] == ["C1", "C2", "C3"]
+        assert results[0][1][0]["text"] == "one"
+        assert results[1][1] is None
+        assert results[2][1][0]["text"] == "three"
+
+    def test_concurrent_prefetch_keeps_order(self):
+        """Test that several fetches in flight still yield jobs in export order."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.fetch_channel_history.side_effect = (
+            lambda channel_id, oldest_ts=None, latest_ts=None: [
+                {"ts": "1704103200.000000", "text": channel_id}
+            ]
+        )
+        channel_ids = [f"C{i}" for i in range(5)]
+        jobs = [
+            {"channel_id": channel_id, "oldest_ts": None, "latest_ts": None}
+            for channel_id in channel_ids
+        ]
+
+        with patch("src.main.CONVERSATION_DELAY_SECONDS", 0):
+            results = list(_iter_prefetched_histories(slack_client, jobs, max_workers=3))
+
+        assert [job["channel_id"] for job, _ in results] == channel_ids
+        assert [history[0]["text"] for _, history in results] == channel_ids
+        assert slack_client.fetch_channel_history.call_count == 5
+
+    def test_no_jobs(self):
+        """Test that an empty job list yields nothing and fetches nothing."""
+        slack_client = Mock(spec=SlackClient)
+
+        assert list(_iter_prefetched_histories(slack_client, [])) == []
+        slack_client.fetch_channel_history.assert_not_called()
+
+
+class TestGetAllChannelsCached:
+    """Tests for _get_all_channels_cached function."""
+
+    def test_fetches_and_writes_cache_then_reuses_it(self):
+        """Test that a fresh cache file short-circuits the Slack API."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_all_channels.return_value = [{"id": "C123", "name": "general"}]
+
+        first = _get_all_channels_cached(slack_client)
+        second = _get_all_channels_cached(slack_client)
+
+        assert first == second == [{"id": "C123", "name": "general"}]
+        slack_client.get_all_channels.assert_called_once()
+
+    def test_stale_cache_is_refetched(self):
+        """Test that a cache older than the TTL triggers a new fetch."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.get_all_channels.return_value = [{"id": "C123", "name": "general"}]
+        _get_all_channels_cached(slack_client)
+
+        with patch("src.main.CHANNELS_CACHE_TTL_SECONDS", 0):
+            _get_all_channels_cached(slack_client)
+
+        assert slack_client.get_all_channels.call_count == 2
+
+
+class TestMakeRefFiles:
+    """Tests for the --make-ref-files branch of main."""
+
+    def test_users_missing_from_list_are_resolved_in_bulk(self):
+        """Test that members not returned by users.list are fetched with one bulk call."""
+        slack_client = Mock(spec=SlackClient)
+        slack_client.list_all_users.return_value = {"U1": {"slackId": "U1", "displayName": "One"}}
+        slack_client.get_members_for_channels.return_value = {
+            "C1": ["U1", "U2"],
+            "C2": ["U2", "U3"],
+        }
+        slack_client.get_users_info_bulk.return_value = {
+            "U2": {"slackId": "U2", "displayName": "Two"},
+            "U3": None,
+        }
+        args = Mock(
+            make_ref_files=True,
+            export_history=False,
+            upload_to_drive=False,
+            browser_export_dm=False,
+            setup_drive_auth=False,
+        )
+
+        with patch("src.main._validate_and_setup_environment", return_value=(slack_client, Mock(), None)), \
+             patch("src.main._get_all_channels_cached", return_value=[{"id": "C1"}, {"id": "C2"}]), \
+             patch("src.main.load_json_file", return_value=None), \
+             patch("src.main.save_json_file") as mock_save:
+            main(args)
+
+        slack_client.get_users_info_bulk.assert_called_once_with(["U2", "U3"])
+        slack_client.get_user_info.assert_not_called()
+        people_file = mock_save.call_args_list[1].args[0]
+        assert [person["slackId"] for person in people_file["people"]] == ["U1", "U2"]
@@ -1,11 +1,11 @@
 import argparse
 from unittest.mock import MagicMock, patch, ANY
 import pytest
-from src.main import main
+from src.main import EXPORT_WRITE_BUFFER_SIZE, main
 
 class TestMainApiThreads:
     @patch('src.main.SlackClient')
-    @patch('src.main.GoogleDriveClient')
+    @patch('src.google_drive.GoogleDriveClient')
     @patch('src.main.load_json_file')
     @patch('src.drive_upload.load_json_file')
     @patch('src.drive_upload.load_people_cache')
@@ -63,13 +63,16 @@ class TestMainApiThreads:
             start_date="2025-01-01",
             end_date="2025-01-02",
             bulk_export=False,
+            compress_output=False,
             browser_export_dm=False
         )
 
         # Run main
         with patch('src.main.os.path.exists', return_value=True), \
              patch('src.main.open', new_callable=MagicMock) as mock_open, \
-             patch('src.main.os.fsync'), \
+             patch('src.main.os.fsync') as mock_fsync, \
+             patch('src.main.durable_writes_enabled', return_value=False), \
+             patch('src.main.fsync_directory') as mock_fsync_directory, \
              patch('src.main.os.path.getsize', return_value=100):
              
             main(args)
@@ -90,6 +93,62 @@ class TestMainApiThreads:
         for call in file_handle.write.mock_calls:
             if call.args:
                 written_content += call.args[0]
+        for call in file_handle.writelines.mock_calls:
+            if call.args:
+                written_content += "".join(call.args[0])
         
         assert "Root message" in written_content
         assert "Reply without root" in written_content
+
+        # Streamed export lines go through a large write buffer
+        assert mock_open.call_args.kwargs["buffering"] == EXPORT_WRITE_BUFFER_SIZE
+
+        # Without SLACKFEEDER_DURABLE, files are not fsynced one by one; the output
+        # directory is synced once at the end of the run instead
+        mock_fsync.assert_not_called()
+        mock_fsync_directory.assert_called_once_with("/tmp/fake_output")
+
+    @patch('src.main.load_json_file')
+    @patch('src.main.logger')
+    @patch('src.main._validate_and_setup_environment')
+    @patch('src.main._setup_output_directory')
+    def test_invalid_end_date_stops_before_channel_loop(
+        self,
+        mock_setup_output,
+        mock_validate_env,
+        mock_logger,
+        mock_load_json,
+    ):
+        mock_slack_client = MagicMock()
+        mock_validate_env.return_value = (mock_slack_client, MagicMock(), "folder_id")
+        mock_load_json.return_value = {
+            "channels": [
+                {"id": "C1234567890", "name": "one", "export": True},
+                {"id": "C2234567890", "name": "two", "export": True},
+            ]
+        }
+
+        args = argparse.Namespace(
+            make_ref_files=False,
+            export_history=True,
+            upload_to_drive=False,
+            setup_drive_auth=False,
+            start_date="2025-01-01",
+            end_date="not-a-date",
+            bulk_export=False,
+            compress_output=False,
+            browser_export_dm=False
+        )
+
+        with patch('src.main.load_people_cache') as mock_load_people_cache:
+            main(args)
+
+        # The bad date is reported once, before any per-conversation work
+        error_calls = [
+            call for call in mock_logger.error.call_args_list
+            if "Invalid end date format" in call.args[0]
+        ]
+        assert len(error_calls) == 1
+        mock_load_people_cache.assert_not_called()
+        mock_setup_output.assert_not_called()
+        mock_slack_client.fetch_channel_history.assert_not_called()
@@ -8,13 +8,20 @@ import json
 import os
 import tempfile
 from datetime import datetime, timezone
+from unittest.mock import Mock
 
 import pytest
 
 from src.utils import (
+    _format_epoch_seconds,
+    _validate_email_cached,
     convert_date_to_timestamp,
+    dumps_json_bytes,
+    durable_writes_enabled,
     format_timestamp,
+    fsync_directory,
     load_json_file,
+    loads_json_bytes,
     sanitize_filename,
     sanitize_folder_name,
     save_json_file,
@@ -58,6 +65,12 @@ class TestSanitizeFilename:
         assert len(result) == 200
         assert result == "a" * 200
 
+    def test_results_are_cached(self):
+        sanitize_filename.cache_clear()
+        sanitize_filename("channel-name")
+        sanitize_filename("channel-name")
+        assert sanitize_filename.cache_info().hits == 1
+
 
 class TestSanitizeFolderName:
     """Tests for sanitize_folder_name function."""
@@ -161,6 +174,15 @@ class TestValidateEmail:
     def test_empty_string(self):
         assert validate_email("") is False
 
+    def test_non_string_is_rejected_without_caching(self):
+        assert validate_email(["user@example.com"]) is False
+
+    def test_repeated_validation_is_cached(self):
+        _validate_email_cached.cache_clear()
+        assert validate_email("user@example.com") is True
+        assert validate_email("user@example.com") is True
+        assert _validate_email_cached.cache_info().hits == 1
+
     def test_with_whitespace(self):
         assert validate_email(" user@example.com ") is True
         assert validate_email("user@example.com ") is True
@@ -279,6 +301,13 @@ class TestFormatTimestamp:
         result = format_timestamp(None)
         assert result is None
 
+    def test_same_second_is_cached(self):
+        _format_epoch_seconds.cache_clear()
+        first = format_timestamp("1704067200.123456")
+        second = format_timestamp("1704067200.987654")
+        assert first == second == "2024-01-01 00:00:00 UTC"
+        assert _format_epoch_seconds.cache_info().hits == 1
+
 
 class TestConvertDateToTimestamp:
     """Tests for convert_date_to_timestamp function."""
@@ -320,6 +349,13 @@ class TestConvertDateToTimestamp:
         assert convert_date_to_timestamp("") is None
         assert convert_date_to_timestamp("   ") is None
 
+    def test_repeated_conversion_is_cached(self):
+        convert_date_to_timestamp.cache_clear()
+        first = convert_date_to_timestamp("2024-02-01", is_end_date=True)
+        second = convert_date_to_timestamp("2024-02-01", is_end_date=True)
+        assert first == second
+        assert convert_date_to_timestamp.cache_info().hits == 1
+
 
 class TestLoadJsonFile:
     """Tests for load_json_file function."""
@@ -350,6 +386,16 @@ class TestLoadJsonFile:
         finally:
             os.unlink(temp_path)
 
+    def test_load_uses_orjson_when_available(self, tmp_path, monkeypatch):
+        json_path = tmp_path / "data.json"
+        json_path.write_text('{"name": "Zoë"}', encoding="utf-8")
+        fake_orjson = Mock(loads=Mock(side_effect=json.loads))
+        monkeypatch.setattr("src.utils.orjson", fake_orjson)
+
+        assert load_json_file(str(json_path)) == {"name": "Zoë"}
+        fake_orjson.loads.assert_called_once()
+        assert isinstance(fake_orjson.loads.call_args.args[0], bytes)
+
 
 class TestSaveJsonFile:
     """Tests for save_json_file function."""
@@ -388,3 +434,79 @@ class TestSaveJsonFile:
             # Verify can be loaded back
             loaded = load_json_file(filepath)
             assert loaded == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_matches_stdlib_formatting(self, tmp_path, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr("src.utils.orjson", None)
+        filepath = tmp_path / "test.json"
+        data = {"people": [{"displayName": "Zoë", "ids": [], "meta": {}, "nested": [1, [2]]}]}
+
+        assert save_json_file(data, str(filepath)) is True
+        assert filepath.read_text(encoding="utf-8") == json.dumps(
+            data, ensure_ascii=False, indent=4
+        )
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self, tmp_path):
+        filepath = tmp_path / "test.json"
+        data = {"big": 2**70}
+
+        assert save_json_file(data, str(filepath)) is True
+        assert json.loads(filepath.read_text(encoding="utf-8")) == data
+
+
+class TestJsonBytes:
+    """Tests for loads_json_bytes and dumps_json_bytes functions."""
+
+    def test_loads_falls_back_for_documents_orjson_rejects(self):
+        data = loads_json_bytes(b'{"value": NaN, "name": "Zo\xc3\xab"}')
+        assert data["name"] == "Zoë"
+        assert data["value"] != data["value"]  # NaN
+
+    def test_loads_invalid_json_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_json_bytes(b'{"broken": ')
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_dumps_matches_stdlib_formatting(self, monkeypatch, use_orjson, indent):
+        if not use_orjson:
+            monkeypatch.setattr("src.utils.orjson", None)
+        data = {"messages": [{"user": "Zoë", "ts": "1704103200.000000", "blocks": []}]}
+
+        assert dumps_json_bytes(data, indent=indent) == json.dumps(
+            data, ensure_ascii=False, indent=indent
+        ).encode("utf-8")
+
+    @pytest.mark.parametrize(
+        "value", [float("nan"), float("inf"), -float("inf"), 1e16, 1e-7, 2.5e-300, 0.5]
+    )
+    def test_dumps_matches_stdlib_for_floats(self, value):
+        data = {"score": value, "scores": [value], value: "key"}
+
+        assert dumps_json_bytes(data) == json.dumps(data, ensure_ascii=False, indent=4).encode(
+            "utf-8"
+        )
+
+
+class TestDurableWrites:
+    """Tests for durable_writes_enabled and fsync_directory functions."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(None, False), ("", False), ("0", False), ("1", True), ("true", True), ("YES", True)],
+    )
+    def test_durable_writes_enabled(self, monkeypatch, value, expected):
+        if value is None:
+            monkeypatch.delenv("SLACKFEEDER_DURABLE", raising=False)
+        else:
+            monkeypatch.setenv("SLACKFEEDER_DURABLE", value)
+        assert durable_writes_enabled() is expected
+
+    def test_fsync_directory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fsync_directory(temp_dir)  # Should not raise
+
+    def test_fsync_missing_directory_is_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fsync_directory(os.path.join(temp_dir, "missing"))  # Should not raise